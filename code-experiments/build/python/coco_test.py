@@ -10,6 +10,7 @@ import shutil
 import doctest
 import numpy as np
 import cocoex as ex
+import cocoex.bench, cocoex.server  # submodules which are not imported by cocoex
 from cocoex import Suite
 from cocoex.utilities import about_equal
 import example_experiment
@@ -91,6 +92,10 @@ def run_doctests():
         print("  CAVEAT: doctest OF cocoex.interface IS, FOR SOME REASON, " +
               "INEFFECTIVE IN PYTHON 2 ")
     testmod(interface)
+    testmod(ex.experiment)
+    testmod(ex.memory)
+    testmod(ex.bench)
+    testmod(ex.server)
     testmod(example_experiment)
 
 def _clean_up(start_matches, protected):
@@ -2,12 +2,15 @@
 #cython: c_string_type=str, c_string_encoding=ascii
 from __future__ import absolute_import, division, print_function, unicode_literals
 import sys
+import threading
+from collections import OrderedDict
 import numpy as np
 cimport numpy as np
+from libc.string cimport memcpy
 
 from cocoex.exceptions import InvalidProblemException, NoSuchProblemException, NoSuchSuiteException
 
-known_suite_names = [b"bbob", b"bbob-biobj"]
+known_suite_names = [b"bbob", b"bbob-biobj", b"bbob-largescale"]
 
 # _test_assignment = "seems to prevent an 'export' error (i.e. induce export) to make this module known under Linux and Windows (possibly because of the leading underscore of _interface)"
 # __all__ = ['Problem', 'Benchmark']
@@ -27,6 +30,7 @@ cdef extern from "coco.h":
     
     coco_observer_t *coco_observer(const char *observer_name, const char *options)
     void coco_observer_free(coco_observer_t *self)
+    const char *coco_observer_get_result_folder(const coco_observer_t *observer)
     coco_problem_t *coco_problem_add_observer(coco_problem_t *problem, 
                                               coco_observer_t *observer)    
 
@@ -34,15 +38,24 @@ cdef extern from "coco.h":
                              const char *suite_options)
     void coco_suite_free(coco_suite_t *suite)
     void coco_problem_free(coco_problem_t *problem)
+    coco_problem_t *coco_problem_clone(coco_problem_t *problem)
 
-    void coco_evaluate_function(coco_problem_t *problem, double *x, double *y)
+    void coco_evaluate_function(coco_problem_t *problem, const double *x, double *y) nogil
+    void coco_evaluate_function_batch(coco_problem_t *problem, const double *x,
+                                      size_t number_of_points, double *y) nogil
     void coco_evaluate_constraint(coco_problem_t *problem, const double *x, double *y)
     void coco_recommend_solutions(coco_problem_t *problem, 
                                   const double *x,
                                   size_t number_of_solutions)
                                   
     coco_problem_t* coco_suite_get_next_problem(coco_suite_t*, coco_observer_t*)
-    coco_problem_t* coco_suite_get_problem(coco_suite_t *, size_t)
+    coco_problem_t* coco_suite_get_problem(coco_suite_t *, size_t) nogil
+    long coco_suite_get_next_problem_index(coco_suite_t *suite, long problem_index)
+    char *coco_suite_get_problem_id(coco_suite_t *suite, size_t problem_index)
+    char *coco_suite_get_problem_name(coco_suite_t *suite, size_t problem_index)
+    size_t coco_suite_get_problem_dimension(coco_suite_t *suite, size_t problem_index)
+    size_t coco_suite_get_problem_number_of_objectives(coco_suite_t *suite, size_t problem_index)
+    void coco_free_memory(void *data)
 
     size_t coco_problem_get_suite_dep_index(coco_problem_t* )
     size_t coco_problem_get_dimension(coco_problem_t *problem)
@@ -53,6 +66,7 @@ cdef extern from "coco.h":
     const double *coco_problem_get_smallest_values_of_interest(coco_problem_t *problem)
     const double *coco_problem_get_largest_values_of_interest(coco_problem_t *problem)
     double coco_problem_get_final_target_fvalue1(coco_problem_t *problem)
+    double coco_problem_get_best_value1(coco_problem_t *problem)
     size_t coco_problem_get_evaluations(coco_problem_t *problem)
     double coco_problem_get_best_observed_fvalue1(coco_problem_t *problem)
 
@@ -66,11 +80,37 @@ cdef bytes _bstring(s):
 
 cdef coco_observer_t* _current_observer
 
+_construction_lock = threading.Lock()
+"""serializes constructing and freeing suites and constructing problems in C,
+which share global state, e.g. between `Suite.warm_up` and the main thread"""
+
+cdef np.ndarray _readonly_copy(const double *data, size_t size, double default):
+    """return a read-only `np.ndarray` with a copy of the `size` values of
+    `data`, made in a single call. If `data` is NULL, the array holds `size`
+    values `default` instead.
+    """
+    cdef np.ndarray[double, ndim=1, mode="c"] res = default * np.ones(size)
+    if data is not NULL and size:
+        memcpy(&res[0], data, size * sizeof(double))
+    res.flags.writeable = False
+    return res
+
+cdef class _CachedProblem:
+    """constructed and unobserved C problem kept in the cache of a `Suite`,
+    which is lent to at most one `Problem` at a time"""
+    cdef coco_problem_t* problem
+    cdef bint in_use
+    def __dealloc__(self):
+        if self.problem != NULL:
+            coco_problem_free(self.problem)
+
 cdef class Suite:
     """Suite of benchmark problems.
 
     Input arguments to `Suite` are `name: str`, `instance: str`, `options: str`,
-    and passed to the respective C code (see `coco.h`).
+    and passed to the respective C code (see `coco.h`). The optional
+    argument `cache_size: int` is the maximal number of constructed problems
+    kept for `get_problem`, see there.
 
     >>> import cocoex as co
     >>> suite = co.Suite("bbob", "", "")
@@ -139,6 +179,16 @@ cdef class Suite:
     ...         # doctest: +ELLIPSIS
     [2, 3, 5, 10, 20, 40]...
 
+    The "bbob-largescale" suite has dimensions from 40 up to 5120. Its
+    problems use permuted block-diagonal rotations, such that an evaluation
+    costs O(dimension) time and memory, also with `Problem.evaluate_batch`::
+
+    >>> suite = ex.Suite("bbob-largescale", "", "dimensions: 5120 instance_idx: 1")
+    >>> f = suite.get_problem(0)
+    >>> f.id, f.evaluate_batch(np.zeros((2, 5120))).shape
+    ('bbob-largescale_f001_i01_d5120', (2,))
+    >>> f.free()
+
     See file `example_experiment.py` for a full example use case.
 
     Details: depending on the benchmark suite and observer, only one problem can
@@ -161,10 +211,20 @@ cdef class Suite:
     cdef _names
     cdef _dimensions
     cdef _number_of_objectives
+    cdef _cache  # constructed problems by Python index, least recently used first
+    cdef _cache_lock  # guards _cache against the warm_up thread
+    cdef _warm_up_thread
+    cdef bint _warm_up_stopped
+    cdef public size_t cache_size
     cdef initialized
 
-    def __cinit__(self, suite_name, suite_instance, suite_options):
+    def __cinit__(self, suite_name, suite_instance, suite_options, cache_size=16):
         cdef np.npy_intp shape[1]  # probably completely useless
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._warm_up_thread = None
+        self._warm_up_stopped = False
+        self.cache_size = cache_size
         self._name = _bstring(suite_name)
         self._instance = _bstring(suite_instance if suite_instance is not None else "")
         self._options = _bstring(suite_options if suite_options is not None else "")
@@ -175,15 +235,19 @@ cdef class Suite:
         self._initialize()
         assert self.initialized
     cdef _initialize(self):
-        """sweeps through `suite` to collect indices and id's to operate by
+        """collects indices, id's and further problem meta data from the
+        suite definition, without constructing any problem, to operate by
         direct access in the remainder"""
         cdef np.npy_intp shape[1]  # probably completely useless
         cdef coco_suite_t* suite
-        cdef coco_problem_t* p
-        cdef bytes _old_level
+        cdef long index
+        cdef char *s
         
         if self.initialized:
             self.reset()
+        self._stop_warm_up()
+        with self._cache_lock:
+            self._cache.clear()
         self._ids = []
         self._indices = []
         self._names = []
@@ -203,24 +267,26 @@ This will crash Python, if the suite "my_name" does in fact not exist. You might
 also report back a missing name to https://github.com/numbbo/coco/issues
 """ % (self._name, str(known_suite_names), self._name))
         try:
-            suite = coco_suite(self._name, self._instance, self._options)
+            with _construction_lock:
+                suite = coco_suite(self._name, self._instance, self._options)
         except:
             raise NoSuchSuiteException("No suite with name '%s' found" % self._name)
         if suite == NULL:
             raise NoSuchSuiteException("No suite with name '%s' found" % self._name)
-        while True:
-            old_level = log_level('warning')
-            p = coco_suite_get_next_problem(suite, NULL)
-            log_level(old_level)
-            if not p:
-                break
-            self._indices.append(coco_problem_get_suite_dep_index(p))
-            self._ids.append(coco_problem_get_id(p))
-            self._names.append(coco_problem_get_name(p))
-            self._dimensions.append(coco_problem_get_dimension(p))
-            self._number_of_objectives.append(coco_problem_get_number_of_objectives(p))
-        coco_suite_free(suite)
-        self.suite = coco_suite(self._name, self._instance, self._options)
+        index = coco_suite_get_next_problem_index(suite, -1)
+        while index >= 0:
+            self._indices.append(index)
+            s = coco_suite_get_problem_id(suite, index)
+            self._ids.append(s)
+            coco_free_memory(s)
+            s = coco_suite_get_problem_name(suite, index)
+            self._names.append(s)
+            coco_free_memory(s)
+            self._dimensions.append(coco_suite_get_problem_dimension(suite, index))
+            self._number_of_objectives.append(
+                coco_suite_get_problem_number_of_objectives(suite, index))
+            index = coco_suite_get_next_problem_index(suite, index)
+        self.suite = suite
         self.initialized = True
         return self
     def reset(self):
@@ -237,7 +303,6 @@ also report back a missing name to https://github.com/numbbo/coco/issues
 
         `next_problem` serves to sweep through the `Suite` smoothly.
         """
-        cdef size_t index
         global _current_observer
         if not self.initialized:
             raise ValueError("Suite has been finalized/free'ed")
@@ -251,9 +316,7 @@ also report back a missing name to https://github.com/numbbo/coco/issues
             self.current_problem_ = None
             # self._current_index = -1  # or use reset?
         else:
-            index = self.indices[self._current_index]  # "conversion" to size_t
-            self._current_problem = coco_suite_get_problem(
-                                        self.suite, index)
+            self._current_problem = self._construct(self._current_index)
             self.current_problem_ = Problem_init(self._current_problem,
                                                 True, self._name)
             if observer:
@@ -285,7 +348,22 @@ also report back a missing name to https://github.com/numbbo/coco/issues
           might just silently die, which is e.g. a known issue of the "bbob"
           observer.
 
-        See also `ids` and `find_problem_ids`.
+        - The last `cache_size` problems constructed by `get_problem` are kept
+          unobserved, such that getting the same problem again, e.g. for a
+          restart, does not rebuild rotation matrices and the like. The
+          returned problem is a clone of the cached problem with its own
+          evaluation counter, to which `observer` is attached. A problem
+          which is lent out and not yet `free`d is constructed anew::
+
+            >>> f = suite.get_problem(0)
+            >>> _ = f(f.lower_bounds)
+            >>> f.free()
+            >>> f = suite.get_problem(0)  # taken from the cache
+            >>> f.evaluations
+            0
+            >>> f.free()
+
+        See also `ids`, `find_problem_ids` and `warm_up`.
         """
         if not self.initialized:
             raise ValueError("Suite has been finalized/free'ed")
@@ -295,19 +373,121 @@ also report back a missing name to https://github.com/numbbo/coco/issues
         except:
             index = self._ids.index(id)
         try:
-            return Problem_init(coco_suite_get_problem(self.suite, self._indices[index]),
-                                True, self._name).add_observer(observer)
+            return self._get_problem(index).add_observer(observer)
         except:
             raise NoSuchProblemException(self.name, str(id))
+    cdef _get_problem(self, index):
+        """return an unobserved `Problem` with Python index `index`, taken
+        from the cache if possible"""
+        cdef _CachedProblem cached
+        cdef Problem problem
+        if self.cache_size == 0:
+            with self._cache_lock:
+                self._cache.clear()
+            return Problem_init(self._construct(index), True, self._name)
+        cached = self._cached_problem(index)
+        if cached.in_use:
+            return Problem_init(self._construct(index), True, self._name)
+        problem = Problem_init(coco_problem_clone(cached.problem), True, self._name)
+        problem._cached = cached
+        cached.in_use = True
+        return problem
+    cdef _CachedProblem _cached_problem(self, index):
+        """return the cache entry of the problem with Python index `index`
+        as most recently used, constructed if necessary"""
+        cdef _CachedProblem cached
+        with self._cache_lock:
+            cached = self._cache.pop(index, None)
+            if cached is not None:
+                self._cache[index] = cached
+                return cached
+        with _construction_lock:
+            with self._cache_lock:  # another thread may have been faster
+                cached = self._cache.pop(index, None)
+            if cached is None:
+                cached = _CachedProblem()
+                cached.problem = self._construct_unlocked(index)
+            with self._cache_lock:
+                self._cache[index] = cached
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)  # a lent problem is kept alive by its borrower
+        return cached
+    cdef coco_problem_t* _construct(self, index) except NULL:
+        """return a new C problem with Python index `index`"""
+        with _construction_lock:
+            return self._construct_unlocked(index)
+    cdef coco_problem_t* _construct_unlocked(self, index) except NULL:
+        """return a new C problem with Python index `index`, constructed
+        without holding the GIL, `_construction_lock` must be held"""
+        cdef coco_problem_t* problem
+        cdef coco_suite_t* suite = self.suite
+        cdef size_t suite_index = self._indices[index]
+        with nogil:
+            problem = coco_suite_get_problem(suite, suite_index)
+        return problem
+
+    def warm_up(self, indices=None):
+        """construct the problems with Python indices `indices`, by default
+        all problems, in a background thread and keep them in the cache of
+        `get_problem`, such that `get_problem` returns them without delay.
+
+        The C code constructs the problems without holding the GIL, hence a
+        solver can already run on the first problem meanwhile, e.g. in a
+        batch of a large experiment. A problem requested before the thread
+        reached it is constructed right away. `cache_size` is increased to
+        ``len(indices)`` if necessary. Return the started `threading.Thread`.
+
+        >>> import cocoex as ex
+        >>> suite = ex.Suite("bbob", "", "dimensions: 40 function_idx: 1-3")
+        >>> batch = range(0, len(suite), 4)  # the problems of the first of 4 batches
+        >>> thread = suite.warm_up(batch)
+        >>> for index in batch:
+        ...     problem = suite.get_problem(index)
+        ...     # work work work using problem
+        ...     problem.free()
+        >>> thread.join()
+        >>> suite.free()
+
+        """
+        if not self.initialized:
+            raise ValueError("Suite has been finalized/free'ed")
+        indices = list(range(len(self)) if indices is None else indices)
+        self._stop_warm_up()
+        self.cache_size = max(self.cache_size, len(indices))
+        self._warm_up_stopped = False
+        self._warm_up_thread = threading.Thread(target=self._warm_up, args=(indices,))
+        self._warm_up_thread.daemon = True  # don't delay the exit of Python
+        self._warm_up_thread.start()
+        return self._warm_up_thread
+    def _warm_up(self, indices):
+        """construct the problems with Python indices `indices` into the
+        cache, the target of the `warm_up` thread"""
+        for index in indices:
+            if self._warm_up_stopped or not self.initialized:
+                break
+            self._cached_problem(index)
+    cdef _stop_warm_up(self):
+        """stop the `warm_up` thread, if any, and wait for it"""
+        self._warm_up_stopped = True
+        if self._warm_up_thread is not None:
+            if self._warm_up_thread is not threading.current_thread():
+                self._warm_up_thread.join()
+            self._warm_up_thread = None
 
     def free(self):
         """free underlying C structures"""
-        self.__dealloc__()
+        self._stop_warm_up()
+        with self._cache_lock:
+            self._cache.clear()
+        self._free_suite()
         self.suite = NULL
         self.initialized = False  # not (yet) visible from outside
-    def __dealloc__(self):
+    cdef _free_suite(self):
         if self.suite:
-            coco_suite_free(self.suite)
+            with _construction_lock:
+                coco_suite_free(self.suite)
+    def __dealloc__(self):
+        self._free_suite()
 
     def find_problem_ids(self, *id_snippets, get_problem=False, verbose=False):
         """`find_problem_ids(*id_snippets, verbose=False)`
@@ -439,9 +619,9 @@ also report back a missing name to https://github.com/numbbo/coco/issues
                 try:
                     problem = s.next_problem()
                     if problem is None:
-                        raise StopIteration
+                        return  # raising StopIteration fails with PEP 479
                 except NoSuchProblemException:
-                    raise StopIteration
+                    return
                 yield problem
         except:
             raise
@@ -518,11 +698,20 @@ cdef class Observer:
     def options(self):
         return self._options
     @property
+    def result_folder(self):
+        """folder where the data are written to, which can differ from the
+        ``result_folder`` option when this folder existed already.
+        """
+        if self._observer is NULL:
+            return None
+        return coco_observer_get_result_folder(self._observer)
+    @property
     def state(self):
         return self._state
 
     def free(self):
-        self.__dealloc__()
+        if self._observer != NULL:
+            coco_observer_free(self._observer)
         self._observer = NULL
         self._state = 'deactivated'
     def __dealloc__(self):
@@ -556,7 +745,9 @@ cdef class Problem:
     cdef size_t _number_of_constraints
     cdef _suite_name  # for the record
     cdef _list_of_observers  # for the record
+    cdef list _loggers  # Python loggers of observers like `MemoryObserver`, called after each evaluation
     cdef _problem_index  # for the record, this is not public but used in index property
+    cdef _CachedProblem _cached  # cache entry of the suite this problem is cloned from, if any
     cdef _do_free
     cdef initialized
     def __cinit__(self):
@@ -572,6 +763,7 @@ cdef class Problem:
         self._problem_index = coco_problem_get_suite_dep_index(self.problem)
         self._do_free = free
         self._list_of_observers = []
+        self._loggers = []
         # _problem_suite = _bstring(problem_suite)
         # self.problem_suite = _problem_suite
         # Implicit type conversion via passing safe, 
@@ -580,16 +772,13 @@ cdef class Problem:
         self._number_of_objectives = coco_problem_get_number_of_objectives(self.problem)
         self._number_of_constraints = coco_problem_get_number_of_constraints(self.problem)
         self.y = np.zeros(self._number_of_objectives)
-        ## FIXME: Inefficient because we copy the bounds instead of
-        ## sharing the data.
-        self._lower_bounds = -np.inf * np.ones(self._number_of_variables)
-        self._upper_bounds = np.inf * np.ones(self._number_of_variables)
-        # self.test_bounds = coco_problem_get_smallest_values_of_interest(self.problem)  # fails
-        for i in range(self._number_of_variables):
-            if coco_problem_get_smallest_values_of_interest(self.problem) is not NULL:
-                self._lower_bounds[i] = coco_problem_get_smallest_values_of_interest(self.problem)[i]
-            if coco_problem_get_largest_values_of_interest(self.problem) is not NULL:
-                self._upper_bounds[i] = coco_problem_get_largest_values_of_interest(self.problem)[i]
+        # copied once, as the C data are released in `free`
+        self._lower_bounds = _readonly_copy(
+            coco_problem_get_smallest_values_of_interest(self.problem),
+            self._number_of_variables, -np.inf)
+        self._upper_bounds = _readonly_copy(
+            coco_problem_get_largest_values_of_interest(self.problem),
+            self._number_of_variables, np.inf)
         self.initialized = True
         return self
     def constraint(self, x):
@@ -635,12 +824,19 @@ cdef class Problem:
     def add_observer(self, observer):
         """`add_observer(self, observer: Observer)`, see also `Observer`.
         
-        `observer` can be `None`, in which case nothing is done. 
+        `observer` can be `None`, in which case nothing is done. An
+        `observer` which is not an `Observer`, like a `MemoryObserver`,
+        records the data in Python.
         """
         if observer:
             assert self.problem
-            observer._update_current_observer_global()
-            self.problem = coco_problem_add_observer(self.problem, _current_observer)
+            if isinstance(observer, Observer):
+                observer._update_current_observer_global()
+                self.problem = coco_problem_add_observer(self.problem, _current_observer)
+            else:
+                self._loggers.append(observer._logger(
+                    self.id, self._number_of_variables,
+                    coco_problem_get_best_value1(self.problem)))
             self._list_of_observers.append(observer)
         return self
 
@@ -671,11 +867,16 @@ cdef class Problem:
     @property
     def lower_bounds(self):
         """depending on the test bed, these are not necessarily strict bounds
+
+        The returned array is read-only and remains valid after `free`. Use
+        ``np.array(problem.lower_bounds)`` to get a modifiable copy.
         """
         return self._lower_bounds
     @property
     def upper_bounds(self):
         """depending on the test bed, these are not necessarily strict bounds
+
+        Like `lower_bounds`, a read-only array.
         """
         return self._upper_bounds
     @property
@@ -702,6 +903,10 @@ cdef class Problem:
         if self.problem != NULL and (self._do_free or force):
             coco_problem_free(self.problem)
             self.problem = NULL
+            self._finalize_loggers()
+            if self._cached is not None:
+                self._cached.in_use = False  # give back to the cache
+                self._cached = None
 
     def __dealloc__(self):
         # see http://docs.cython.org/src/userguide/special_methods.html
@@ -709,25 +914,136 @@ cdef class Problem:
         # the possibility to set _do_free = False
         if self._do_free and self.problem != NULL:  # this is not guaranteed to work, see above link
             coco_problem_free(self.problem)
+            self._finalize_loggers()
+            if self._cached is not None:
+                self._cached.in_use = False
+
+    cdef _finalize_loggers(self):
+        """finalize the Python loggers, like the C loggers are finalized in
+        `coco_problem_free`"""
+        for logger in self._loggers:
+            logger.finalize()
+        self._loggers = []
 
     # def __call__(self, np.ndarray[double, ndim=1, mode="c"] x):
-    def __call__(self, x):
-        """return objective function value of input `x`"""
-        cdef np.ndarray[double, ndim=1, mode="c"] _x
+    def __call__(self, x, out=None):
+        """return objective function value of input `x`.
+
+        A C-contiguous `float64` buffer `x`, like a 1-D `np.ndarray` of
+        `dtype` `double`, is passed to the C code without any copy, any other
+        array-like is converted first.
+
+        If `out` is given, it must be a writable C-contiguous `float64` buffer
+        of size `number_of_objectives`. The objective vector is then written
+        to `out`, which is returned, such that no memory is allocated::
+
+        >>> import numpy as np
+        >>> import cocoex as ex
+        >>> f = ex.Suite("bbob-biobj", "", "").get_problem(0)
+        >>> y = np.zeros(f.number_of_objectives)
+        >>> assert f(f.lower_bounds, out=y) is y
+        >>> assert all(y == f(f.lower_bounds))
+        >>> f.free()
+
+        The GIL is released during the evaluation, such that different
+        problem instances can be evaluated concurrently from several
+        threads. In the multi-objective case without `out`, a new array is
+        returned on each call.
+        """
+        cdef const double[::1] _x
+        cdef double[::1] _y
+        cdef coco_problem_t* problem = self.problem
+        cdef const double *xp
+        cdef double *yp
+        cdef double f
         assert self.initialized
-        x = np.array(x, copy=False, dtype=np.double, order='C')
-        if np.size(x) != self.number_of_variables:
+        try:
+            _x = x  # zero-copy for C-contiguous double buffers
+        except (TypeError, ValueError):
+            _x = np.array(x, copy=False, dtype=np.double, order='C')
+        if _x.shape[0] != self._number_of_variables:
             raise ValueError(
-                "Dimension, `np.size(x)==%d`, of input `x` does " % np.size(x) +
+                "Dimension, `np.size(x)==%d`, of input `x` does " % _x.shape[0] +
                 "not match the problem dimension `number_of_variables==%d`." 
                              % self.number_of_variables)
-        _x = x  # this is the final type conversion
-        if self.problem is NULL:
+        if problem is NULL:
             raise InvalidProblemException()
-        coco_evaluate_function(self.problem,
-                               <double *>np.PyArray_DATA(_x),
-                               <double *>np.PyArray_DATA(self.y))
-        return self.y[0] if self._number_of_objectives == 1 else self.y
+        xp = &_x[0]
+        if out is None and self._number_of_objectives == 1:
+            with nogil:
+                coco_evaluate_function(problem, xp, &f)
+            if self._loggers:
+                self._log(f)
+            return f
+        if out is None:
+            out = np.zeros(self._number_of_objectives)
+        _y = out
+        if _y.shape[0] != self._number_of_objectives:
+            raise ValueError(
+                "Size, `%d`, of `out` does not match " % _y.shape[0] +
+                "`number_of_objectives==%d`." % self._number_of_objectives)
+        yp = &_y[0]
+        with nogil:
+            coco_evaluate_function(problem, xp, yp)
+        if self._loggers:
+            self._log(yp[0])
+        return out
+
+    def evaluate_batch(self, X):
+        """return objective function values of all rows of `X`.
+
+        `X` is a 2-D array-like of shape ``(n, number_of_variables)``. The
+        result is an array of shape ``(n,)`` for a single objective and
+        ``(n, number_of_objectives)`` otherwise. The points are evaluated in
+        row order, hence an attached observer sees the same sequence of
+        evaluations as when calling `self` on each row. Like `__call__`, the
+        evaluation loop runs without holding the GIL. A ``bbob-biobj``
+        observer merges the rows into its archive of nondominated solutions
+        in a single sweep and flushes its output once per call.
+
+        >>> import numpy as np
+        >>> import cocoex as ex
+        >>> suite = ex.Suite("bbob", "", "")
+        >>> f = suite.get_problem(0)
+        >>> X = np.array([[1, 2], [0, 0], [-1, 3]])
+        >>> F = f.evaluate_batch(X)
+        >>> assert F.shape == (3,)
+        >>> assert all(F == [f(x) for x in X])
+        >>> assert f.evaluations == 6
+        >>> f.free()
+
+        """
+        cdef np.ndarray[double, ndim=2, mode="c"] _X
+        cdef np.ndarray[double, ndim=2, mode="c"] _Y
+        cdef coco_problem_t* problem = self.problem
+        cdef double *xp
+        cdef double *yp
+        cdef size_t i, n, nobj
+        assert self.initialized
+        X = np.array(X, copy=False, dtype=np.double, order='C', ndmin=2)
+        if X.ndim != 2 or X.shape[1] != self.number_of_variables:
+            raise ValueError(
+                "Shape, `X.shape==%s`, of input `X` does " % str(X.shape) +
+                "not match `(n, number_of_variables)` with " +
+                "`number_of_variables==%d`." % self.number_of_variables)
+        if problem is NULL:
+            raise InvalidProblemException()
+        _X = X  # this is the final type conversion
+        n, nobj = X.shape[0], self._number_of_objectives
+        _Y = np.zeros((n, nobj))
+        xp = <double *>np.PyArray_DATA(_X)
+        yp = <double *>np.PyArray_DATA(_Y)
+        with nogil:
+            coco_evaluate_function_batch(problem, xp, n, yp)
+        if self._loggers:
+            for i in range(n):
+                self._log(yp[i * nobj])
+        return _Y[:, 0] if self._number_of_objectives == 1 else _Y
+
+    cdef _log(self, double f):
+        """pass the f-value `f` of the last evaluation to the Python loggers"""
+        for logger in self._loggers:
+            logger(f)
 
     @property
     def id(self): 
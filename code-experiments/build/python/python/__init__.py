@@ -21,6 +21,8 @@ try:
 except Exception as _e:
     # print("numbbo/code-experiments/build/python/python/__init__.py: could not import '_interface', trying 'interface'", _e)
     from .interface import Suite, Observer, known_suite_names, log_level
+from .experiment import run_suite
+from .memory import MemoryObserver
 del absolute_import, division, print_function, unicode_literals
 
 # from .utilities import about_equal
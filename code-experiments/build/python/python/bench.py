@@ -0,0 +1,159 @@
+"""Measure the evaluation throughput of the `cocoex` bindings.
+
+For each function and dimension of the given suites, the first instance is
+evaluated for a given time in each mode of `modes`, that is with single
+point calls of `Problem.__call__` and with `Problem.evaluate_batch`, both
+without and with an attached `Observer`. The result is a list of records
+with the number of evaluations per second::
+
+    >>> import cocoex.bench as bench
+    >>> records = bench.benchmark(["bbob"], [2], functions="1-2", min_time=0.01)
+    >>> len(records), sorted(records[0])  # 2 functions, 4 modes
+    (8, ['dimension', 'evaluations', 'evaluations_per_second', 'function', 'mode', 'seconds', 'suite'])
+
+From the command line, ``python -m cocoex.bench`` runs the benchmark and
+writes a JSON report with the records and details of the environment, see
+``python -m cocoex.bench --help``. ``python do.py bench-python`` builds and
+installs `cocoex` first. Large dimensions are benchmarked with the
+``bbob-largescale`` suite, e.g. ``python -m cocoex.bench --suites
+bbob-largescale --dimensions 160,640,2560,5120``.
+"""
+from __future__ import absolute_import, division, print_function
+import re
+import sys
+import json
+import time
+import shutil
+import platform
+import tempfile
+import timeit
+import numpy as np
+try:
+    from ._interface import Suite, Observer, log_level
+except Exception as _e:
+    from .interface import Suite, Observer, log_level
+
+modes = ('single', 'batch', 'single_observed', 'batch_observed')
+"""evaluation modes measured by `benchmark`"""
+
+def _function(problem_id):
+    """return the function number of a problem `id` like ``'bbob_f001_i01_d02'``"""
+    return int(re.search(r'_f(\d+)_i\d+_d\d+$', problem_id).group(1))
+
+def _measure(problem, mode, min_time, batch_size, random):
+    """return the number of evaluations of `problem` in `mode` and the
+    elapsed time in seconds, evaluating at least for `min_time` seconds"""
+    lower, upper = np.asarray(problem.lower_bounds), np.asarray(problem.upper_bounds)
+    X = lower + (upper - lower) * random.rand(batch_size, problem.dimension)
+    batched = mode.startswith('batch')
+    evaluations, repetitions = 0, 1
+    start = timeit.default_timer()
+    while True:
+        for _ in range(repetitions):
+            if batched:
+                problem.evaluate_batch(X)
+            else:
+                for x in X:
+                    problem(x)
+        evaluations += repetitions * batch_size
+        elapsed = timeit.default_timer() - start
+        if elapsed >= min_time:
+            return evaluations, elapsed
+        repetitions *= 2
+
+def benchmark(suite_names=('bbob', 'bbob-biobj'), dimensions=(2, 3, 5, 10, 20, 40),
+              functions="", modes=modes, min_time=0.2, batch_size=100, seed=1,
+              verbose=False):
+    """return a `list` of `dict` records with the evaluation throughput of
+    the first instance of each function of the suites `suite_names` in each
+    of the `dimensions` and `modes`.
+
+    `functions` is an ``function_idx`` option string of `Suite` like
+    ``"1-5,24"``, by default all functions are benchmarked. Each
+    measurement evaluates `batch_size` uniform random points in the bounds
+    repeatedly, at least for `min_time` seconds. Observed modes write
+    their data into a temporary folder which is removed afterwards.
+    """
+    random = np.random.RandomState(seed)
+    records = []
+    result_folder = tempfile.mkdtemp(prefix='cocoex-bench')
+    level = log_level('warning')  # don't announce each observer folder
+    try:
+        for suite_name in suite_names:
+            suite_options = "dimensions: %s instance_idx: 1" % ','.join(str(d) for d in dimensions)
+            if functions:
+                suite_options += " function_idx: %s" % functions
+            suite = Suite(suite_name, "", suite_options)
+            # the bbob observer logs all single-objective suites, e.g. bbob-largescale
+            observer_name = 'bbob-biobj' if suite_name.startswith('bbob-biobj') else 'bbob'
+            for index, problem_id in enumerate(suite.ids):
+                for mode in modes:
+                    observer = None
+                    if mode.endswith('observed'):
+                        observer = Observer(observer_name,
+                                            "result_folder: %s/%s algorithm_name: bench"
+                                            % (result_folder, suite_name))
+                    problem = suite.get_problem(index, observer)
+                    evaluations, seconds = _measure(problem, mode, min_time, batch_size, random)
+                    records.append(dict(suite=suite_name, function=_function(problem_id),
+                                        dimension=problem.dimension, mode=mode,
+                                        evaluations=evaluations, seconds=seconds,
+                                        evaluations_per_second=evaluations / seconds))
+                    problem.free()
+                    if observer is not None:
+                        observer.free()
+                    if verbose:
+                        print("%s %-16s %10.0f evaluations/s" % (problem_id, mode,
+                                                                 evaluations / seconds))
+            suite.free()
+    finally:
+        log_level(level)
+        shutil.rmtree(result_folder, ignore_errors=True)
+    return records
+
+def report(records, **settings):
+    """return a `dict` with the `records` of `benchmark`, the `settings`
+    and information on the environment, to be saved as JSON"""
+    return dict(records=records, settings=settings,
+                date=time.strftime('%Y-%m-%dT%H:%M:%S'),
+                python=sys.version, numpy=np.__version__,
+                platform=platform.platform(), machine=platform.machine())
+
+def main(args=None):
+    """run `benchmark` with the command line arguments `args` and write a
+    JSON report"""
+    import argparse
+    parser = argparse.ArgumentParser(prog='python -m cocoex.bench',
+                                     description=__doc__.split('\n')[0])
+    parser.add_argument('--suites', default='bbob,bbob-biobj',
+                        help='comma separated suite names (default: %(default)s)')
+    parser.add_argument('--dimensions', default='2,3,5,10,20,40',
+                        help='comma separated dimensions (default: %(default)s)')
+    parser.add_argument('--functions', default='',
+                        help='function indices like "1-5,24" (default: all)')
+    parser.add_argument('--modes', default=','.join(modes),
+                        help='comma separated evaluation modes (default: %(default)s)')
+    parser.add_argument('--time', type=float, default=0.2,
+                        help='minimal seconds per measurement (default: %(default)s)')
+    parser.add_argument('--batch-size', type=int, default=100,
+                        help='points per batch (default: %(default)s)')
+    parser.add_argument('--output', default='cocoex-bench.json',
+                        help='JSON report file (default: %(default)s)')
+    parser.add_argument('--quiet', action='store_true', help='print only the report file name')
+    options = parser.parse_args(args)
+    settings = dict(suites=options.suites.split(','),
+                    dimensions=[int(d) for d in options.dimensions.split(',')],
+                    functions=options.functions, modes=options.modes.split(','),
+                    min_time=options.time, batch_size=options.batch_size)
+    unknown = set(settings['modes']) - set(modes)
+    if unknown:
+        parser.error("unknown modes %s, known are %s" % (', '.join(sorted(unknown)), ', '.join(modes)))
+    records = benchmark(settings['suites'], settings['dimensions'], settings['functions'],
+                        settings['modes'], settings['min_time'], settings['batch_size'],
+                        verbose=not options.quiet)
+    with open(options.output, 'w') as f:
+        json.dump(report(records, **settings), f, indent=1, sort_keys=True)
+    print("benchmark report written to %s" % options.output)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+"""Run a solver on all problems of a `Suite` in several processes.
+
+The problems are grouped by function and dimension, each group is run with
+its own observer and result folder, and the resulting data are merged into
+a single result folder which can be post-processed as if the experiment had
+been run in a single process::
+
+    >>> import os, shutil
+    >>> import cocoex as ex
+    >>> def solver(problem):
+    ...     problem(problem.lower_bounds)
+    >>> suite = ex.Suite("bbob", "", "dimensions: 2,3 function_idx: 1-2")
+    >>> folder = ex.run_suite(solver, suite, "result_folder: run_suite_doctest",
+    ...                       workers=1)  # solver is not picklable in a doctest
+    >>> print(' '.join(sorted(os.listdir(folder))))
+    bbobexp_f1_i1.info bbobexp_f2_i1.info data_f1 data_f2 run_suite_finished.txt
+    >>> folder == ex.run_suite(solver, suite, "result_folder: " + folder,
+    ...                        workers=1, resume=True)  # nothing left to do
+    True
+    >>> shutil.rmtree(folder)
+
+"""
+from __future__ import absolute_import, division, print_function
+import os
+import re
+import json
+import shutil
+import tempfile
+import multiprocessing
+try:
+    from ._interface import Suite, Observer, log_level
+except Exception as _e:
+    from .interface import Suite, Observer, log_level
+
+_suites = {}  # Suite instances of the current (worker) process, by constructor arguments
+_manifest_name = 'run_suite_finished.txt'  # ids of the finished problems in the result folder
+_journal_name = '.run_suite-journal'  # file sizes before the merge currently under way
+_result_folder_pattern = r'result_folder\s*:\s*("[^"]*"|\S+)'
+
+def _problem_group(problem_id):
+    """return the ``(dimension, function)`` of a problem `id` like
+    ``'bbob_f001_i01_d02'`` as tuple of `int`"""
+    match = re.search(r'_f(\d+)_i\d+_d(\d+)$', problem_id)
+    return int(match.group(2)), int(match.group(1))
+
+def _run_group(args):
+    """run `solver` on the problems with Python indices `indices` of the
+    suite given by `suite_args`, observed by a new observer, and return
+    `indices` and the result folder of this observer.
+
+    If `solver` raises, the problem and the observer are still freed, such
+    that the data written so far are complete in the result folder of the
+    observer.
+    """
+    solver, suite_args, observer_name, observer_options, indices = args
+    level = log_level('warning')  # don't announce each group folder
+    observer = None
+    try:
+        if suite_args not in _suites:
+            _suites[suite_args] = Suite(*suite_args)
+        suite = _suites[suite_args]
+        suite.warm_up(indices)  # construct the next problems while solving the first
+        observer = Observer(observer_name, observer_options)
+        folder = observer.result_folder
+        for index in indices:
+            problem = suite.get_problem(index, observer)
+            try:
+                solver(problem)
+            finally:  # flush and finalize the data also if solver raises
+                problem.free()
+    finally:
+        if observer is not None:
+            observer.free()
+        log_level(level)
+    return indices, folder.decode() if isinstance(folder, bytes) else folder
+
+def _merge_folder(source, target):
+    """move all files from folder `source` into folder `target`.
+
+    If a file exists already in `target`, the content of the `source` file is
+    appended. The header of a bbob-biobj ``.info`` file is not repeated and
+    the entries of a bbob ``.info`` file are kept on separate lines.
+    """
+    for path, _folders, files in os.walk(source):
+        target_path = os.path.join(target, os.path.relpath(path, source))
+        if not os.path.isdir(target_path):
+            os.makedirs(target_path)
+        for name in files:
+            source_file = os.path.join(path, name)
+            target_file = os.path.join(target_path, name)
+            if not os.path.exists(target_file):
+                shutil.move(source_file, target_file)
+                continue
+            with open(source_file, 'rb') as f:
+                content = f.read()
+            if name.endswith('.info'):
+                if content.startswith(b'algorithm'):  # bbob-biobj, skip two header lines
+                    content = b'\n'.join(content.split(b'\n')[2:])
+                with open(target_file, 'rb') as f:
+                    f.seek(0, os.SEEK_END)
+                    if f.tell():
+                        f.seek(-1, os.SEEK_END)
+                        if f.read() != b'\n' and not content.startswith(b'\n'):
+                            content = b'\n' + content
+            with open(target_file, 'ab') as f:
+                f.write(content)
+
+def _write_synced(file_name, text, mode):
+    """write `text` to `file_name` and sync it to disk"""
+    with open(file_name, mode) as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+
+def _checkpoint(source, result_folder, problem_ids):
+    """merge folder `source` into `result_folder` and add `problem_ids` to
+    the manifest of finished problems.
+
+    The file sizes before the merge are journaled, such that an interrupted
+    checkpoint is rolled back in `_finished_problems`.
+    """
+    files = [_manifest_name]
+    for path, _folders, names in os.walk(source):
+        files += [os.path.relpath(os.path.join(path, name), source) for name in names]
+    sizes = dict((name, os.path.getsize(os.path.join(result_folder, name))
+                        if os.path.exists(os.path.join(result_folder, name)) else None)
+                 for name in files)
+    journal = os.path.join(result_folder, _journal_name)
+    _write_synced(journal, json.dumps(sizes), 'w')
+    _merge_folder(source, result_folder)
+    _write_synced(os.path.join(result_folder, _manifest_name),
+                  ''.join(problem_id + '\n' for problem_id in problem_ids), 'a')
+    os.remove(journal)
+    shutil.rmtree(source)
+
+def _finished_problems(result_folder):
+    """return the set of finished problem ids recorded in `result_folder`.
+
+    Files of an interrupted `_checkpoint` are truncated to their journaled
+    sizes and leftover temporary folders are removed, such that unfinished
+    problems can be redone cleanly.
+    """
+    journal = os.path.join(result_folder, _journal_name)
+    if os.path.exists(journal):
+        try:
+            with open(journal) as f:
+                sizes = json.load(f)
+        except ValueError:  # interrupted while writing the journal, nothing merged yet
+            sizes = {}
+        for name, size in sizes.items():
+            file_name = os.path.join(result_folder, name)
+            if not os.path.exists(file_name):
+                continue
+            if size is None:
+                os.remove(file_name)
+            else:
+                with open(file_name, 'r+b') as f:
+                    f.truncate(size)
+        os.remove(journal)
+    for name in os.listdir(result_folder):
+        if name.startswith('.run_suite-') and os.path.isdir(os.path.join(result_folder, name)):
+            shutil.rmtree(os.path.join(result_folder, name))
+    manifest = os.path.join(result_folder, _manifest_name)
+    if not os.path.exists(manifest):
+        return set()
+    with open(manifest) as f:
+        return set(line.strip() for line in f if line.strip())
+
+def run_suite(solver, suite, observer_options="", workers=None,
+              observer_name=None, resume=False):
+    """run `solver` on each problem of `suite` in `workers` processes and
+    return the result folder with the merged data.
+
+    `solver` is called as ``solver(problem)`` on each observed `Problem` and
+    must take care of the budget itself. For ``workers > 1``, `solver` is
+    passed to other processes and must be picklable, e.g. a function defined
+    at module level. `suite` is a `Suite` instance, `observer_options` are
+    passed to `Observer`, by default named like the suite, and
+    `workers=None` uses all CPUs.
+
+    Problems of the same function and dimension are run in the same process.
+    The groups with the largest dimension are distributed first, so that
+    the expensive problems do not come last. The data of each group are
+    written into a temporary folder and merged into the result folder when
+    the group is finished, hence the result folder can be read with
+    `bbob_pproc` as if `solver` was run in a single process on the suite.
+
+    The ids of the problems of merged groups are recorded in the file
+    ``run_suite_finished.txt`` in the result folder. With ``resume=True``,
+    the folder given in the ``result_folder`` option is reused, if it
+    contains this file, and only the unfinished problems are run. Data of
+    unfinished groups never reach the result folder and a merge that was
+    interrupted is rolled back, hence a run can be resumed after a crash at
+    any time.
+    """
+    suite_args = (suite.name, suite.instance, suite.options)
+    if observer_name is None:
+        observer_name = suite.name
+    result_folder = None
+    if resume:
+        match = re.search(_result_folder_pattern, observer_options)
+        folder = match.group(1).strip('"') if match else 'results'
+        if os.path.exists(os.path.join(folder, _manifest_name)):
+            result_folder = folder
+    if result_folder is None:
+        observer = Observer(observer_name, observer_options)  # creates a unique folder
+        result_folder = observer.result_folder
+        result_folder = result_folder.decode() if isinstance(result_folder, bytes) else result_folder
+        observer.free()
+        _write_synced(os.path.join(result_folder, _manifest_name), '', 'a')
+    finished = _finished_problems(result_folder)
+
+    ids = suite.ids
+    groups = {}
+    for index, problem_id in enumerate(ids):
+        if problem_id not in finished:
+            groups.setdefault(_problem_group(problem_id), []).append(index)
+    tmp_folder = tempfile.mkdtemp(prefix='.run_suite-', dir=result_folder)
+    observer_options = re.sub(_result_folder_pattern, '', observer_options)
+    tasks = [(solver, suite_args, observer_name,
+              'result_folder: "%s" ' % os.path.join(tmp_folder, 'f%d_d%d' % (f, d))
+              + observer_options, groups[(d, f)])
+             for d, f in sorted(groups, reverse=True)]  # longest first
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    pool = None
+    if workers > 1 and len(tasks) > 1:
+        pool = multiprocessing.Pool(min(workers, len(tasks)))
+    try:
+        results = (pool.imap_unordered(_run_group, tasks, chunksize=1) if pool
+                   else (_run_group(task) for task in tasks))
+        for indices, folder in results:
+            _checkpoint(folder, result_folder, [ids[i] for i in indices])
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    shutil.rmtree(tmp_folder)
+    return result_folder
@@ -0,0 +1,185 @@
+"""Observe problems without writing any files.
+
+A `MemoryObserver` records the same data as the "bbob" `Observer`, the
+target hits of the ``.dat`` files and the budget hits of the ``.tdat``
+files, in `numpy` arrays, which can be passed on to the post-processing
+directly::
+
+    >>> import cocoex as ex
+    >>> suite = ex.Suite("bbob", "", "dimensions: 2 function_idx: 1 instance_idx: 1-3")
+    >>> observer = ex.MemoryObserver("bbob", "algorithm_name: ZERO")
+    >>> for problem in suite:
+    ...     _ = observer.observe(problem)
+    ...     for x in [problem.upper_bounds, problem.lower_bounds / 3, 0 * problem.lower_bounds]:
+    ...         _ = problem(x)
+    >>> len(observer.trials)
+    3
+    >>> trial = observer.trials[0]
+    >>> trial.evaluations, trial.target_hits.shape[1], int(trial.budget_hits[-1, 0])
+    (3, 5, 3)
+
+`MemoryObserver.data_set_list` returns a `bbob_pproc.pproc.DataSetList`
+without any data file being written or parsed, if `bbob_pproc` can be
+imported.
+"""
+from __future__ import absolute_import, division, print_function
+import re
+import numpy as np
+
+_always_log = (1, 2, 5)  # like coco_observer_always_log in coco_observer.c
+
+def _read_option(options, name, default, type_=str):
+    """return the value of `name` in the ``"name: value"`` string `options`"""
+    match = re.search(r'\b%s\s*:\s*("[^"]*"|\S+)' % name, options)
+    return type_(match.group(1).strip('"')) if match else default
+
+def _evaluation_to_log(evaluations, dimension):
+    """return whether `evaluations` is ``1`` or ``dimension`` times
+    ``10**j * i`` for ``i`` in `_always_log`, like in `coco_observer.c`"""
+    if evaluations == 1:
+        return True
+    j = 0
+    while 10**j * dimension <= evaluations:
+        if any(evaluations == 10**j * dimension * i for i in _always_log):
+            return True
+        j += 1
+    return False
+
+class _MemoryLogger(object):
+    """records one trial, that is one observed problem, like `logger_bbob.c`.
+
+    Rows of `target_hits` and `budget_hits` have the format of the lines of
+    the ``.dat`` and ``.tdat`` files, ``[evaluations, f - fopt,
+    best f - fopt, f, best f]``, without decision variables. The arrays are
+    available after the problem was `free`d.
+    """
+    def __init__(self, observer, problem_id, dimension, fopt):
+        match = re.search(r'_f(\d+)_i(\d+)_d\d+$', problem_id)
+        self.id = problem_id
+        self.function, self.instance = int(match.group(1)), int(match.group(2))
+        self.dimension = dimension
+        self.fopt = fopt
+        self.evaluations = 0
+        self.best_fvalue = np.inf
+        self.target_hits = []
+        self.budget_hits = []
+        self._observer = observer
+        self._idx_f_trigger = None
+        self._f_trigger = np.inf
+        self._idx_t_trigger = 0
+        self._idx_tdim_trigger = 0
+        self._t_trigger = 0
+        self._last_fvalue = np.inf
+        self._written_last_eval = True
+
+    def _row(self, fvalue):
+        return (self.evaluations, fvalue - self.fopt, self.best_fvalue - self.fopt,
+                fvalue, self.best_fvalue)
+
+    def _update_f_trigger(self, fvalue):
+        nbpts = self._observer.nbpts_fval
+        if fvalue - self.fopt <= 0:
+            self._f_trigger = -np.inf
+            return
+        if self._idx_f_trigger is None:
+            self._idx_f_trigger = int(np.ceil(np.log10(fvalue - self.fopt)) * nbpts)
+        else:
+            self._idx_f_trigger -= 1
+        self._f_trigger = 10**(self._idx_f_trigger / nbpts)
+        while fvalue - self.fopt <= self._f_trigger:
+            self._idx_f_trigger -= 1
+            self._f_trigger = 10**(self._idx_f_trigger / nbpts)
+
+    def _update_t_trigger(self):
+        nbpts = self._observer.nbpts_nbevals
+        while self.evaluations >= np.floor(10**(self._idx_t_trigger / nbpts)):
+            self._idx_t_trigger += 1
+        while self.evaluations >= self.dimension * 10**self._idx_tdim_trigger:
+            self._idx_tdim_trigger += 1
+        self._t_trigger = min(np.floor(10**(self._idx_t_trigger / nbpts)),
+                              self.dimension * 10**self._idx_tdim_trigger)
+
+    def __call__(self, fvalue):
+        """record the evaluation with f-value `fvalue`"""
+        self.evaluations += 1
+        if self.evaluations == 1 or fvalue < self.best_fvalue:
+            self.best_fvalue = fvalue
+        self._last_fvalue = fvalue
+        self._written_last_eval = False
+        if fvalue - self.fopt <= self._f_trigger:
+            self.target_hits.append(self._row(fvalue))
+            self._update_f_trigger(fvalue)
+        if self.evaluations >= self._t_trigger:
+            self._written_last_eval = True
+            self.budget_hits.append(self._row(fvalue))
+            self._update_t_trigger()
+        elif _evaluation_to_log(self.evaluations, self.dimension):
+            self._written_last_eval = True
+            self.budget_hits.append(self._row(fvalue))
+
+    def finalize(self):
+        """convert the recorded data to arrays and pass them to the
+        observer, called when the problem is `free`d"""
+        if not self.evaluations:  # like in logger_bbob.c, nothing is recorded
+            return
+        if not self._written_last_eval:
+            self.budget_hits.append(self._row(self._last_fvalue))
+        self.target_hits = np.array(self.target_hits, dtype=float)
+        self.budget_hits = np.array(self.budget_hits, dtype=float)
+        self._observer.trials.append(self)
+
+class MemoryObserver(object):
+    """Observer which keeps the data of the observed problems in memory.
+
+    `name` must be ``"bbob"``. Like for the "bbob" `Observer`, the
+    `options` ``algorithm_name``, ``nbpts_nbevals`` and ``nbpts_fval`` are
+    recognized, other options are ignored.
+
+    Each observed problem adds a trial to `trials` when it is `free`d. A
+    trial has the attributes ``function``, ``instance``, ``dimension``,
+    ``fopt``, ``evaluations``, ``best_fvalue`` and the arrays
+    ``target_hits`` and ``budget_hits`` with the data of the ``.dat`` and
+    ``.tdat`` files.
+    """
+    def __init__(self, name="bbob", options=""):
+        if name != "bbob":
+            raise ValueError('MemoryObserver supports only the "bbob" observer, not "%s"'
+                             % name)
+        self.name = name
+        self.options = options
+        self.algorithm_name = _read_option(options, 'algorithm_name', 'ALG')
+        self.nbpts_nbevals = _read_option(options, 'nbpts_nbevals', 20, int)
+        self.nbpts_fval = _read_option(options, 'nbpts_fval', 5, int)
+        self.trials = []
+
+    def observe(self, problem):
+        """`observe(problem)` let `self` observe the `problem: Problem` by
+        calling `problem.add_observer(self)`"""
+        problem.add_observer(self)
+        return self
+
+    def _logger(self, problem_id, dimension, fopt):
+        """return a new logger, called in `Problem.add_observer`"""
+        return _MemoryLogger(self, problem_id, dimension, fopt)
+
+    def data_set_list(self, verbose=False):
+        """return the recorded trials as `bbob_pproc.pproc.DataSetList`,
+        with one `DataSet` for each function and dimension.
+
+        The data arrays are aligned like those read from the files of the
+        "bbob" `Observer`, but no file is written or read.
+        """
+        from bbob_pproc import pproc  # bbob_pproc is not a requirement of cocoex
+        groups = {}
+        for trial in self.trials:
+            groups.setdefault((trial.function, trial.dimension), []).append(trial)
+        res = pproc.DataSetList()
+        for (function, dimension), trials in sorted(groups.items()):
+            header = "funcId = %d, DIM = %d, Precision = %.3e, algId = '%s'" % (
+                function, dimension, 1e-8, self.algorithm_name)
+            data = ', '.join('%d:%d|%.1e' % (t.instance, t.evaluations, t.best_fvalue - t.fopt)
+                             for t in trials)
+            res.append(pproc.DataSet(header, '%', data, '', verbose,
+                                     trial_data=([t.target_hits for t in trials],
+                                                 [t.budget_hits for t in trials])))
+        return res
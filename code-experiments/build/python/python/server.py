@@ -0,0 +1,376 @@
+"""Evaluate the problems of a `Suite` for solvers in other processes.
+
+A `Server` listens on a Unix domain socket. Each connected client, e.g. a
+solver process written in any language, opens problems of the suite by
+index and sends batches of points as raw ``float64`` buffers. The server
+returns the f-values and logs the evaluations with the usual `Observer`.
+Each connection is served by its own process with its own observer, like a
+group of `run_suite`, and the data are merged into the result folder of
+the server when the connection is closed::
+
+    >>> import shutil, threading
+    >>> import numpy as np
+    >>> import cocoex as ex
+    >>> from cocoex.server import Server, Client
+    >>> suite = ex.Suite("bbob", "", "dimensions: 2 function_idx: 1-2 instance_idx: 1")
+    >>> server = Server(suite, "result_folder: server_doctest", "server_doctest.sock")
+    >>> thread = threading.Thread(target=server.run, args=(1,))  # serve one client
+    >>> thread.start()
+    >>> client = Client("server_doctest.sock")
+    >>> len(client)
+    2
+    >>> problem = client.get_problem(1)
+    >>> F = problem.evaluate_batch(np.zeros((3, problem.dimension)))
+    >>> assert F.shape == (3,) and problem(np.zeros(2)) == F[0]
+    >>> problem.evaluations
+    4
+    >>> problem.free()
+    >>> client.close()
+    >>> thread.join()
+    >>> sorted(open(server.result_folder + "/run_suite_finished.txt").read().split())
+    ['bbob_f002_i01_d02']
+    >>> shutil.rmtree(server.result_folder)
+
+The protocol is a sequence of requests of the client, each answered by the
+server. A message starts with a header of a 4-byte command and two 64-bit
+integers, `header`, followed by a payload of ``float64`` values, all in
+native byte order:
+
+============  ====================  =========================================
+request       payload               reply (``b'OK  '`` header and payload)
+============  ====================  =========================================
+SIZE, 0, 0    none                  number of problems, 0, none
+OPEN, i, 0    none                  dimension, number of objectives, lower
+                                    and upper bounds (``2 * dimension``)
+EVAL, n, 0    n points              n, number of objectives, f-values
+                                    (``n * number of objectives``)
+FREE, 0, 0    none                  number of evaluations, 0, none
+============  ====================  =========================================
+
+``OPEN`` opens the problem with index ``i`` of the suite, at most one
+problem is open per connection, because the loggers of the C code observe
+only one problem at a time. ``EVAL`` evaluates the points of the payload,
+``n`` rows with ``dimension`` columns in C order, on the open problem and
+``FREE`` closes it. A failed request is answered with the header
+``b'ERR '``, the length of the error message and 0, followed by the UTF-8
+encoded message, and the server closes the connection. The points are
+received into a reused buffer and passed to `Problem.evaluate_batch`
+without any conversion.
+
+From the command line, ``python -m cocoex.server`` serves a suite until it
+is interrupted, see ``python -m cocoex.server --help``.
+"""
+from __future__ import absolute_import, division, print_function
+import os
+import re
+import stat
+import select
+import socket
+import struct
+import shutil
+import tempfile
+import multiprocessing
+import numpy as np
+try:
+    from ._interface import Suite, Observer, log_level
+except Exception as _e:
+    from .interface import Suite, Observer, log_level
+from .experiment import _checkpoint, _write_synced, _manifest_name, _result_folder_pattern
+
+_context = (multiprocessing.get_context('forkserver')
+           if hasattr(multiprocessing, 'get_context') else multiprocessing)
+"""starts the connection processes, from a fork server if available, such
+that they don't inherit the sockets of other connections"""
+
+header = struct.Struct('=4sqq')
+"""format of the message headers, a command and two 64-bit integers"""
+
+def _receive_into(connection, buffer_):
+    """fill the writable buffer `buffer_` from `connection` and return
+    whether it was filled, `False` if the connection was closed before
+    the first byte was received"""
+    if isinstance(buffer_, np.ndarray):  # a contiguous array, received as bytes
+        buffer_ = buffer_.reshape(-1).view(np.uint8)
+    view = memoryview(buffer_)
+    received = 0
+    while received < len(view):
+        count = connection.recv_into(view[received:])
+        if not count:
+            if received:
+                raise EOFError("connection closed within a message")
+            return False
+        received += count
+    return True
+
+def _receive_header(connection):
+    """return the ``(command, a, b)`` header received from `connection`,
+    or `None` if the connection was closed"""
+    buffer_ = bytearray(header.size)
+    return header.unpack(bytes(buffer_)) if _receive_into(connection, buffer_) else None
+
+def _send(connection, command, a=0, b=0, payload=None):
+    """send a message with `header` ``(command, a, b)`` and the
+    ``float64`` array `payload` without copying it"""
+    connection.sendall(header.pack(command, a, b))
+    if payload is not None and payload.size:
+        connection.sendall(memoryview(np.ascontiguousarray(payload, dtype=np.float64)))
+
+def _serve_connection(connection, suite_args, observer_name, observer_options, results):
+    """answer the requests of the client on `connection` with the problems
+    of the suite given by `suite_args` and send the result folder of the
+    observer and the ids of the freed problems into the pipe `results`"""
+    level = log_level('warning')  # don't announce each connection folder
+    suite = Suite(*suite_args)
+    observer = Observer(observer_name, observer_options)
+    problem, freed = None, []
+    points = np.empty(0)
+    try:
+        while True:
+            message = _receive_header(connection)
+            if message is None:
+                break
+            command, a, _b = message
+            try:
+                if command == b'EVAL':
+                    if problem is None:
+                        raise ValueError("no open problem to evaluate")
+                    if points.size < a * problem.dimension:
+                        points = np.empty(a * problem.dimension)
+                    X = points[:a * problem.dimension].reshape(a, problem.dimension)
+                    if not _receive_into(connection, X):
+                        raise EOFError("connection closed within a message")
+                    _send(connection, b'OK  ', a, problem.number_of_objectives,
+                          problem.evaluate_batch(X))
+                elif command == b'OPEN':
+                    if problem is not None:
+                        raise ValueError("problem %s is still open" % problem.id)
+                    problem = suite.get_problem(a, observer)
+                    _send(connection, b'OK  ', problem.dimension, problem.number_of_objectives,
+                          np.hstack([problem.lower_bounds, problem.upper_bounds]))
+                elif command == b'FREE':
+                    if problem is None:
+                        raise ValueError("no open problem to free")
+                    evaluations = problem.evaluations
+                    freed.append(problem.id)
+                    problem.free()
+                    problem = None
+                    _send(connection, b'OK  ', evaluations)
+                elif command == b'SIZE':
+                    _send(connection, b'OK  ', len(suite))
+                else:
+                    raise ValueError("unknown command %r" % command)
+            except EOFError:
+                raise
+            except Exception as e:
+                message = str(e).encode('utf-8')
+                connection.sendall(header.pack(b'ERR ', len(message), 0) + message)
+                break
+    except (EOFError, socket.error):
+        pass  # the client went away, the data observed so far are kept
+    finally:
+        connection.close()
+        if problem is not None:
+            problem.free()
+        folder = observer.result_folder
+        observer.free()
+        suite.free()
+        log_level(level)
+        results.send((folder.decode() if isinstance(folder, bytes) else folder, freed))
+
+class Server(object):
+    """Serve the problems of `suite` to clients on the Unix domain socket
+    `address`, see the module documentation for the protocol.
+
+    `observer_options` are passed to `Observer`, by default named like the
+    suite. The socket is bound when the instance is created, hence clients
+    can connect before `run` is called. The data of all connections end up
+    in `result_folder`, which can be post-processed, or continued with
+    `run_suite` with ``resume=True``, like the result folder of
+    `run_suite`.
+
+    The connection processes are started from a fork server, hence, like
+    with `multiprocessing`, a main script must create the `Server` under
+    ``if __name__ == "__main__":``.
+    """
+    def __init__(self, suite, observer_options="", address="cocoex.sock", observer_name=None):
+        self.suite_args = (suite.name, suite.instance, suite.options)
+        self.observer_name = suite.name if observer_name is None else observer_name
+        level = log_level('warning')
+        observer = Observer(self.observer_name, observer_options)  # creates a unique folder
+        log_level(level)
+        folder = observer.result_folder
+        self.result_folder = folder.decode() if isinstance(folder, bytes) else folder
+        observer.free()
+        _write_synced(os.path.join(self.result_folder, _manifest_name), '', 'a')
+        self._tmp_folder = tempfile.mkdtemp(prefix='.run_suite-', dir=self.result_folder)
+        self._observer_options = re.sub(_result_folder_pattern, '', observer_options)
+        self.address = address
+        if os.path.exists(address) and stat.S_ISSOCK(os.stat(address).st_mode):
+            os.remove(address)  # left over from a server which was not closed
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.bind(address)
+        self._socket.listen(16)
+        self._processes = []
+        self._connections = 0
+
+    def _collect(self):
+        """merge the data of the finished connections into `result_folder`"""
+        for process, results in list(self._processes):
+            finished = not process.is_alive()
+            if results.poll():
+                try:
+                    folder, problem_ids = results.recv()
+                except EOFError:  # the process crashed, its data are discarded
+                    pass
+                else:
+                    _checkpoint(folder, self.result_folder, problem_ids)
+            if finished:
+                process.join()
+                self._processes.remove((process, results))
+
+    def run(self, clients=None):
+        """serve `clients` connections, by default until interrupted, and
+        return `result_folder` when all of them are closed.
+
+        Each connection is served by a new process, such that the clients
+        are served in parallel.
+        """
+        try:
+            while clients is None or self._connections < clients:
+                if select.select([self._socket], [], [], 0.1)[0]:
+                    connection = self._socket.accept()[0]
+                    self._connections += 1
+                    results, child_results = _context.Pipe(False)
+                    options = 'result_folder: "%s" %s' % (
+                        os.path.join(self._tmp_folder, 'c%d' % self._connections),
+                        self._observer_options)
+                    process = _context.Process(
+                        target=_serve_connection,
+                        args=(connection, self.suite_args, self.observer_name, options,
+                              child_results))
+                    process.start()
+                    connection.close()  # the process has its own copy
+                    child_results.close()
+                    self._processes.append((process, results))
+                self._collect()
+        finally:
+            self.close()
+        return self.result_folder
+
+    def close(self):
+        """stop listening, wait for the open connections and merge their
+        data"""
+        if self._socket is None:
+            return
+        self._socket.close()
+        self._socket = None
+        if os.path.exists(self.address):
+            os.remove(self.address)
+        while self._processes:
+            self._collect()
+            select.select([], [], [], 0.01)
+        shutil.rmtree(self._tmp_folder)  # with the data of crashed processes
+
+class _RemoteProblem(object):
+    """a problem opened with `Client.get_problem`, evaluated by the server
+    like a `Problem`"""
+    def __init__(self, client, index, dimension, number_of_objectives, bounds):
+        self._client = client
+        self.index = index
+        self.dimension = dimension
+        self.number_of_objectives = number_of_objectives
+        self.lower_bounds = bounds[:dimension]
+        self.upper_bounds = bounds[dimension:]
+        self.evaluations = 0
+
+    def evaluate_batch(self, X):
+        """return the f-values of all rows of `X`, shaped like the result
+        of `Problem.evaluate_batch`"""
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        X = X.reshape(-1, self.dimension) if X.ndim < 2 else X
+        if X.ndim != 2 or X.shape[1] != self.dimension:
+            raise ValueError("Shape, `X.shape==%s`, of input `X` does not match "
+                             "`(n, dimension)` with `dimension==%d`."
+                             % (str(X.shape), self.dimension))
+        a, b, F = self._client._request(b'EVAL', len(X), 0, X)
+        self.evaluations += len(X)
+        return F.reshape(a, b) if b > 1 else F
+
+    def __call__(self, x):
+        """return the f-value of `x`, a `float` or an array of objective
+        values"""
+        F = self.evaluate_batch(np.reshape(x, (1, self.dimension)))
+        return F[0] if self.number_of_objectives > 1 else float(F[0])
+
+    def free(self):
+        """close the problem on the server, which finalizes its data"""
+        if self._client is not None:
+            self.evaluations = self._client._request(b'FREE')[0]
+            self._client = None
+
+class Client(object):
+    """Connect to a `Server` on the Unix domain socket `address` to
+    evaluate the problems of its suite, see the module documentation"""
+    def __init__(self, address="cocoex.sock"):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(address)
+
+    def _request(self, command, a=0, b=0, payload=None):
+        """send a request and return the integers and the ``float64``
+        payload of the reply, which has ``a * b`` values for an ``EVAL``,
+        ``2 * a`` for an ``OPEN`` and none otherwise"""
+        _send(self._socket, command, a, b, payload)
+        message = _receive_header(self._socket)
+        if message is None:
+            raise EOFError("the server closed the connection")
+        status, a, b = message
+        if status == b'ERR ':
+            text = bytearray(a)
+            _receive_into(self._socket, text)
+            raise RuntimeError("server error: %s" % text.decode('utf-8'))
+        size = {b'EVAL': a * b, b'OPEN': 2 * a}.get(command, 0)
+        result = np.empty(size)
+        if size:
+            _receive_into(self._socket, result)
+        return a, b, result
+
+    def __len__(self):
+        return self._request(b'SIZE')[0]
+
+    def get_problem(self, index):
+        """open and return the problem with index `index` of the suite of the
+        server, which must be `free`d before the next problem is opened"""
+        dimension, number_of_objectives, bounds = self._request(b'OPEN', index)
+        return _RemoteProblem(self, index, dimension, number_of_objectives, bounds)
+
+    def close(self):
+        """close the connection, the server frees a problem left open"""
+        self._socket.close()
+
+def main(args=None):
+    """serve a suite with the command line arguments `args`"""
+    import argparse
+    parser = argparse.ArgumentParser(prog='python -m cocoex.server',
+                                     description=__doc__.split('\n')[0])
+    parser.add_argument('suite', help='suite name, e.g. bbob or bbob-biobj')
+    parser.add_argument('--suite-instance', default='', help='instance string of the suite')
+    parser.add_argument('--suite-options', default='', help='options string of the suite')
+    parser.add_argument('--observer-options', default='', help='options string of the observer')
+    parser.add_argument('--address', default='cocoex.sock',
+                        help='path of the Unix domain socket (default: %(default)s)')
+    parser.add_argument('--clients', type=int, default=None,
+                        help='number of connections to serve (default: until interrupted)')
+    options = parser.parse_args(args)
+    suite = Suite(options.suite, options.suite_instance, options.suite_options)
+    server = Server(suite, options.observer_options, options.address)
+    suite.free()
+    print("serving %s on %s, data are written to %s" % (options.suite, options.address,
+                                                        server.result_folder))
+    try:
+        server.run(options.clients)
+    except KeyboardInterrupt:
+        pass
+    print("data written to %s" % server.result_folder)
+
+if __name__ == '__main__':
+    main()
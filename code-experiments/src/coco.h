@@ -139,6 +139,35 @@ coco_problem_t *coco_suite_get_problem(coco_suite_t *suite, size_t problem_index
  */
 size_t coco_suite_get_number_of_problems(coco_suite_t *suite);
 
+/**
+ * @brief Returns the index of the problem following problem_index in the suite (or the index of the first
+ * problem if problem_index is negative) or -1 if there is no next problem, without constructing any problem.
+ */
+long coco_suite_get_next_problem_index(coco_suite_t *suite, const long problem_index);
+
+/**
+ * @brief Returns the ID of the problem defined by problem_index without constructing the problem (whenever
+ * possible). The returned string must be freed by the caller.
+ */
+char *coco_suite_get_problem_id(coco_suite_t *suite, const size_t problem_index);
+
+/**
+ * @brief Returns the name of the problem defined by problem_index without constructing the problem (whenever
+ * possible). The returned string must be freed by the caller.
+ */
+char *coco_suite_get_problem_name(coco_suite_t *suite, const size_t problem_index);
+
+/**
+ * @brief Returns the dimension of the problem defined by problem_index without constructing the problem.
+ */
+size_t coco_suite_get_problem_dimension(coco_suite_t *suite, const size_t problem_index);
+
+/**
+ * @brief Returns the number of objectives of the problem defined by problem_index without constructing the
+ * problem.
+ */
+size_t coco_suite_get_problem_number_of_objectives(coco_suite_t *suite, const size_t problem_index);
+
 /**
  * @brief Returns the function number in the suite in position function_idx (counting from 0).
  */
@@ -255,6 +284,11 @@ void coco_observer_free(coco_observer_t *self);
  */
 coco_problem_t *coco_problem_add_observer(coco_problem_t *problem, coco_observer_t *observer);
 
+/**
+ * @brief Returns the folder to which the observer writes its results.
+ */
+const char *coco_observer_get_result_folder(const coco_observer_t *observer);
+
 /**@}*/
 
 /***********************************************************************************************************/
@@ -268,6 +302,15 @@ coco_problem_t *coco_problem_add_observer(coco_problem_t *problem, coco_observer
  */
 void coco_evaluate_function(coco_problem_t *problem, const double *x, double *y);
 
+/**
+ * @brief Evaluates the problem function in number_of_points points stored row by row in x and saves the
+ * results row by row in y.
+ */
+void coco_evaluate_function_batch(coco_problem_t *problem,
+                                  const double *x,
+                                  const size_t number_of_points,
+                                  double *y);
+
 /**
  * @brief Evaluates the problem constraints in point x and save the result in y.
  */
@@ -323,6 +366,11 @@ double coco_problem_get_best_observed_fvalue1(const coco_problem_t *problem);
  */
 double coco_problem_get_final_target_fvalue1(const coco_problem_t *problem);
 
+/**
+ * @brief Returns the optimal value of the first objective.
+ */
+double coco_problem_get_best_value1(const coco_problem_t *problem);
+
 /**
  * @brief Returns a vector of size 'dimension' with lower bounds of the region of interest in
  * the decision space.
@@ -344,6 +392,11 @@ size_t coco_problem_get_suite_dep_index(coco_problem_t *problem);
  * @brief Returns an initial solution, i.e. a feasible variable setting, to the problem.
  */
 void coco_problem_get_initial_solution(const coco_problem_t *problem, double *initial_solution);
+
+/**
+ * @brief Returns a clone of the problem that shares its data, but counts its own evaluations.
+ */
+coco_problem_t *coco_problem_clone(coco_problem_t *problem);
 /**@}*/
 
 /***********************************************************************************************************/
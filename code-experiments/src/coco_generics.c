@@ -51,6 +51,16 @@ double coco_problem_get_final_target_fvalue1(const coco_problem_t *problem) {
   assert(problem->final_target_delta != NULL);
   return problem->best_value[0] + problem->final_target_delta[0];
 }
+
+/**
+ * @note This function breaks the black-box property: the returned value is not meant to be used by the
+ * optimization algorithm, but serves to log the data relative to the optimum.
+ */
+double coco_problem_get_best_value1(const coco_problem_t *problem) {
+  assert(problem != NULL);
+  assert(problem->best_value != NULL);
+  return problem->best_value[0];
+}
 #endif
 
 /**
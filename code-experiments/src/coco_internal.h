@@ -99,6 +99,11 @@ struct coco_problem {
 typedef void (*coco_observer_data_free_function_t)(void *data);
 typedef coco_problem_t *(*coco_logger_initialize_function_t)(coco_observer_t *self, coco_problem_t *problem);
 
+/* When the decision variables are output by the observers, see the observer option log_x */
+#define COCO_OBSERVER_LOG_X_ALL 0
+#define COCO_OBSERVER_LOG_X_SPARSE 1
+#define COCO_OBSERVER_LOG_X_FINAL 2
+
 /**
  * Description of a COCO observer (instance)
  *
@@ -110,6 +115,8 @@ typedef coco_problem_t *(*coco_logger_initialize_function_t)(coco_observer_t *se
  *
  * algorithm_info - Additional information on the algorithm to be used in logger output
  *
+ * log_x_mode - When the decision variables are output, one of COCO_OBSERVER_LOG_X_...
+ *
  * data - Void pointer that can be used to store data specific to any observer
  *
  */
@@ -121,6 +128,7 @@ struct coco_observer {
   char *algorithm_info;
   int precision_x;
   int precision_f;
+  int log_x_mode;
   void *data;
 
   coco_observer_data_free_function_t data_free_function;
@@ -33,6 +33,28 @@ static int coco_observer_evaluation_to_log(size_t number_of_evaluations, size_t
   return 0;
 }
 
+/**
+ * Returns the smallest number of evaluations larger than number_of_evaluations for which
+ * coco_observer_evaluation_to_log returns true. This is the sparse schedule of the option log_x.
+ */
+static size_t coco_observer_next_evaluation_to_log(size_t number_of_evaluations, size_t dimension) {
+
+  size_t i;
+  double j = 0, factor = 10;
+  size_t count = sizeof(coco_observer_always_log) / sizeof(size_t);
+
+  if (number_of_evaluations < 1)
+    return 1;
+
+  while (1) {
+    for (i = 0; i < count; i++) {
+      if ((size_t) pow(factor, j) * dimension * coco_observer_always_log[i] > number_of_evaluations)
+        return (size_t) pow(factor, j) * dimension * coco_observer_always_log[i];
+    }
+    j++;
+  }
+}
+
 #include "logger_bbob.c"
 #include "logger_biobj.c"
 #include "logger_toy.c"
@@ -44,7 +66,8 @@ static coco_observer_t *coco_observer_allocate(const char *output_folder,
                                                const char *algorithm_name,
                                                const char *algorithm_info,
                                                const int precision_x,
-                                               const int precision_f) {
+                                               const int precision_f,
+                                               const int log_x_mode) {
 
   coco_observer_t *observer;
   observer = (coco_observer_t *) coco_allocate_memory(sizeof(*observer));
@@ -54,6 +77,7 @@ static coco_observer_t *coco_observer_allocate(const char *output_folder,
   observer->algorithm_info = coco_strdup(algorithm_info);
   observer->precision_x = precision_x;
   observer->precision_f = precision_f;
+  observer->log_x_mode = log_x_mode;
   observer->data = NULL;
   observer->data_free_function = NULL;
   observer->logger_initialize_function = NULL;
@@ -109,13 +133,24 @@ void coco_observer_free(coco_observer_t *observer) {
  * of digits to be printed after the decimal point. The default value is 8.
  * - precision_f: VALUE defines the precision used when outputting f values and corresponds to the number of
  * digits to be printed after the decimal point. The default value is 15.
+ * - "log_x: VALUE" defines which of the logged solutions are output with their decision variables, while
+ * the logged function values remain complete. With "all" (the default value), all logged solutions include
+ * their decision variables, as far as the observer outputs them at all (see the options of the specific
+ * observers). With "sparse", the decision variables are output only for the first logged solution of each
+ * data file at or after the evaluations 1, dim*1, dim*2, dim*5, 10*dim*1, 10*dim*2, 10*dim*5, ...
+ * With "final", they are output only for the final solutions: the "bbob" observer adds them to the last
+ * line of the *.tdat file, which holds the best solution of the run (this line is repeated if the last
+ * evaluation was already logged), and the "bbob-biobj" observer outputs them only for the final archive
+ * (with "log_nondominated: all", the final nondominated solutions are additionally output to a
+ * *_nondom_final.dat file).
  * @return The constructed observer object or NULL if observer_name equals NULL, "" or "no_observer".
  */
 coco_observer_t *coco_observer(const char *observer_name, const char *observer_options) {
 
   coco_observer_t *observer;
   char *result_folder, *algorithm_name, *algorithm_info;
-  int precision_x, precision_f;
+  int precision_x, precision_f, log_x_mode;
+  char log_x[COCO_PATH_MAX];
 
   if (0 == strcmp(observer_name, "no_observer")) {
     return NULL;
@@ -155,7 +190,18 @@ coco_observer_t *coco_observer(const char *observer_name, const char *observer_o
       precision_f = 15;
   }
 
-  observer = coco_observer_allocate(result_folder, algorithm_name, algorithm_info, precision_x, precision_f);
+  log_x_mode = COCO_OBSERVER_LOG_X_ALL;
+  if (coco_options_read_string(observer_options, "log_x", log_x) > 0) {
+    if (strcmp(log_x, "sparse") == 0)
+      log_x_mode = COCO_OBSERVER_LOG_X_SPARSE;
+    else if (strcmp(log_x, "final") == 0)
+      log_x_mode = COCO_OBSERVER_LOG_X_FINAL;
+    else if (strcmp(log_x, "all") != 0)
+      coco_warning("coco_observer(): unknown value '%s' of log_x, all decision variables are logged", log_x);
+  }
+
+  observer = coco_observer_allocate(result_folder, algorithm_name, algorithm_info, precision_x, precision_f,
+      log_x_mode);
 
   coco_free_memory(result_folder);
   coco_free_memory(algorithm_name);
@@ -195,3 +241,45 @@ coco_problem_t *coco_problem_add_observer(coco_problem_t *problem, coco_observer
   return observer->logger_initialize_function(observer, problem);
 }
 
+
+/**
+ * @returns The (unique) folder the observer writes its results to or NULL if the observer is NULL.
+ */
+const char *coco_observer_get_result_folder(const coco_observer_t *observer) {
+
+  if (observer == NULL)
+    return NULL;
+  return observer->output_folder;
+}
+
+/**
+ * Evaluates the problem function in the number_of_points points stored row by row in x and saves the
+ * results row by row in y. The result and the bookkeeping of the evaluations are the same as with
+ * number_of_points calls of coco_evaluate_function, but the bi-objective logger processes the points as one
+ * population and flushes its output only once.
+ */
+void coco_evaluate_function_batch(coco_problem_t *problem,
+                                  const double *x,
+                                  const size_t number_of_points,
+                                  double *y) {
+  size_t i;
+
+  assert(problem != NULL);
+  assert(problem->evaluate_function != NULL);
+
+  if (problem->evaluate_function != logger_biobj_evaluate) {
+    for (i = 0; i < number_of_points; i++)
+      coco_evaluate_function(problem, x + i * problem->number_of_variables, y + i * problem->number_of_objectives);
+    return;
+  }
+
+  logger_biobj_evaluate_batch(problem, x, number_of_points, y);
+  for (i = 0; i < number_of_points; i++) {
+    const double *y_i = y + i * problem->number_of_objectives;
+    problem->evaluations++;
+    if (y_i[0] < problem->best_observed_fvalue[0]) {
+      problem->best_observed_fvalue[0] = y_i[0];
+      problem->best_observed_evaluation[0] = problem->evaluations;
+    }
+  }
+}
@@ -358,6 +358,36 @@ coco_problem_t *coco_transformed_allocate(coco_problem_t *inner_problem,
   return self;
 }
 
+/**
+ * Frees a problem allocated by coco_problem_clone(...) without freeing the problem it was cloned from.
+ */
+static void coco_problem_clone_free(coco_problem_t *self) {
+  assert(self != NULL);
+  assert(self->data != NULL);
+
+  coco_free_memory(self->data);
+  self->data = NULL;
+  self->free_problem = NULL;
+  coco_problem_free(self);
+}
+
+/**
+ * Allocates a light-weight clone of ${problem} with its own evaluation counter and best observed value,
+ * which shares all other data, like rotation matrices, with ${problem}. The clone can be observed and
+ * freed like any other problem and must be freed before ${problem}. Clones of the same problem should not
+ * be evaluated concurrently, as the data may contain buffers used during the evaluation.
+ */
+coco_problem_t *coco_problem_clone(coco_problem_t *problem) {
+  coco_problem_t *self;
+
+  self = coco_transformed_allocate(problem, NULL, NULL);
+  self->free_problem = coco_problem_clone_free;
+  self->evaluations = 0;
+  self->best_observed_fvalue[0] = DBL_MAX;
+  self->best_observed_evaluation[0] = 0;
+  return self;
+}
+
 void *coco_transformed_get_data(coco_problem_t *self) {
   assert(self != NULL);
   assert(self->data != NULL);
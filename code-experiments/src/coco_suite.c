@@ -56,6 +56,9 @@ static coco_suite_t *coco_suite_allocate(const char *suite_name,
   suite->data = NULL;
   suite->data_free_function = NULL;
 
+  /* Share the generated rotation matrices and optimal solutions between the problems of the suite */
+  bbob2009_cache_acquire();
+
   return suite;
 }
 
@@ -203,6 +206,7 @@ void coco_suite_free(coco_suite_t *suite) {
 
     coco_free_memory(suite);
     suite = NULL;
+    bbob2009_cache_release();
   }
 }
 
@@ -293,6 +297,135 @@ size_t coco_suite_get_number_of_problems(coco_suite_t *suite) {
   return (suite->number_of_instances * suite->number_of_functions * suite->number_of_dimensions);
 }
 
+/**
+ * Iterates through the problem indices in the same order as coco_suite_get_next_problem (that is, by
+ * increasing problem index) and skips the functions, dimensions and instances that have been filtered out
+ * through the suite_options parameter of the coco_suite function. No problem is constructed.
+ *
+ * @param suite The given suite.
+ * @param problem_index The index of the current problem or a negative value to get the index of the first
+ * problem of the suite.
+ * @return The index of the next problem in the suite or -1 if there is no next problem left.
+ */
+long coco_suite_get_next_problem_index(coco_suite_t *suite, const long problem_index) {
+
+  size_t function_idx = 0, dimension_idx = 0, instance_idx = 0;
+  const size_t number_of_problems = coco_suite_get_number_of_problems(suite);
+  size_t index = (problem_index < 0) ? 0 : (size_t) problem_index + 1;
+
+  for (; index < number_of_problems; index++) {
+    coco_suite_decode_problem_index(suite, index, &function_idx, &dimension_idx, &instance_idx);
+    if ((suite->functions[function_idx] != 0) && (suite->dimensions[dimension_idx] != 0)
+        && (suite->instances[instance_idx] != 0))
+      return (long) index;
+  }
+
+  return -1;
+}
+
+/**
+ * Constructs the problem defined by the given indices and returns a copy of its ID (if return_name is 0) or
+ * its name (otherwise). This is the fallback for suites that cannot derive the strings without constructing
+ * the problem.
+ */
+static char *coco_suite_get_problem_string_from_indices(coco_suite_t *suite,
+                                                         const size_t function_idx,
+                                                         const size_t dimension_idx,
+                                                         const size_t instance_idx,
+                                                         const int return_name) {
+
+  coco_problem_t *problem;
+  char *result;
+
+  problem = coco_suite_get_problem_from_indices(suite, function_idx, dimension_idx, instance_idx);
+  result = coco_strdup(return_name ? coco_problem_get_name(problem) : coco_problem_get_id(problem));
+  coco_problem_free(problem);
+
+  return result;
+}
+
+/**
+ * The ID is derived from the suite definition and is the same as the ID of the problem returned by
+ * coco_suite_get_problem. Only suites without such a definition construct the problem to get its ID.
+ *
+ * @param suite The given suite.
+ * @param problem_index The index of the problem (should not have been filtered out through suite_options).
+ * @return The ID of the problem. The string is allocated and needs to be freed with coco_free_memory.
+ */
+char *coco_suite_get_problem_id(coco_suite_t *suite, const size_t problem_index) {
+
+  size_t function_idx = 0, dimension_idx = 0, instance_idx = 0;
+  coco_suite_decode_problem_index(suite, problem_index, &function_idx, &dimension_idx, &instance_idx);
+
+  if (strcmp(suite->suite_name, "bbob") == 0) {
+    return suite_bbob_get_problem_id(suite->functions[function_idx], suite->dimensions[dimension_idx],
+        suite->instances[instance_idx]);
+  } else if (strcmp(suite->suite_name, "bbob-largescale") == 0) {
+    return suite_largescale_get_problem_id(suite->functions[function_idx], suite->dimensions[dimension_idx],
+        suite->instances[instance_idx]);
+  } else if (strcmp(suite->suite_name, "bbob-biobj") == 0) {
+    return suite_biobj_get_problem_id(suite, function_idx, dimension_idx, instance_idx);
+  }
+
+  return coco_suite_get_problem_string_from_indices(suite, function_idx, dimension_idx, instance_idx, 0);
+}
+
+/**
+ * The name is derived from the suite definition and is the same as the name of the problem returned by
+ * coco_suite_get_problem. The problem is constructed only if the suite has no such definition or, for the
+ * bi-objective suite, if the instance is not known beforehand.
+ *
+ * @param suite The given suite.
+ * @param problem_index The index of the problem (should not have been filtered out through suite_options).
+ * @return The name of the problem. The string is allocated and needs to be freed with coco_free_memory.
+ */
+char *coco_suite_get_problem_name(coco_suite_t *suite, const size_t problem_index) {
+
+  size_t function_idx = 0, dimension_idx = 0, instance_idx = 0;
+  char *result = NULL;
+  coco_suite_decode_problem_index(suite, problem_index, &function_idx, &dimension_idx, &instance_idx);
+
+  if (strcmp(suite->suite_name, "bbob") == 0) {
+    result = suite_bbob_get_problem_name(suite->functions[function_idx], suite->dimensions[dimension_idx],
+        suite->instances[instance_idx]);
+  } else if (strcmp(suite->suite_name, "bbob-largescale") == 0) {
+    result = suite_largescale_get_problem_name(suite->functions[function_idx], suite->dimensions[dimension_idx],
+        suite->instances[instance_idx]);
+  } else if (strcmp(suite->suite_name, "bbob-biobj") == 0) {
+    result = suite_biobj_get_problem_name(suite, function_idx, dimension_idx, instance_idx);
+  }
+
+  if (result == NULL)
+    result = coco_suite_get_problem_string_from_indices(suite, function_idx, dimension_idx, instance_idx, 1);
+  return result;
+}
+
+/**
+ * @param suite The given suite.
+ * @param problem_index The index of the problem.
+ * @return The dimension of the problem.
+ */
+size_t coco_suite_get_problem_dimension(coco_suite_t *suite, const size_t problem_index) {
+
+  size_t function_idx = 0, dimension_idx = 0, instance_idx = 0;
+  coco_suite_decode_problem_index(suite, problem_index, &function_idx, &dimension_idx, &instance_idx);
+
+  return suite->dimensions[dimension_idx];
+}
+
+/**
+ * @param suite The given suite.
+ * @param problem_index The index of the problem.
+ * @return The number of objectives of the problem.
+ */
+size_t coco_suite_get_problem_number_of_objectives(coco_suite_t *suite, const size_t problem_index) {
+
+  (void) problem_index; /* All problems of a suite have the same number of objectives */
+  if (strcmp(suite->suite_name, "bbob-biobj") == 0)
+    return 2;
+  return 1;
+}
+
 static size_t *coco_suite_get_instance_indices(coco_suite_t *suite, const char *suite_instance) {
 
   int year = -1;
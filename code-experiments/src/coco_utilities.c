@@ -30,6 +30,7 @@ static int coco_options_read(const char *options, const char *name, const char *
 double coco_round_double(const double a);
 double coco_max_double(const double a, const double b);
 double coco_min_double(const double a, const double b);
+int coco_is_nan(const double x);
 /***********************************/
 
 void coco_join_path(char *path, size_t path_max_length, ...) {
@@ -380,11 +381,9 @@ static int coco_options_read_size_t(const char *options, const char *name, size_
  * - the value corresponding to the given name needs to be a double
  * Returns the number of successful assignments.
  */
-/* Commented to silence the compiler
 static int coco_options_read_double(const char *options, const char *name, double *pointer) {
-  return coco_options_read(options, name, "%f", pointer);
+  return coco_options_read(options, name, "%lf", pointer);
 }
-*/
 
 /**
  * Reads a string from options using the form "name1 : value1 name2: value2". Formatting requirements:
@@ -769,6 +768,13 @@ double coco_min_double(const double a, const double b) {
   }
 }
 
+/**
+ * Returns 1 if x is NaN and 0 otherwise (isnan is not contained in C89)
+ */
+int coco_is_nan(const double x) {
+  return (x != x);
+}
+
 /**
  * Returns 1 if |a - b| < accuracy and 0 otherwise
  */
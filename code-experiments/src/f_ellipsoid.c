@@ -151,6 +151,7 @@ static coco_problem_t *f_ellipsoid_permblockdiag_bbob_problem_allocate(const siz
   coco_problem_set_type(problem, "large_scale_block_rotated");/*TODO: no large scale prefix*/
 
   ls_free_block_matrix(B, dimension);
+  coco_free_memory(xopt);
   coco_free_memory(P1);
   coco_free_memory(P2);
   coco_free_memory(block_sizes);
@@ -13,8 +13,11 @@ typedef struct {
   long rseed;
   size_t number_of_peaks;
   double *xopt;
-  double **rotation, **x_local, **arr_scales;
+  double **rotation;
+  /* peaks sorted by decreasing peak value, the location and the scales of each peak stored contiguously */
+  double *x_local, *arr_scales;
   double *peak_values;
+  double *tmx; /* rotated x */
   coco_free_function_t old_free_problem;
 } f_gallagher_data_t;
 
@@ -30,9 +33,16 @@ static int f_gallagher_compare_doubles(const void *a, const void *b) {
   else
     return 0;
 }
+
+/**
+ * Comparison function used for sorting by decreasing value.
+ */
+static int f_gallagher_compare_doubles_decreasing(const void *a, const void *b) {
+  return f_gallagher_compare_doubles(b, a);
+}
 static double f_gallagher_raw(const double *x, const size_t number_of_variables, f_gallagher_data_t *data) {
   size_t i, j; /* Loop over dim */
-  double *tmx;
+  double *tmx = data->tmx;
   double a = 0.1;
   double tmp2, f = 0., Fadd, tmp, Fpen = 0., Ftrue = 0.;
   double fac;
@@ -50,7 +60,6 @@ static double f_gallagher_raw(const double *x, const size_t number_of_variables,
   Fadd = Fpen;
   /* Transformation in search space */
   /* TODO: this should rather be done in f_gallagher */
-  tmx = coco_allocate_vector(number_of_variables);
   for (i = 0; i < number_of_variables; i++) {
     tmx[i] = 0;
     for (j = 0; j < number_of_variables; ++j) {
@@ -59,10 +68,15 @@ static double f_gallagher_raw(const double *x, const size_t number_of_variables,
   }
   /* Computation core*/
   for (i = 0; i < data->number_of_peaks; ++i) {
+    const double *x_local = data->x_local + i * number_of_variables;
+    const double *arr_scales = data->arr_scales + i * number_of_variables;
+    /* A peak contributes at most its peak value, hence the remaining peaks cannot increase f */
+    if (data->peak_values[i] <= f)
+      break;
     tmp2 = 0.;
     for (j = 0; j < number_of_variables; ++j) {
-      tmp = (tmx[j] - data->x_local[j][i]);
-      tmp2 += data->arr_scales[i][j] * tmp * tmp;
+      tmp = (tmx[j] - x_local[j]);
+      tmp2 += arr_scales[j] * tmp * tmp;
     }
     tmp2 = data->peak_values[i] * exp(fac * tmp2);
     f = coco_max_double(f, tmp2);
@@ -81,7 +95,6 @@ static double f_gallagher_raw(const double *x, const size_t number_of_variables,
   Ftrue *= Ftrue;
   Ftrue += Fadd;
   result = Ftrue;
-  coco_free_memory(tmx);
   return result;
 }
 
@@ -96,9 +109,10 @@ static void f_gallagher_free(coco_problem_t *self) {
   data = self->data;
   coco_free_memory(data->xopt);
   coco_free_memory(data->peak_values);
+  coco_free_memory(data->x_local);
+  coco_free_memory(data->arr_scales);
+  coco_free_memory(data->tmx);
   bbob2009_free_matrix(data->rotation, self->number_of_variables);
-  bbob2009_free_matrix(data->x_local, self->number_of_variables);
-  bbob2009_free_matrix(data->arr_scales, data->number_of_peaks);
   self->free_problem = NULL;
   coco_problem_free(self);
 
@@ -127,12 +141,12 @@ static coco_problem_t *f_gallagher_bbob_problem_allocate(const size_t function,
   const size_t peaks_101 = 101;
 
   double fopt;
-  size_t i, j, k, *rperm;
+  size_t i, j, k, *rperm, *peak_order;
   double maxcondition = 1000.;
   /* maxcondition1 satisfies the old code and the doc but seems wrong in that it is, with very high
    * probability, not the largest condition level!!! */
   double maxcondition1 = 1000.;
-  double *arrCondition;
+  double *arrCondition, **x_local, **arr_scales, *peak_values;
   double fitvalues[2] = { 1.1, 9.1 };
   /* Parameters for generating local optima. In the old code, they are different in f21 and f22 */
   double b, c;
@@ -142,8 +156,12 @@ static coco_problem_t *f_gallagher_bbob_problem_allocate(const size_t function,
   data->number_of_peaks = number_of_peaks;
   data->xopt = coco_allocate_vector(dimension);
   data->rotation = bbob2009_allocate_matrix(dimension, dimension);
-  data->x_local = bbob2009_allocate_matrix(dimension, number_of_peaks);
-  data->arr_scales = bbob2009_allocate_matrix(number_of_peaks, dimension);
+  data->x_local = coco_allocate_vector(number_of_peaks * dimension);
+  data->arr_scales = coco_allocate_vector(number_of_peaks * dimension);
+  data->peak_values = coco_allocate_vector(number_of_peaks);
+  data->tmx = coco_allocate_vector(dimension);
+  x_local = bbob2009_allocate_matrix(dimension, number_of_peaks);
+  arr_scales = bbob2009_allocate_matrix(number_of_peaks, dimension);
 
   if (number_of_peaks == peaks_101) {
     if (gallagher_peaks != NULL)
@@ -174,11 +192,11 @@ static coco_problem_t *f_gallagher_bbob_problem_allocate(const size_t function,
   /* Random permutation */
   arrCondition = coco_allocate_vector(number_of_peaks);
   arrCondition[0] = maxcondition1;
-  data->peak_values = coco_allocate_vector(number_of_peaks);
-  data->peak_values[0] = 10;
+  peak_values = coco_allocate_vector(number_of_peaks);
+  peak_values[0] = 10;
   for (i = 1; i < number_of_peaks; ++i) {
     arrCondition[i] = pow(maxcondition, (double) (rperm[i - 1]) / ((double) (number_of_peaks - 2)));
-    data->peak_values[i] = (double) (i - 1) / (double) (number_of_peaks - 2) * (fitvalues[1] - fitvalues[0])
+    peak_values[i] = (double) (i - 1) / (double) (number_of_peaks - 2) * (fitvalues[1] - fitvalues[0])
         + fitvalues[0];
   }
   coco_free_memory(rperm);
@@ -190,7 +208,7 @@ static coco_problem_t *f_gallagher_bbob_problem_allocate(const size_t function,
       rperm[j] = j;
     qsort(rperm, dimension, sizeof(size_t), f_gallagher_compare_doubles);
     for (j = 0; j < dimension; ++j) {
-      data->arr_scales[i][j] = pow(arrCondition[i],
+      arr_scales[i][j] = pow(arrCondition[i],
           ((double) rperm[j]) / ((double) (dimension - 1)) - 0.5);
     }
   }
@@ -201,17 +219,37 @@ static coco_problem_t *f_gallagher_bbob_problem_allocate(const size_t function,
     data->xopt[i] = 0.8 * (b * gallagher_peaks[i] - c);
     problem->best_parameter[i] = 0.8 * (b * gallagher_peaks[i] - c);
     for (j = 0; j < number_of_peaks; ++j) {
-      data->x_local[i][j] = 0.;
+      x_local[i][j] = 0.;
       for (k = 0; k < dimension; ++k) {
-        data->x_local[i][j] += data->rotation[i][k] * (b * gallagher_peaks[j * dimension + k] - c);
+        x_local[i][j] += data->rotation[i][k] * (b * gallagher_peaks[j * dimension + k] - c);
       }
       if (j == 0) {
-        data->x_local[i][j] *= 0.8;
+        x_local[i][j] *= 0.8;
       }
     }
   }
   coco_free_memory(arrCondition);
 
+  /* Store the peaks by decreasing peak value, such that f_gallagher_raw can stop early */
+  peak_order = (size_t *) coco_allocate_memory(number_of_peaks * sizeof(size_t));
+  for (i = 0; i < number_of_peaks; ++i)
+    peak_order[i] = i;
+  coco_free_memory(gallagher_peaks);
+  gallagher_peaks = peak_values; /* the values compared by f_gallagher_compare_doubles */
+  qsort(peak_order, number_of_peaks, sizeof(size_t), f_gallagher_compare_doubles_decreasing);
+  gallagher_peaks = NULL;
+  for (i = 0; i < number_of_peaks; ++i) {
+    data->peak_values[i] = peak_values[peak_order[i]];
+    for (j = 0; j < dimension; ++j) {
+      data->x_local[i * dimension + j] = x_local[j][peak_order[i]];
+      data->arr_scales[i * dimension + j] = arr_scales[peak_order[i]][j];
+    }
+  }
+  coco_free_memory(peak_order);
+  coco_free_memory(peak_values);
+  bbob2009_free_matrix(x_local, dimension);
+  bbob2009_free_matrix(arr_scales, number_of_peaks);
+
   problem->data = data;
 
   /* Compute best solution */
@@ -7,9 +7,9 @@
 #include "transform_obj_shift.c"
 
 typedef struct {
-  double *x_hat, *z;
+  double *x_hat, *z, *tmpvect;
   double *xopt, fopt;
-  double **rot1, **rot2;
+  double **rot1, **rot2; /* rot2 is stored with its rows scaled by the conditioning */
   long rseed;
   coco_free_function_t old_free_problem;
 } f_lunacek_bi_rastrigin_data_t;
@@ -18,14 +18,13 @@ static double f_lunacek_bi_rastrigin_raw(const double *x,
                                          const size_t number_of_variables,
                                          f_lunacek_bi_rastrigin_data_t *data) {
   double result;
-  static const double condition = 100.;
   size_t i, j;
   double penalty = 0.0;
   static const double mu0 = 2.5;
   static const double d = 1.;
   const double s = 1. - 0.5 / (sqrt((double) (number_of_variables + 20)) - 4.1);
   const double mu1 = -sqrt((mu0 * mu0 - d) / s);
-  double *tmpvect, sum1 = 0., sum2 = 0., sum3 = 0.;
+  double *tmpvect = data->tmpvect, sum1 = 0., sum2 = 0., sum3 = 0.;
 
   assert(number_of_variables > 1);
 
@@ -44,14 +43,11 @@ static double f_lunacek_bi_rastrigin_raw(const double *x,
     }
   }
 
-  tmpvect = coco_allocate_vector(number_of_variables);
   /* affine transformation */
   for (i = 0; i < number_of_variables; ++i) {
-    double c1;
     tmpvect[i] = 0.0;
-    c1 = pow(sqrt(condition), ((double) i) / (double) (number_of_variables - 1));
     for (j = 0; j < number_of_variables; ++j) {
-      tmpvect[i] += c1 * data->rot2[i][j] * (data->x_hat[j] - mu0);
+      tmpvect[i] += data->rot2[i][j] * (data->x_hat[j] - mu0);
     }
   }
   for (i = 0; i < number_of_variables; ++i) {
@@ -68,7 +64,6 @@ static double f_lunacek_bi_rastrigin_raw(const double *x,
   }
   result = coco_min_double(sum1, d * (double) number_of_variables + s * sum2)
       + 10. * ((double) number_of_variables - sum3) + 1e4 * penalty;
-  coco_free_memory(tmpvect);
 
   return result;
 }
@@ -83,6 +78,7 @@ static void f_lunacek_bi_rastrigin_free(coco_problem_t *self) {
   data = self->data;
   coco_free_memory(data->x_hat);
   coco_free_memory(data->z);
+  coco_free_memory(data->tmpvect);
   coco_free_memory(data->xopt);
   bbob2009_free_matrix(data->rot1, self->number_of_variables);
   bbob2009_free_matrix(data->rot2, self->number_of_variables);
@@ -108,14 +104,16 @@ static coco_problem_t *f_lunacek_bi_rastrigin_bbob_problem_allocate(const size_t
       f_lunacek_bi_rastrigin_evaluate, f_lunacek_bi_rastrigin_free, dimension, -5.0, 5.0, 0.0);
 
   const double mu0 = 2.5;
+  const double condition = 100.;
 
   double fopt, *tmpvect;
-  size_t i;
+  size_t i, j;
 
   data = coco_allocate_memory(sizeof(*data));
   /* Allocate temporary storage and space for the rotation matrices */
   data->x_hat = coco_allocate_vector(dimension);
   data->z = coco_allocate_vector(dimension);
+  data->tmpvect = coco_allocate_vector(dimension);
   data->xopt = coco_allocate_vector(dimension);
   data->rot1 = bbob2009_allocate_matrix(dimension, dimension);
   data->rot2 = bbob2009_allocate_matrix(dimension, dimension);
@@ -125,6 +123,12 @@ static coco_problem_t *f_lunacek_bi_rastrigin_bbob_problem_allocate(const size_t
   bbob2009_compute_xopt(data->xopt, rseed, dimension);
   bbob2009_compute_rotation(data->rot1, rseed + 1000000, dimension);
   bbob2009_compute_rotation(data->rot2, rseed, dimension);
+  for (i = 0; i < dimension; ++i) {
+    const double c1 = pow(sqrt(condition), ((double) i) / (double) (dimension - 1));
+    for (j = 0; j < dimension; ++j) {
+      data->rot2[i][j] *= c1;
+    }
+  }
 
   problem->data = data;
 
@@ -182,6 +182,8 @@ static void ls_compute_random_permutation(size_t *P, long seed, size_t n) {
     random_data[i] = coco_random_uniform(rng);
   }
   qsort(P, n, sizeof(size_t), f_compare_doubles_for_random_permutation);
+  coco_free_memory(random_data);
+  random_data = NULL;
   coco_random_free(rng);
 }
 
@@ -248,10 +250,16 @@ static void ls_compute_truncated_uniform_swap_permutation(size_t *P, long seed,
   } else {
     if ( swap_range == (size_t) -1) {
       /* generate random permutation instead */
+      coco_free_memory(random_data);
       ls_compute_random_permutation(P, seed, n);
     }
     
   }
+  if (random_data != NULL) {
+    coco_free_memory(random_data);
+    random_data = NULL;
+  }
+  coco_free_memory(idx_order);
   coco_random_free(rng);
 }
 
@@ -4,6 +4,7 @@
 #include <float.h>
 #include <math.h>
 #include <errno.h>
+#include <time.h>
 
 #include "coco.h"
 
@@ -36,6 +37,11 @@ static size_t bbob_dimensions_in_current_infoFile[6] = { 0, 0, 0, 0, 0, 0 }; /*
  */
 static int bbob_logger_is_open = 0; /* this could become lock-list of .info files */
 
+/* size of the stdio buffer of the data files */
+#define LOGGER_BBOB_BUFFER_SIZE 65536
+/* maximal length of a line of a text data file, see logger_bbob_write_data */
+#define LOGGER_BBOB_MAX_LINE_LENGTH 512
+
 /* TODO: add possibility of adding a prefix to the index files (easy to do through observer options) */
 
 typedef struct {
@@ -56,6 +62,10 @@ typedef struct {
   double best_fvalue;
   double last_fvalue;
   short written_last_eval; /* allows writing the the data of the final fun eval in the .tdat file if not already written by the t_trigger*/
+  short is_flushed; /* whether all data written to the data files has been flushed */
+  size_t fdata_x_trigger; /* next evaluation that triggers logging x in the .dat file with log_x: sparse */
+  size_t tdata_x_trigger; /* next evaluation that triggers logging x in the .tdat file with log_x: sparse */
+  time_t last_flush; /* time of the last flush with the interval flush policy */
   double *best_solution;
   /* The following are to only pass data as a parameter in the free function. The
    * interface should probably be the same for all free functions so passing the
@@ -117,7 +127,7 @@ static void logger_bbob_update_t_trigger(logger_bbob_t *logger, size_t number_of
 }
 
 /**
- * adds a formated line to a data file
+ * adds a formated line to a data file, the decision variables are omitted if x is NULL
  */
 static void logger_bbob_write_data(FILE *target_file,
                                    size_t number_of_evaluations,
@@ -126,18 +136,115 @@ static void logger_bbob_write_data(FILE *target_file,
                                    double best_value,
                                    const double *x,
                                    size_t number_of_variables) {
+  /* The line is formatted in memory and written at once, at most 21 + 4 * 18 + 21 * 13 + 2 characters */
+  char line[LOGGER_BBOB_MAX_LINE_LENGTH];
+  char *end = line;
   /* for some reason, it's %.0f in the old code instead of the 10.9e
    * in the documentation
    */
-  fprintf(target_file, "%ld %+10.9e %+10.9e %+10.9e %+10.9e", number_of_evaluations, fvalue - best_value,
+  end += sprintf(end, "%ld %+10.9e %+10.9e %+10.9e %+10.9e", number_of_evaluations, fvalue - best_value,
       best_fvalue - best_value, fvalue, best_fvalue);
-  if (number_of_variables < 22) {
+  if (x != NULL && number_of_variables < 22) {
     size_t i;
     for (i = 0; i < number_of_variables; i++) {
-      fprintf(target_file, " %+5.4e", x[i]);
+      end += sprintf(end, " %+5.4e", x[i]);
     }
   }
-  fprintf(target_file, "\n");
+  *end++ = '\n';
+  fwrite(line, sizeof(char), (size_t) (end - line), target_file);
+}
+
+/**
+ * adds a line to a binary data file: the number of evaluations and the four f-values of the
+ * formatted line as doubles, without decision variables
+ */
+static void logger_bbob_write_data_binary(FILE *target_file,
+                                          size_t number_of_evaluations,
+                                          double fvalue,
+                                          double best_fvalue,
+                                          double best_value) {
+  double line[5];
+  line[0] = (double) number_of_evaluations;
+  line[1] = fvalue - best_value;
+  line[2] = best_fvalue - best_value;
+  line[3] = fvalue;
+  line[4] = best_fvalue;
+  fwrite(line, sizeof(double), 5, target_file);
+}
+
+/**
+ * returns the decision variables x to be added to the next line of a data file according to the log_x
+ * option of the observer or NULL, where x_trigger is the next evaluation of the sparse schedule of the
+ * data file and is_final tells whether the line is the final line of the run
+ */
+static const double *logger_bbob_log_x(logger_bbob_t *logger,
+                                       size_t *x_trigger,
+                                       const int is_final,
+                                       const double *x) {
+  if (logger->observer->log_x_mode == COCO_OBSERVER_LOG_X_FINAL && !is_final)
+    return NULL;
+  if (logger->observer->log_x_mode == COCO_OBSERVER_LOG_X_SPARSE) {
+    if (logger->number_of_evaluations < *x_trigger)
+      return NULL;
+    *x_trigger = coco_observer_next_evaluation_to_log(logger->number_of_evaluations,
+        logger->number_of_variables);
+  }
+  return x;
+}
+
+/**
+ * adds a line to the data file in the format of the observer
+ */
+static void logger_bbob_write_line(logger_bbob_t *logger,
+                                   FILE *target_file,
+                                   double fvalue,
+                                   const double *x) {
+  observer_bbob_t *observer_bbob = (observer_bbob_t *) logger->observer->data;
+  if (observer_bbob->binary_format) {
+    logger_bbob_write_data_binary(target_file, logger->number_of_evaluations, fvalue, logger->best_fvalue,
+        logger->optimal_fvalue);
+  } else {
+    logger_bbob_write_data(target_file, logger->number_of_evaluations, fvalue, logger->best_fvalue,
+        logger->optimal_fvalue, x, logger->number_of_variables);
+  }
+  logger->is_flushed = 0;
+}
+
+/**
+ * flushes the data files if data was written since the last flush and the flush policy of the
+ * observer asks for it
+ */
+static void logger_bbob_flush(logger_bbob_t *logger) {
+  observer_bbob_t *observer_bbob = (observer_bbob_t *) logger->observer->data;
+  time_t now;
+
+  if (logger->is_flushed || observer_bbob->flush_policy == OBSERVER_BBOB_FLUSH_END)
+    return;
+  if (observer_bbob->flush_policy == OBSERVER_BBOB_FLUSH_INTERVAL) {
+    now = time(NULL);
+    if (difftime(now, logger->last_flush) < observer_bbob->flush_interval)
+      return;
+    logger->last_flush = now;
+  }
+  fflush(logger->fdata_file);
+  fflush(logger->tdata_file);
+  fflush(logger->rdata_file);
+  logger->is_flushed = 1;
+}
+
+/**
+ * starts a new run in a data file, with a header line in the text format and with a line
+ * with 0 evaluations and the optimal f-value in the binary format
+ */
+static void logger_bbob_write_header(logger_bbob_t *logger, FILE *target_file) {
+  observer_bbob_t *observer_bbob = (observer_bbob_t *) logger->observer->data;
+  if (observer_bbob->binary_format) {
+    double line[5] = { 0, 0, 0, 0, 0 };
+    line[1] = logger->optimal_fvalue;
+    fwrite(line, sizeof(double), 5, target_file);
+  } else {
+    fprintf(target_file, bbob_file_header_str, logger->optimal_fvalue);
+  }
 }
 
 /**
@@ -155,13 +262,14 @@ static void logger_bbob_error_io(FILE *path, int errnum) {
 /*
  calling sequence:
  logger_bbob_open_dataFile(&(logger->fdata_file), logger->observer->output_folder, dataFile_path,
- ".dat");
+ ".dat", 0);
  */
 
 static void logger_bbob_open_dataFile(FILE **target_file,
                                       const char *path,
                                       const char *dataFile_path,
-                                      const char *file_extension) {
+                                      const char *file_extension,
+                                      int binary) {
   char file_path[COCO_PATH_MAX] = { 0 };
   char relative_filePath[COCO_PATH_MAX] = { 0 };
   int errnum;
@@ -171,11 +279,13 @@ static void logger_bbob_open_dataFile(FILE **target_file,
   COCO_PATH_MAX - strlen(relative_filePath) - 1);
   coco_join_path(file_path, sizeof(file_path), path, relative_filePath, NULL);
   if (*target_file == NULL) {
-    *target_file = fopen(file_path, "a+");
+    *target_file = fopen(file_path, binary ? "ab+" : "a+");
     errnum = errno;
     if (*target_file == NULL) {
       logger_bbob_error_io(*target_file, errnum);
     }
+    /* Batch the writes into few system calls, the flush policy decides when the data is written */
+    setvbuf(*target_file, NULL, _IOFBF, LOGGER_BBOB_BUFFER_SIZE);
   }
 }
 
@@ -273,7 +383,8 @@ static void logger_bbob_openIndexFile(logger_bbob_t *logger,
           for (j = 0; j < bbob_number_of_dimensions; j++) { /* new info file, reinitialize list of dims */
             bbob_dimensions_in_current_infoFile[j] = 0;
           }
-          bbob_dimensions_in_current_infoFile[i] = logger->number_of_variables;
+          /* i may be bbob_number_of_dimensions if the suite has more dimensions */
+          bbob_dimensions_in_current_infoFile[0] = logger->number_of_variables;
         }
       } else {
         if ( bbob_current_funId != logger->function_id ) {
@@ -300,7 +411,8 @@ static void logger_bbob_openIndexFile(logger_bbob_t *logger,
       strncat(used_dataFile_path, "_i", COCO_PATH_MAX - strlen(used_dataFile_path) - 1);
       strncat(used_dataFile_path, bbob_infoFile_firstInstance_char,
       COCO_PATH_MAX - strlen(used_dataFile_path) - 1);
-      fprintf(*target_file, "%s.dat", used_dataFile_path); /* dataFile_path does not have the extension */
+      fprintf(*target_file, "%s%s", used_dataFile_path, /* dataFile_path does not have the extension */
+          ((observer_bbob_t *) logger->observer->data)->binary_format ? ".bdat" : ".dat");
       bbob_current_dim = logger->number_of_variables;
       bbob_current_funId = logger->function_id;
     }
@@ -321,9 +433,11 @@ static void logger_bbob_initialize(logger_bbob_t *logger, coco_problem_t *inner_
   char *tmpc_dim; /* serves to extract the dimension as a char *. There should be a better way of doing this! */
   char indexFile_prefix[10] = "bbobexp"; /* TODO (minor): make the prefix bbobexp a parameter that the user can modify */
   size_t str_length_funId, str_length_dim;
+  int binary = ((observer_bbob_t *) logger->observer->data)->binary_format;
   
-  str_length_funId = (size_t) bbob2009_fmax(1, ceil(log10((double) coco_problem_get_suite_dep_function(inner_problem))));
-  str_length_dim = (size_t) bbob2009_fmax(1, ceil(log10((double) inner_problem->number_of_variables)));
+  /* number of digits plus the terminating zero */
+  str_length_funId = (size_t) bbob2009_fmax(1, floor(log10((double) coco_problem_get_suite_dep_function(inner_problem))) + 1) + 1;
+  str_length_dim = (size_t) bbob2009_fmax(1, floor(log10((double) inner_problem->number_of_variables)) + 1) + 1;
   tmpc_funId = (char *) coco_allocate_memory(str_length_funId *  sizeof(char));
   tmpc_dim = (char *) coco_allocate_memory(str_length_dim *  sizeof(char));
 
@@ -357,14 +471,18 @@ static void logger_bbob_initialize(logger_bbob_t *logger, coco_problem_t *inner_
   strncat(dataFile_path, "_i", COCO_PATH_MAX - strlen(dataFile_path) - 1);
   strncat(dataFile_path, bbob_infoFile_firstInstance_char,
   COCO_PATH_MAX - strlen(dataFile_path) - 1);
-  logger_bbob_open_dataFile(&(logger->fdata_file), logger->observer->output_folder, dataFile_path, ".dat");
-  fprintf(logger->fdata_file, bbob_file_header_str, logger->optimal_fvalue);
+  logger_bbob_open_dataFile(&(logger->fdata_file), logger->observer->output_folder, dataFile_path,
+      binary ? ".bdat" : ".dat", binary);
+  logger_bbob_write_header(logger, logger->fdata_file);
 
-  logger_bbob_open_dataFile(&(logger->tdata_file), logger->observer->output_folder, dataFile_path, ".tdat");
-  fprintf(logger->tdata_file, bbob_file_header_str, logger->optimal_fvalue);
+  logger_bbob_open_dataFile(&(logger->tdata_file), logger->observer->output_folder, dataFile_path,
+      binary ? ".btdat" : ".tdat", binary);
+  logger_bbob_write_header(logger, logger->tdata_file);
 
-  logger_bbob_open_dataFile(&(logger->rdata_file), logger->observer->output_folder, dataFile_path, ".rdat");
+  logger_bbob_open_dataFile(&(logger->rdata_file), logger->observer->output_folder, dataFile_path, ".rdat", 0);
   fprintf(logger->rdata_file, bbob_file_header_str, logger->optimal_fvalue);
+  logger->is_flushed = 0;
+  logger->last_flush = time(NULL);
   logger->is_initialized = 1;
   coco_free_memory(tmpc_dim);
   coco_free_memory(tmpc_funId);
@@ -405,28 +523,28 @@ static void logger_bbob_evaluate(coco_problem_t *self, const double *x, double *
   /* Add a line in the .dat file for each logging target reached. */
   if (y[0] - logger->optimal_fvalue <= logger->f_trigger) {
 
-    logger_bbob_write_data(logger->fdata_file, logger->number_of_evaluations, y[0], logger->best_fvalue,
-        logger->optimal_fvalue, x, self->number_of_variables);
+    logger_bbob_write_line(logger, logger->fdata_file, y[0],
+        logger_bbob_log_x(logger, &logger->fdata_x_trigger, 0, x));
     logger_bbob_update_f_trigger(logger, y[0]);
   }
 
   /* Add a line in the .tdat file each time an fevals trigger is reached.*/
   if (logger->number_of_evaluations >= logger->t_trigger) {
     logger->written_last_eval = 1;
-    logger_bbob_write_data(logger->tdata_file, logger->number_of_evaluations, y[0], logger->best_fvalue,
-        logger->optimal_fvalue, x, self->number_of_variables);
+    logger_bbob_write_line(logger, logger->tdata_file, y[0],
+        logger_bbob_log_x(logger, &logger->tdata_x_trigger, 0, x));
     logger_bbob_update_t_trigger(logger, self->number_of_variables);
   } else {
     /* Add a line in the .tdat file each time a dimension-depended trigger is reached.*/
     if ((coco_observer_evaluation_to_log(logger->number_of_evaluations, self->number_of_variables))) {
       logger->written_last_eval = 1;
-      logger_bbob_write_data(logger->tdata_file, logger->number_of_evaluations, y[0], logger->best_fvalue,
-                             logger->optimal_fvalue, x, self->number_of_variables);
+      logger_bbob_write_line(logger, logger->tdata_file, y[0],
+          logger_bbob_log_x(logger, &logger->tdata_x_trigger, 0, x));
     }
   }
 
   /* Flush output so that impatient users can see progress. */
-  fflush(logger->fdata_file);
+  logger_bbob_flush(logger);
 }
 
 /**
@@ -462,9 +580,12 @@ static void logger_bbob_free(void *stuff) {
      * instance. Maybe start with forcing it to generate a new
      * "instance" of problem for each restart in the beginning
      */
-    if (!logger->written_last_eval) {
-      logger_bbob_write_data(logger->tdata_file, logger->number_of_evaluations, logger->last_fvalue,
-          logger->best_fvalue, logger->optimal_fvalue, logger->best_solution, logger->number_of_variables);
+    observer_bbob_t *observer_bbob = (observer_bbob_t *) logger->observer->data;
+    /* With log_x: final, the last line is repeated with the best solution if it was already written */
+    if (!logger->written_last_eval
+        || (logger->observer->log_x_mode == COCO_OBSERVER_LOG_X_FINAL && !observer_bbob->binary_format)) {
+      logger_bbob_write_line(logger, logger->tdata_file, logger->last_fvalue,
+          logger_bbob_log_x(logger, &logger->tdata_x_trigger, 1, logger->best_solution));
     }
     fclose(logger->tdata_file);
     logger->tdata_file = NULL;
@@ -519,6 +640,8 @@ static coco_problem_t *logger_bbob(coco_observer_t *observer, coco_problem_t *pr
   logger->f_trigger = DBL_MAX;
   logger->t_trigger = 0;
   logger->number_of_evaluations = 0;
+  logger->fdata_x_trigger = 1;
+  logger->tdata_x_trigger = 1;
   logger->best_solution = coco_allocate_vector(problem->number_of_variables);
   /* TODO: the following inits are just to be in the safe side and
    * should eventually be removed. Some fields of the bbob_logger struct
@@ -1,6 +1,7 @@
 #include <stdio.h>
 #include <string.h>
 #include <assert.h>
+#include <float.h>
 
 #include "coco.h"
 #include "coco_internal.h"
@@ -53,9 +54,15 @@ typedef struct {
   observer_biobj_log_nondom_e log_nondom_mode;
   /* File for logging nondominated solutions (either all or final) */
   FILE *nondom_file;
+  /* File for logging the final nondominated solutions if all are logged without decision variables */
+  FILE *final_nondom_file;
 
   /* Whether to log the decision variables */
   int log_vars;
+  /* Which solutions are logged with their decision variables (the log_x option of the observer) */
+  int log_x_mode;
+  /* The next evaluation that triggers logging the decision variables with log_x: sparse */
+  size_t x_trigger;
   int precision_x;
   int precision_f;
 
@@ -66,8 +73,6 @@ typedef struct {
 
   /* The tree keeping currently non-dominated solutions */
   avl_tree_t *archive_tree;
-  /* The tree with pointers to nondominated solutions that haven't been logged yet */
-  avl_tree_t *buffer_tree;
 
   /* Indicators (TODO: Implement others!) */
   int compute_indicators;
@@ -176,7 +181,7 @@ static int avl_tree_compare_by_last_objective(const logger_biobj_avl_item_t *ite
 static int avl_tree_compare_by_time_stamp(const logger_biobj_avl_item_t *item1,
                                           const logger_biobj_avl_item_t *item2,
                                           void *userdata) {
-  /* This ordering is used by the buffer_tree. */
+  /* This ordering is used to output the final archive. */
 
   if (item1->time_stamp < item2->time_stamp)
     return -1;
@@ -188,6 +193,28 @@ static int avl_tree_compare_by_time_stamp(const logger_biobj_avl_item_t *item1,
   (void) userdata; /* To silence the compiler */
 }
 
+/**
+ * Outputs the given solution to the given file.
+ */
+static void logger_biobj_output_solution(FILE *file,
+                                         const logger_biobj_avl_item_t *item,
+                                         const size_t dim,
+                                         const size_t num_obj,
+                                         const int log_vars,
+                                         const int precision_x,
+                                         const int precision_f) {
+  size_t i;
+
+  fprintf(file, "%lu\t", item->time_stamp);
+  for (i = 0; i < num_obj; i++)
+    fprintf(file, "%.*e\t", precision_f, item->y[i]);
+  if (log_vars) {
+    for (i = 0; i < dim; i++)
+      fprintf(file, "%.*e\t", precision_x, item->x[i]);
+  }
+  fprintf(file, "\n");
+}
+
 /**
  * Outputs the AVL tree to the given file. Returns the number of nodes in the tree.
  */
@@ -200,176 +227,137 @@ static size_t logger_biobj_tree_output(FILE *file,
                                        const int precision_f) {
 
   avl_node_t *solution;
-  size_t i;
-  size_t j;
   size_t number_of_nodes = 0;
 
-  if (tree->tail) {
-    /* There is at least a solution in the tree to output */
-    solution = tree->head;
-    while (solution != NULL) {
-      fprintf(file, "%lu\t", ((logger_biobj_avl_item_t*) solution->item)->time_stamp);
-      for (j = 0; j < num_obj; j++)
-        fprintf(file, "%.*e\t", precision_f, ((logger_biobj_avl_item_t*) solution->item)->y[j]);
-      if (log_vars) {
-        for (i = 0; i < dim; i++)
-          fprintf(file, "%.*e\t", precision_x, ((logger_biobj_avl_item_t*) solution->item)->x[i]);
-      }
-      fprintf(file, "\n");
-      solution = solution->next;
-      number_of_nodes++;
-    }
+  for (solution = tree->head; solution != NULL; solution = solution->next) {
+    logger_biobj_output_solution(file, (logger_biobj_avl_item_t*) solution->item, dim, num_obj, log_vars,
+        precision_x, precision_f);
+    number_of_nodes++;
   }
 
   return number_of_nodes;
 }
 
 /**
- * Checks for domination and updates the archive tree and the values of the indicators if the given node is
- * not weakly dominated by existing nodes in the archive tree.
- * Returns 1 if the update was performed and 0 otherwise.
+ * Returns the hypervolume contribution of the solution with objective vector y, whose left neighbor in the
+ * archive (or the reference point if there is none within the ROI) has the first objective left_y0. The
+ * contribution is normalized with the distance between the ideal and the nadir point.
+ */
+static double logger_biobj_hyp_contribution(const coco_problem_t *problem, const double left_y0, const double *y) {
+  return (left_y0 - y[0]) / (problem->nadir_value[0] - problem->best_value[0])
+      * (problem->nadir_value[1] - y[1]) / (problem->nadir_value[1] - problem->best_value[1]);
+}
+
+/**
+ * Removes the given node, which is dominated by a new solution, from the archive tree and subtracts its
+ * contributions from the indicator values.
  */
-static int logger_biobj_tree_update(logger_biobj_t *logger,
-                                    coco_problem_t *problem,
-                                    logger_biobj_avl_item_t *node_item) {
+static void logger_biobj_tree_remove(logger_biobj_t *logger, avl_node_t *node) {
+  size_t i;
+
+  if (logger->compute_indicators) {
+    for (i = 0; i < OBSERVER_BIOBJ_NUMBER_OF_INDICATORS; i++) {
+      logger->indicators[i]->current_value -= ((logger_biobj_avl_item_t*) node->item)->indicator_contribution[i];
+    }
+  }
+  avl_node_delete(logger->archive_tree, node);
+}
+
+/**
+ * Checks for domination and updates the archive tree and the values of the indicators if the given solution
+ * is not weakly dominated by existing solutions in the archive tree. Returns the new archive item of the
+ * solution if the update was performed and NULL otherwise (in which case nothing is allocated).
+ *
+ * The archive is sorted by the second objective, hence by decreasing first objective. An update costs
+ * O(log n) for the search and the insertion plus O(1) for each removed solution, which is amortized by its
+ * insertion. Only the hypervolume contributions of the new solution and of its right neighbor change, as
+ * the contribution of a solution is the rectangle between it, its left neighbor and the reference point.
+ */
+static logger_biobj_avl_item_t *logger_biobj_tree_update(logger_biobj_t *logger,
+                                                         coco_problem_t *problem,
+                                                         const double *x,
+                                                         const double *y,
+                                                         const size_t time_stamp) {
 
   avl_node_t *node, *next_node, *new_node;
-  int trigger_update = 0;
+  logger_biobj_avl_item_t search_item, *node_item;
   int dominance;
   size_t i;
-  int previous_unavailable = 0;
 
   /* Find the first point that is not worse than the new point (NULL if such point does not exist) */
-  node = avl_item_search_right(logger->archive_tree, node_item, NULL);
+  search_item.y = (double *) y; /* only used for comparisons */
+  node = avl_item_search_right(logger->archive_tree, &search_item, NULL);
 
   if (node == NULL) {
     /* The new point is an extremal point */
-    trigger_update = 1;
     next_node = logger->archive_tree->head;
   } else {
-    dominance = mo_get_dominance(node_item->y, ((logger_biobj_avl_item_t*) node->item)->y,
-        logger->number_of_objectives);
-    if (dominance > -1) {
-      trigger_update = 1;
-      next_node = node->next;
-      if (dominance == 1) {
-        /* The new point dominates the next point, remove the next point */
-        if (logger->compute_indicators) {
-          for (i = 0; i < OBSERVER_BIOBJ_NUMBER_OF_INDICATORS; i++) {
-            logger->indicators[i]->current_value -= ((logger_biobj_avl_item_t*) node->item)->indicator_contribution[i];
-          }
-        }
-        avl_item_delete(logger->buffer_tree, node->item);
-        avl_node_delete(logger->archive_tree, node);
-      }
-    } else {
+    dominance = mo_get_dominance(y, ((logger_biobj_avl_item_t*) node->item)->y, logger->number_of_objectives);
+    if (dominance <= -1) {
       /* The new point is dominated, nothing more to do */
-      trigger_update = 0;
+      return NULL;
+    }
+    next_node = node->next;
+    if (dominance == 1) {
+      /* The new point dominates the next point, remove the next point */
+      logger_biobj_tree_remove(logger, node);
     }
   }
 
-  if (!trigger_update) {
-    logger_biobj_node_free(node_item, NULL);
-  } else {
-    /* Perform tree update */
-    while (next_node != NULL) {
-      /* Check the dominance relation between the new node and the next node. There are only two possibilities:
-       * dominance = 0: the new node and the next node are nondominated
-       * dominance = 1: the new node dominates the next node */
-      node = next_node;
-      dominance = mo_get_dominance(node_item->y, ((logger_biobj_avl_item_t*) node->item)->y,
-          logger->number_of_objectives);
-      if (dominance == 1) {
-        /* The new point dominates the next point, remove the next point */
-        if (logger->compute_indicators) {
-          for (i = 0; i < OBSERVER_BIOBJ_NUMBER_OF_INDICATORS; i++) {
-            logger->indicators[i]->current_value -= ((logger_biobj_avl_item_t*) node->item)->indicator_contribution[i];
-          }
-        }
-        next_node = node->next;
-        avl_item_delete(logger->buffer_tree, node->item);
-        avl_node_delete(logger->archive_tree, node);
-      } else {
-        break;
-      }
+  /* Perform tree update */
+  while (next_node != NULL) {
+    /* Check the dominance relation between the new node and the next node. There are only two possibilities:
+     * dominance = 0: the new node and the next node are nondominated
+     * dominance = 1: the new node dominates the next node */
+    node = next_node;
+    dominance = mo_get_dominance(y, ((logger_biobj_avl_item_t*) node->item)->y, logger->number_of_objectives);
+    if (dominance == 1) {
+      /* The new point dominates the next point, remove the next point */
+      next_node = node->next;
+      logger_biobj_tree_remove(logger, node);
+    } else {
+      break;
     }
+  }
 
-    new_node = avl_item_insert(logger->archive_tree, node_item);
-    avl_item_insert(logger->buffer_tree, node_item);
-
-    if (logger->compute_indicators) {
-      logger_biobj_check_if_within_ROI(problem, new_node);
-      if (node_item->within_ROI) {
-        /* Compute indicator value for new node and update the indicator value of the affected nodes */
-        logger_biobj_avl_item_t *next_item, *previous_item;
-
-        if (new_node->next != NULL) {
-          next_item = (logger_biobj_avl_item_t*) new_node->next->item;
-          if (next_item->within_ROI) {
-            for (i = 0; i < OBSERVER_BIOBJ_NUMBER_OF_INDICATORS; i++) {
-              logger->indicators[i]->current_value -= next_item->indicator_contribution[i];
-              if (strcmp(logger->indicators[i]->name, "hyp") == 0) {
-                next_item->indicator_contribution[i] = (node_item->y[0] - next_item->y[0])
-                    / (problem->nadir_value[0] - problem->best_value[0])
-                    * (problem->nadir_value[1] - next_item->y[1])
-                    / (problem->nadir_value[1] - problem->best_value[1]);
-              } else {
-                coco_error(
-                    "logger_biobj_tree_update(): Indicator computation not implemented yet for indicator %s",
-                    logger->indicators[i]->name);
-              }
-              logger->indicators[i]->current_value += next_item->indicator_contribution[i];
-            }
-          }
-        }
-
-        previous_unavailable = 0;
-        if (new_node->prev != NULL) {
-          previous_item = (logger_biobj_avl_item_t*) new_node->prev->item;
-          if (previous_item->within_ROI) {
-            for (i = 0; i < OBSERVER_BIOBJ_NUMBER_OF_INDICATORS; i++) {
-              if (strcmp(logger->indicators[i]->name, "hyp") == 0) {
-                node_item->indicator_contribution[i] = (previous_item->y[0] - node_item->y[0])
-                    / (problem->nadir_value[0] - problem->best_value[0])
-                    * (problem->nadir_value[1] - node_item->y[1])
-                    / (problem->nadir_value[1] - problem->best_value[1]);
-              } else {
-                coco_error(
-                    "logger_biobj_tree_update(): Indicator computation not implemented yet for indicator %s",
-                    logger->indicators[i]->name);
-              }
-            }
-          } else {
-            previous_unavailable = 1;
-          }
-        } else {
-          previous_unavailable = 1;
-        }
+  node_item = logger_biobj_node_create(x, y, time_stamp, logger->number_of_variables,
+      logger->number_of_objectives);
+  new_node = avl_item_insert(logger->archive_tree, node_item);
 
-        if (previous_unavailable) {
-          /* Previous item does not exist or is out of ROI, use reference point instead */
+  if (logger->compute_indicators) {
+    logger_biobj_check_if_within_ROI(problem, new_node);
+    if (node_item->within_ROI) {
+      /* Compute indicator value for new node and update the indicator value of the affected nodes */
+      logger_biobj_avl_item_t *next_item, *previous_item;
+      double left_y0 = problem->nadir_value[0];
+
+      if (new_node->next != NULL) {
+        next_item = (logger_biobj_avl_item_t*) new_node->next->item;
+        if (next_item->within_ROI) {
           for (i = 0; i < OBSERVER_BIOBJ_NUMBER_OF_INDICATORS; i++) {
-            if (strcmp(logger->indicators[i]->name, "hyp") == 0) {
-              node_item->indicator_contribution[i] = (problem->nadir_value[0] - node_item->y[0])
-                  / (problem->nadir_value[0] - problem->best_value[0])
-                  * (problem->nadir_value[1] - node_item->y[1])
-                  / (problem->nadir_value[1] - problem->best_value[1]);
-            } else {
-              coco_error(
-                  "logger_biobj_tree_update(): Indicator computation not implemented yet for indicator %s",
-                  logger->indicators[i]->name);
-            }
+            logger->indicators[i]->current_value -= next_item->indicator_contribution[i];
+            next_item->indicator_contribution[i] = logger_biobj_hyp_contribution(problem, node_item->y[0],
+                next_item->y);
+            logger->indicators[i]->current_value += next_item->indicator_contribution[i];
           }
         }
+      }
 
-        for (i = 0; i < OBSERVER_BIOBJ_NUMBER_OF_INDICATORS; i++) {
-          logger->indicators[i]->current_value += node_item->indicator_contribution[i];
-        }
+      /* If the previous item does not exist or is out of ROI, use the reference point instead */
+      if (new_node->prev != NULL) {
+        previous_item = (logger_biobj_avl_item_t*) new_node->prev->item;
+        if (previous_item->within_ROI)
+          left_y0 = previous_item->y[0];
+      }
+
+      for (i = 0; i < OBSERVER_BIOBJ_NUMBER_OF_INDICATORS; i++) {
+        node_item->indicator_contribution[i] = logger_biobj_hyp_contribution(problem, left_y0, node_item->y);
+        logger->indicators[i]->current_value += node_item->indicator_contribution[i];
       }
     }
   }
 
-  return trigger_update;
+  return node_item;
 }
 
 /**
@@ -390,12 +378,17 @@ static logger_biobj_indicator_t *logger_biobj_indicator(logger_biobj_t *logger,
   observer_biobj = (observer_biobj_t *) observer->data;
 
   indicator->name = coco_strdup(indicator_name);
+  if (strcmp(indicator->name, "hyp") != 0) {
+    coco_error("logger_biobj_indicator(): Indicator computation not implemented yet for indicator %s",
+        indicator->name);
+    return NULL; /* Never reached */
+  }
 
   indicator->best_value = suite_biobj_get_best_value(indicator->name, problem->problem_id);
   indicator->next_target_id = 0;
   indicator->target_hit = 0;
   indicator->current_value = 0;
-  indicator->additional_penalty = 0;
+  indicator->additional_penalty = DBL_MAX;
   indicator->overall_value = 0;
 
   /* Prepare the info file */
@@ -503,39 +496,37 @@ static void logger_biobj_indicator_free(void *stuff) {
 }
 
 /**
- * Evaluates the function, increases the number of evaluations and outputs information based on observer
- * options.
+ * Logs the evaluation of x with the result y: increases the number of evaluations, updates the archive and
+ * outputs information based on observer options. If is_dominated is set, the solution is known to be weakly
+ * dominated by the archive and the update is skipped. Returns whether the archive was updated.
  */
-static void logger_biobj_evaluate(coco_problem_t *problem, const double *x, double *y) {
+static int logger_biobj_log_evaluation(logger_biobj_t *logger,
+                                       coco_problem_t *problem,
+                                       const double *x,
+                                       const double *y,
+                                       const int is_dominated) {
 
-  logger_biobj_t *logger;
-
-  logger_biobj_avl_item_t *node_item;
+  logger_biobj_avl_item_t *node_item = NULL;
   logger_biobj_indicator_t *indicator;
-  avl_node_t *solution;
-  int update_performed;
   size_t i;
 
-  logger = (logger_biobj_t *) coco_transformed_get_data(problem);
-
-  /* Evaluate function */
-  coco_evaluate_function(coco_transformed_get_inner_problem(problem), x, y);
   logger->number_of_evaluations++;
 
   /* Update the archive with the new solution, if it is not dominated by or equal to existing solutions in the archive */
-  node_item = logger_biobj_node_create(x, y, logger->number_of_evaluations, logger->number_of_variables,
-      logger->number_of_objectives);
-
-  update_performed = logger_biobj_tree_update(logger, coco_transformed_get_inner_problem(problem), node_item);
+  if (!is_dominated)
+    node_item = logger_biobj_tree_update(logger, coco_transformed_get_inner_problem(problem), x, y,
+        logger->number_of_evaluations);
 
   /* If the archive was updated and you need to log all nondominated solutions, output the new solution to nondom_file */
-  if (update_performed && (logger->log_nondom_mode == ALL)) {
-    logger_biobj_tree_output(logger->nondom_file, logger->buffer_tree, logger->number_of_variables,
-        logger->number_of_objectives, logger->log_vars, logger->precision_x, logger->precision_f);
-    avl_tree_purge(logger->buffer_tree);
-
-    /* Flush output so that impatient users can see progress. */
-    fflush(logger->nondom_file);
+  if ((node_item != NULL) && (logger->log_nondom_mode == ALL)) {
+    int log_vars = logger->log_vars && (logger->log_x_mode == COCO_OBSERVER_LOG_X_ALL);
+    if (logger->log_vars && (logger->log_x_mode == COCO_OBSERVER_LOG_X_SPARSE)
+        && (node_item->time_stamp >= logger->x_trigger)) {
+      log_vars = 1;
+      logger->x_trigger = coco_observer_next_evaluation_to_log(node_item->time_stamp, logger->number_of_variables);
+    }
+    logger_biobj_output_solution(logger->nondom_file, node_item, logger->number_of_variables,
+        logger->number_of_objectives, log_vars, logger->precision_x, logger->precision_f);
   }
 
   /* If the archive was updated and a new target was reached for an indicator or if this is the first evaluation,
@@ -550,31 +541,21 @@ static void logger_biobj_evaluate(coco_problem_t *problem, const double *x, doub
       indicator->target_hit = 0;
 
       /* If the update was performed, update the overall indicator value */
-      if (update_performed) {
-        /* Compute the overall_value of an indicator */
-        if (strcmp(indicator->name, "hyp") == 0) {
-          if (indicator->current_value == 0) {
-            /* The additional penalty for hypervolume is the minimal distance from the nondominated set to the ROI */
-            indicator->additional_penalty = DBL_MAX;
-            if (logger->archive_tree->tail) {
-              solution = logger->archive_tree->head;
-              while (solution != NULL) {
-                double distance = mo_get_distance_to_ROI(((logger_biobj_avl_item_t*) solution->item)->y,
-                    problem->best_value, problem->nadir_value, problem->number_of_objectives);
-                indicator->additional_penalty = coco_min_double(indicator->additional_penalty, distance);
-                solution = solution->next;
-              }
-            }
-            assert(indicator->additional_penalty >= 0);
-          } else {
-            indicator->additional_penalty = 0;
-          }
-          indicator->overall_value = indicator->best_value - indicator->current_value
-              + indicator->additional_penalty;
+      if (node_item != NULL) {
+        /* Compute the overall_value of the hypervolume indicator */
+        if (indicator->current_value == 0) {
+          /* The additional penalty for hypervolume is the minimal distance from the nondominated set to the ROI.
+           * As long as no solution is within the ROI, it is the minimum over all archived solutions, because
+           * the distance of a solution is not larger than that of the solutions it dominates. */
+          double distance = mo_get_distance_to_ROI(node_item->y, problem->best_value, problem->nadir_value,
+              problem->number_of_objectives);
+          indicator->additional_penalty = coco_min_double(indicator->additional_penalty, distance);
+          assert(indicator->additional_penalty >= 0);
         } else {
-          coco_error("logger_biobj_evaluate(): Indicator computation not implemented yet for indicator %s",
-              indicator->name);
+          indicator->additional_penalty = 0;
         }
+        indicator->overall_value = indicator->best_value - indicator->current_value
+            + indicator->additional_penalty;
 
         /* Check whether a target was hit */
         while ((indicator->next_target_id < MO_NUMBER_OF_TARGETS)
@@ -605,12 +586,151 @@ static void logger_biobj_evaluate(coco_problem_t *problem, const double *x, doub
 
     }
   }
+
+  return node_item != NULL;
+}
+
+/**
+ * Evaluates the function, increases the number of evaluations and outputs information based on observer
+ * options.
+ */
+static void logger_biobj_evaluate(coco_problem_t *problem, const double *x, double *y) {
+
+  logger_biobj_t *logger;
+
+  logger = (logger_biobj_t *) coco_transformed_get_data(problem);
+
+  /* Evaluate function */
+  coco_evaluate_function(coco_transformed_get_inner_problem(problem), x, y);
+
+  if (logger_biobj_log_evaluation(logger, problem, x, y, 0) && (logger->log_nondom_mode == ALL)) {
+    /* Flush output so that impatient users can see progress. */
+    fflush(logger->nondom_file);
+  }
+}
+
+/**
+ * Defines the ordering of objective vectors used to merge a population into the archive: by increasing
+ * second objective like the archive tree and by increasing first objective for ties.
+ */
+static int logger_biobj_compare_objectives(const void *a, const void *b) {
+  const double *y1 = *(const double * const *) a;
+  const double *y2 = *(const double * const *) b;
+
+  if (y1[1] < y2[1])
+    return -1;
+  else if (y1[1] > y2[1])
+    return 1;
+  else if (y1[0] < y2[0])
+    return -1;
+  else if (y1[0] > y2[0])
+    return 1;
+  else
+    return 0;
+}
+
+/**
+ * Sets is_dominated[i] for each of the number_of_points objective vectors stored row by row in y that is
+ * weakly dominated by the archive. The vectors are sorted once and merged with the archive in a single
+ * sweep: the archive solution that can dominate a vector is the one with the largest second objective not
+ * larger than that of the vector, and this solution moves monotonically along the archive.
+ *
+ * A solution that is weakly dominated by the archive remains so after any later update, hence skipping the
+ * archive update for it does not change any result. Vectors with a NaN objective are not ordered by
+ * logger_biobj_compare_objectives, so they are left out of the sweep and are not marked as dominated.
+ */
+static void logger_biobj_find_dominated(logger_biobj_t *logger,
+                                        const double *y,
+                                        const size_t number_of_points,
+                                        int *is_dominated) {
+
+  const double **sorted_y;
+  const size_t num_obj = logger->number_of_objectives;
+  logger_biobj_avl_item_t search_item;
+  avl_node_t *node, *next_node;
+  size_t i, j, number_of_sorted = 0;
+
+  for (i = 0; i < number_of_points; i++)
+    is_dominated[i] = 0;
+  if (logger->archive_tree->head == NULL)
+    return;
+
+  sorted_y = (const double **) coco_allocate_memory(number_of_points * sizeof(double *));
+  for (i = 0; i < number_of_points; i++) {
+    for (j = 0; j < num_obj; j++) {
+      if (coco_is_nan(y[i * num_obj + j]))
+        break;
+    }
+    if (j == num_obj)
+      sorted_y[number_of_sorted++] = y + i * num_obj;
+  }
+  if (number_of_sorted == 0) {
+    coco_free_memory(sorted_y);
+    return;
+  }
+  qsort(sorted_y, number_of_sorted, sizeof(double *), logger_biobj_compare_objectives);
+
+  /* Find the last archive solution that is not worse than the first vector in the second objective */
+  search_item.y = (double *) sorted_y[0]; /* only used for comparisons */
+  node = avl_item_search_right(logger->archive_tree, &search_item, NULL);
+  next_node = (node == NULL) ? logger->archive_tree->head : node->next;
+
+  for (i = 0; i < number_of_sorted; i++) {
+    while ((next_node != NULL) && (((logger_biobj_avl_item_t*) next_node->item)->y[1] <= sorted_y[i][1])) {
+      node = next_node;
+      next_node = next_node->next;
+    }
+    if ((node != NULL) && (((logger_biobj_avl_item_t*) node->item)->y[0] <= sorted_y[i][0]))
+      is_dominated[(size_t) (sorted_y[i] - y) / num_obj] = 1;
+  }
+
+  coco_free_memory(sorted_y);
+}
+
+/**
+ * Evaluates the function in the number_of_points points stored row by row in x, stores the results row by
+ * row in y and logs the evaluations like logger_biobj_evaluate in the same order, which keeps the time
+ * stamps and indicator values exact. The archive is only searched for the solutions that are not already
+ * weakly dominated by the archive before the population, which are found by logger_biobj_find_dominated.
+ * The nondominated solutions are flushed only once for the whole population.
+ */
+static void logger_biobj_evaluate_batch(coco_problem_t *problem,
+                                        const double *x,
+                                        const size_t number_of_points,
+                                        double *y) {
+
+  logger_biobj_t *logger;
+  coco_problem_t *inner_problem;
+  const size_t dim = problem->number_of_variables;
+  const size_t num_obj = problem->number_of_objectives;
+  int update_performed = 0;
+  int *is_dominated;
+  size_t i;
+
+  if (number_of_points == 0)
+    return;
+
+  logger = (logger_biobj_t *) coco_transformed_get_data(problem);
+  inner_problem = coco_transformed_get_inner_problem(problem);
+
+  for (i = 0; i < number_of_points; i++)
+    coco_evaluate_function(inner_problem, x + i * dim, y + i * num_obj);
+
+  is_dominated = (int *) coco_allocate_memory(number_of_points * sizeof(int));
+  logger_biobj_find_dominated(logger, y, number_of_points, is_dominated);
+  for (i = 0; i < number_of_points; i++)
+    update_performed |= logger_biobj_log_evaluation(logger, problem, x + i * dim, y + i * num_obj,
+        is_dominated[i]);
+  coco_free_memory(is_dominated);
+
+  if (update_performed && (logger->log_nondom_mode == ALL))
+    fflush(logger->nondom_file);
 }
 
 /**
- * Outputs the final nondominated solutions.
+ * Outputs the final nondominated solutions to the given file.
  */
-static void logger_biobj_finalize(logger_biobj_t *logger) {
+static void logger_biobj_finalize(logger_biobj_t *logger, FILE *file) {
 
   avl_tree_t *resorted_tree;
   avl_node_t *solution;
@@ -627,7 +747,7 @@ static void logger_biobj_finalize(logger_biobj_t *logger) {
     }
   }
 
-  logger_biobj_tree_output(logger->nondom_file, resorted_tree, logger->number_of_variables,
+  logger_biobj_tree_output(file, resorted_tree, logger->number_of_variables,
       logger->number_of_objectives, logger->log_vars, logger->precision_x, logger->precision_f);
 
   avl_tree_destruct(resorted_tree);
@@ -645,7 +765,12 @@ static void logger_biobj_free(void *stuff) {
   logger = stuff;
 
   if (logger->log_nondom_mode == FINAL) {
-     logger_biobj_finalize(logger);
+     logger_biobj_finalize(logger, logger->nondom_file);
+  }
+  if (logger->final_nondom_file != NULL) {
+    logger_biobj_finalize(logger, logger->final_nondom_file);
+    fclose(logger->final_nondom_file);
+    logger->final_nondom_file = NULL;
   }
 
   if (logger->compute_indicators) {
@@ -661,10 +786,55 @@ static void logger_biobj_free(void *stuff) {
   }
 
   avl_tree_destruct(logger->archive_tree);
-  avl_tree_destruct(logger->buffer_tree);
 
 }
 
+/**
+ * Opens the file for logging nondominated solutions of the given problem in the archive folder, where
+ * mode is "all" or "final", and outputs its header.
+ */
+static FILE *logger_biobj_open_nondom_file(coco_observer_t *observer,
+                                           coco_problem_t *problem,
+                                           const char *mode,
+                                           const int log_vars) {
+
+  const char nondom_folder_name[] = "archive";
+  char *path_name, *file_name, *prefix;
+  FILE *file;
+
+  /* Create the path to the file */
+  path_name = (char *) coco_allocate_memory(COCO_PATH_MAX);
+  memcpy(path_name, observer->output_folder, strlen(observer->output_folder) + 1);
+  coco_join_path(path_name, COCO_PATH_MAX, nondom_folder_name, NULL);
+  coco_create_path(path_name);
+
+  /* Construct file name */
+  prefix = coco_remove_from_string(problem->problem_id, "_i", "_d");
+  file_name = coco_strdupf("%s_nondom_%s.dat", prefix, mode);
+  coco_join_path(path_name, COCO_PATH_MAX, file_name, NULL);
+  coco_free_memory(file_name);
+  coco_free_memory(prefix);
+
+  /* Open and initialize the file */
+  file = fopen(path_name, "a");
+  if (file == NULL) {
+    coco_error("logger_biobj() failed to open file '%s'.", path_name);
+    return NULL; /* Never reached */
+  }
+  coco_free_memory(path_name);
+
+  /* Output header information */
+  fprintf(file, "%% instance = %ld, name = %s\n", problem->suite_dep_instance, problem->problem_name);
+  if (log_vars) {
+    fprintf(file, "%% function evaluation | %lu objectives | %lu variables\n",
+        problem->number_of_objectives, problem->number_of_variables);
+  } else {
+    fprintf(file, "%% function evaluation | %lu objectives \n",
+        problem->number_of_objectives);
+  }
+  return file;
+}
+
 /**
  * Initializes the biobjective logger.
  */
@@ -673,8 +843,6 @@ static coco_problem_t *logger_biobj(coco_observer_t *observer, coco_problem_t *p
   coco_problem_t *self;
   logger_biobj_t *logger;
   observer_biobj_t *observer_biobj;
-  const char nondom_folder_name[] = "archive";
-  char *path_name, *file_name = NULL, *prefix;
   size_t i;
 
   if (problem->number_of_objectives != 2) {
@@ -703,50 +871,24 @@ static coco_problem_t *logger_biobj(coco_observer_t *observer, coco_problem_t *p
     logger->log_vars = 0;
   else
     logger->log_vars = 1;
+  logger->log_x_mode = observer->log_x_mode;
+  logger->x_trigger = 1;
 
   /* Initialize logging of nondominated solutions */
-  if (logger->log_nondom_mode != NONE) {
-
-    /* Create the path to the file */
-    path_name = (char *) coco_allocate_memory(COCO_PATH_MAX);
-    memcpy(path_name, observer->output_folder, strlen(observer->output_folder) + 1);
-    coco_join_path(path_name, COCO_PATH_MAX, nondom_folder_name, NULL);
-    coco_create_path(path_name);
-
-    /* Construct file name */
-    prefix = coco_remove_from_string(problem->problem_id, "_i", "_d");
-    if (logger->log_nondom_mode == ALL)
-      file_name = coco_strdupf("%s_nondom_all.dat", prefix);
-    else if (logger->log_nondom_mode == FINAL)
-      file_name = coco_strdupf("%s_nondom_final.dat", prefix);
-    coco_join_path(path_name, COCO_PATH_MAX, file_name, NULL);
-    if (logger->log_nondom_mode != NONE)
-      coco_free_memory(file_name);
-    coco_free_memory(prefix);
-
-    /* Open and initialize the file */
-    logger->nondom_file = fopen(path_name, "a");
-    if (logger->nondom_file == NULL) {
-      coco_error("logger_biobj() failed to open file '%s'.", path_name);
-      return NULL; /* Never reached */
-    }
-    coco_free_memory(path_name);
-
-    /* Output header information */
-    fprintf(logger->nondom_file, "%% instance = %ld, name = %s\n", problem->suite_dep_instance, problem->problem_name);
-    if (logger->log_vars) {
-      fprintf(logger->nondom_file, "%% function evaluation | %lu objectives | %lu variables\n",
-          problem->number_of_objectives, problem->number_of_variables);
-    } else {
-      fprintf(logger->nondom_file, "%% function evaluation | %lu objectives \n",
-          problem->number_of_objectives);
-    }
+  logger->nondom_file = NULL;
+  logger->final_nondom_file = NULL;
+  if (logger->log_nondom_mode == ALL) {
+    logger->nondom_file = logger_biobj_open_nondom_file(observer, problem, "all",
+        logger->log_vars && (logger->log_x_mode != COCO_OBSERVER_LOG_X_FINAL));
+    if (logger->log_vars && (logger->log_x_mode == COCO_OBSERVER_LOG_X_FINAL))
+      logger->final_nondom_file = logger_biobj_open_nondom_file(observer, problem, "final", 1);
+  } else if (logger->log_nondom_mode == FINAL) {
+    logger->nondom_file = logger_biobj_open_nondom_file(observer, problem, "final", logger->log_vars);
   }
 
-  /* Initialize the AVL trees */
+  /* Initialize the AVL tree */
   logger->archive_tree = avl_tree_construct((avl_compare_t) avl_tree_compare_by_last_objective,
       (avl_free_t) logger_biobj_node_free);
-  logger->buffer_tree = avl_tree_construct((avl_compare_t) avl_tree_compare_by_time_stamp, NULL);
 
   self = coco_transformed_allocate(problem, logger, logger_biobj_free);
   self->evaluate_function = logger_biobj_evaluate;
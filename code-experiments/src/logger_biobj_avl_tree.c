@@ -403,15 +403,18 @@ static avl_node_t *avl_item_search_right(const avl_tree_t *tree, const void *ite
   return avl_const_node(node);
 }
 
-/* Searches for the item in the tree and returns a matching node if found
+/* Commented to silence the compiler.
+
+ * Searches for the item in the tree and returns a matching node if found
  * or NULL if not.
- * O(lg n) */
+ * O(lg n)
 static avl_node_t *avl_item_search(const avl_tree_t *avltree, const void *item) {
   int c;
   avl_node_t *n;
   n = avl_search_rightish(avltree, item, &c);
   return c ? n : NULL;
 }
+*/
 
 /* Initializes a new tree for elements that will be ordered using
  * the supplied strcmp()-like function.
@@ -809,13 +812,16 @@ static void *avl_node_delete(avl_tree_t *avltree, avl_node_t *avlnode) {
   return item;
 }
 
-/* Searches for an item in the tree and deletes it if found.
+/* Commented to silence the compiler.
+
+ * Searches for an item in the tree and deletes it if found.
  * If the tree's free is not NULL, it is invoked on the item.
  * If it is, returns the item. In all other cases returns NULL.
- * O(lg n) */
+ * O(lg n)
 static void *avl_item_delete(avl_tree_t *avltree, const void *item) {
   return avl_node_delete(avltree, avl_item_search(avltree, item));
 }
+*/
 
 /* Commented to silence the compiler.
 
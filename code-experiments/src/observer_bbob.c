@@ -3,19 +3,38 @@
 
 static coco_problem_t *logger_bbob(coco_observer_t *observer, coco_problem_t *problem);
 
+/* Flush policies of the data files */
+#define OBSERVER_BBOB_FLUSH_END 0
+#define OBSERVER_BBOB_FLUSH_INTERVAL 1
+#define OBSERVER_BBOB_FLUSH_EVERY 2
+
 typedef struct {
   size_t bbob_nbpts_nbevals;
   size_t bbob_nbpts_fval;
+  int binary_format; /* whether the .dat and .tdat data are written as binary .bdat and .btdat files */
+  int flush_policy; /* when the data files are flushed, one of OBSERVER_BBOB_FLUSH_... */
+  double flush_interval; /* minimal number of seconds between two flushes with the interval policy */
 } observer_bbob_t;
 
 /**
  * Initializes the bbob observer. Possible options:
  * - bbob_nbpts_nbevals: nb fun eval triggers are at 10**(i/bbob_nbpts_nbevals) (the default value in bbob is 20 )
  * - bbob_nbpts_fval: f value difference to the optimal triggers are at 10**(i/bbob_nbpts_fval)(the default value in bbob is 5 )
+ * - format : text (write the data as formatted text in .dat and .tdat files; default value)
+ * - format : binary (write each data line as five doubles in native byte order, without decision variables,
+ * in fully buffered .bdat and .btdat files; a run starts with a line with 0 evaluations and Fopt)
+ * - flush : every (flush the data files after each evaluation that wrote data, such that no data is lost
+ * if the process crashes)
+ * - flush : interval (flush the data files at most every interval_seconds seconds; default value for the
+ * text format)
+ * - flush : end (flush the data only when the buffers are full and at the end of a run; default value for the
+ * binary format)
+ * - interval_seconds : the number of seconds between two flushes with the interval policy (default value is 1)
  */
 static void observer_bbob(coco_observer_t *self, const char *options) {
   
   observer_bbob_t *data;
+  char string_value[COCO_PATH_MAX];
   
   data = coco_allocate_memory(sizeof(*data));  
 
@@ -26,6 +45,29 @@ static void observer_bbob(coco_observer_t *self, const char *options) {
     data->bbob_nbpts_fval = 5;
   }
 
+  data->binary_format = 0;
+  if (coco_options_read_string(options, "format", string_value) > 0) {
+    if (strcmp(string_value, "binary") == 0)
+      data->binary_format = 1;
+    else if (strcmp(string_value, "text") != 0)
+      coco_warning("observer_bbob(): unknown format '%s', the text format is used", string_value);
+  }
+
+  data->flush_policy = data->binary_format ? OBSERVER_BBOB_FLUSH_END : OBSERVER_BBOB_FLUSH_INTERVAL;
+  if (coco_options_read_string(options, "flush", string_value) > 0) {
+    if (strcmp(string_value, "every") == 0)
+      data->flush_policy = OBSERVER_BBOB_FLUSH_EVERY;
+    else if (strcmp(string_value, "interval") == 0)
+      data->flush_policy = OBSERVER_BBOB_FLUSH_INTERVAL;
+    else if (strcmp(string_value, "end") == 0)
+      data->flush_policy = OBSERVER_BBOB_FLUSH_END;
+    else
+      coco_warning("observer_bbob(): unknown flush policy '%s', ignored", string_value);
+  }
+  if (coco_options_read_double(options, "interval_seconds", &(data->flush_interval)) == 0) {
+    data->flush_interval = 1;
+  }
+
   self->logger_initialize_function = logger_bbob;
   self->data_free_function = NULL;
   self->data = data;
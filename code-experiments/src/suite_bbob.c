@@ -20,6 +20,7 @@
 #include "f_sphere.c"
 #include "f_step_ellipsoid.c"
 #include "f_weierstrass.c"
+#include "transform_vars_fused.c"
 
 static coco_suite_t *coco_suite_allocate(const char *suite_name,
                                          const size_t number_of_functions,
@@ -27,6 +28,10 @@ static coco_suite_t *coco_suite_allocate(const char *suite_name,
                                          const size_t *dimensions,
                                          const char *default_instances);
 
+/* Templates of the BBOB suite problem IDs and names (instantiated with function, instance and dimension) */
+static const char *suite_bbob_problem_id_template = "bbob_f%03lu_i%02lu_d%02lu";
+static const char *suite_bbob_problem_name_template = "BBOB suite problem f%lu instance %lu in %luD";
+
 static coco_suite_t *suite_bbob_allocate(void) {
 
   coco_suite_t *suite;
@@ -72,8 +77,8 @@ static coco_problem_t *get_bbob_problem(const size_t function,
                                         const size_t instance) {
   coco_problem_t *problem = NULL;
 
-  const char *problem_id_template = "bbob_f%03lu_i%02lu_d%02lu";
-  const char *problem_name_template = "BBOB suite problem f%lu instance %lu in %luD";
+  const char *problem_id_template = suite_bbob_problem_id_template;
+  const char *problem_name_template = suite_bbob_problem_name_template;
 
   const long rseed = (long) (function + 10000 * instance);
   const long rseed_3 = (long) (3 + 10000 * instance);
@@ -156,6 +161,7 @@ static coco_problem_t *get_bbob_problem(const size_t function,
     return NULL; /* Never reached */
   }
 
+  transform_vars_fused_apply(problem);
   return problem;
 }
 
@@ -178,3 +184,17 @@ static coco_problem_t *suite_bbob_get_problem(coco_suite_t *suite,
 
   return problem;
 }
+
+/**
+ * Returns the ID of the BBOB suite problem without constructing it (matches the ID of get_bbob_problem).
+ */
+static char *suite_bbob_get_problem_id(const size_t function, const size_t dimension, const size_t instance) {
+  return coco_strdupf(suite_bbob_problem_id_template, function, instance, dimension);
+}
+
+/**
+ * Returns the name of the BBOB suite problem without constructing it (matches the name of get_bbob_problem).
+ */
+static char *suite_bbob_get_problem_name(const size_t function, const size_t dimension, const size_t instance) {
+  return coco_strdupf(suite_bbob_problem_name_template, function, instance, dimension);
+}
@@ -12,6 +12,26 @@
 #include <assert.h>
 #include "coco.h"
 #define SUITE_BBOB2009_MAX_DIM 40
+#define BBOB2009_CACHE_BUCKETS 1024
+#define BBOB2009_CACHE_MAX_SIZE 2097152 /* number of doubles, that is 16MB */
+
+/**
+ * Cache of the rotation matrices and optimal solutions generated by bbob2009_compute_rotation and
+ * bbob2009_compute_xopt, keyed by their kind, seed and dimension. The cache is active as long as it is
+ * referenced, see bbob2009_cache_acquire, hence suite sweeps, in particular bbob-biobj, which constructs
+ * each bbob problem many times, generate each matrix only once.
+ */
+typedef struct bbob2009_cache_entry_s {
+  int is_rotation;
+  long seed;
+  size_t dimension;
+  double *values; /* the rotation matrix in row-major format or the optimal solution */
+  struct bbob2009_cache_entry_s *next;
+} bbob2009_cache_entry_t;
+
+static bbob2009_cache_entry_t *bbob2009_cache[BBOB2009_CACHE_BUCKETS];
+static size_t bbob2009_cache_references = 0;
+static size_t bbob2009_cache_size = 0;
 
 static double bbob2009_fmin(double a, double b) {
   return (a < b) ? a : b;
@@ -52,6 +72,92 @@ static void bbob2009_free_matrix(double **matrix, const size_t n) {
   coco_free_memory(matrix);
 }
 
+/**
+ * bbob2009_cache_clear():
+ *
+ * Free all entries of the cache.
+ */
+static void bbob2009_cache_clear(void) {
+  bbob2009_cache_entry_t *entry;
+  size_t i;
+  for (i = 0; i < BBOB2009_CACHE_BUCKETS; ++i) {
+    while (bbob2009_cache[i] != NULL) {
+      entry = bbob2009_cache[i];
+      bbob2009_cache[i] = entry->next;
+      coco_free_memory(entry->values);
+      coco_free_memory(entry);
+    }
+  }
+  bbob2009_cache_size = 0;
+}
+
+/**
+ * bbob2009_cache_acquire():
+ *
+ * Add a reference to the cache, which is activated with the first reference.
+ */
+static void bbob2009_cache_acquire(void) {
+  ++bbob2009_cache_references;
+}
+
+/**
+ * bbob2009_cache_release():
+ *
+ * Remove a reference to the cache, which is cleared and deactivated with the last reference.
+ */
+static void bbob2009_cache_release(void) {
+  assert(bbob2009_cache_references > 0);
+  if (--bbob2009_cache_references == 0)
+    bbob2009_cache_clear();
+}
+
+static size_t bbob2009_cache_bucket(const int is_rotation, const long seed, const size_t dimension) {
+  return ((size_t) seed * 31 + dimension * 2 + (size_t) is_rotation) % BBOB2009_CACHE_BUCKETS;
+}
+
+/**
+ * bbob2009_cache_lookup(is_rotation, seed, dimension):
+ *
+ * Return the cached values for the given key or NULL if there are none.
+ */
+static const double *bbob2009_cache_lookup(const int is_rotation, const long seed, const size_t dimension) {
+  bbob2009_cache_entry_t *entry;
+  if (bbob2009_cache_references == 0)
+    return NULL;
+  for (entry = bbob2009_cache[bbob2009_cache_bucket(is_rotation, seed, dimension)]; entry != NULL;
+      entry = entry->next) {
+    if (entry->is_rotation == is_rotation && entry->seed == seed && entry->dimension == dimension)
+      return entry->values;
+  }
+  return NULL;
+}
+
+/**
+ * bbob2009_cache_insert(is_rotation, seed, dimension, size):
+ *
+ * Return a new cache entry of ${size} values for the given key to be filled in by the caller or NULL if
+ * the cache is not active. The cache is cleared when it would exceed BBOB2009_CACHE_MAX_SIZE values.
+ */
+static double *bbob2009_cache_insert(const int is_rotation, const long seed, const size_t dimension,
+                                     const size_t size) {
+  bbob2009_cache_entry_t *entry;
+  size_t bucket;
+  if (bbob2009_cache_references == 0 || size > BBOB2009_CACHE_MAX_SIZE)
+    return NULL;
+  if (bbob2009_cache_size + size > BBOB2009_CACHE_MAX_SIZE)
+    bbob2009_cache_clear();
+  bucket = bbob2009_cache_bucket(is_rotation, seed, dimension);
+  entry = (bbob2009_cache_entry_t *) coco_allocate_memory(sizeof(*entry));
+  entry->is_rotation = is_rotation;
+  entry->seed = seed;
+  entry->dimension = dimension;
+  entry->values = coco_allocate_vector(size);
+  entry->next = bbob2009_cache[bucket];
+  bbob2009_cache[bucket] = entry;
+  bbob2009_cache_size += size;
+  return entry->values;
+}
+
 /**
  * bbob2009_unif(r, N, inseed):
  *
@@ -143,9 +249,20 @@ static void bbob2009_compute_rotation(double **B, long seed, size_t DIM) {
   double prod;
   double gvect[2000];
   long i, j, k; /* Loop over pairs of column vectors. */
+  const double *cached;
+  double *values;
 
   assert(DIM * DIM < 2000);
 
+  cached = bbob2009_cache_lookup(1, seed, DIM);
+  if (cached != NULL) {
+    for (i = 0; i < DIM; i++) {
+      for (j = 0; j < DIM; j++)
+        B[i][j] = cached[(size_t) i * DIM + (size_t) j];
+    }
+    return;
+  }
+
   bbob2009_gauss(gvect, DIM * DIM, seed);
   bbob2009_reshape(B, gvect, DIM, DIM);
   /*1st coordinate is row, 2nd is column.*/
@@ -164,6 +281,14 @@ static void bbob2009_compute_rotation(double **B, long seed, size_t DIM) {
     for (k = 0; k < DIM; k++)
       B[k][i] /= sqrt(prod);
   }
+
+  values = bbob2009_cache_insert(1, seed, DIM, DIM * DIM);
+  if (values != NULL) {
+    for (i = 0; i < DIM; i++) {
+      for (j = 0; j < DIM; j++)
+        values[(size_t) i * DIM + (size_t) j] = B[i][j];
+    }
+  }
 }
 
 static void bbob2009_copy_rotation_matrix(double **rot, double *M, double *b, const size_t dimension) {
@@ -186,12 +311,26 @@ static void bbob2009_copy_rotation_matrix(double **rot, double *M, double *b, co
  */
 static void bbob2009_compute_xopt(double *xopt, long seed, size_t DIM) {
   long i;
+  const double *cached;
+  double *values;
+
+  cached = bbob2009_cache_lookup(0, seed, DIM);
+  if (cached != NULL) {
+    for (i = 0; i < DIM; i++)
+      xopt[i] = cached[i];
+    return;
+  }
   bbob2009_unif(xopt, DIM, seed);
   for (i = 0; i < DIM; i++) {
     xopt[i] = 8 * floor(1e4 * xopt[i]) / 1e4 - 4;
     if (xopt[i] == 0.0)
       xopt[i] = -1e-5;
   }
+  values = bbob2009_cache_insert(0, seed, DIM, DIM);
+  if (values != NULL) {
+    for (i = 0; i < DIM; i++)
+      values[i] = xopt[i];
+  }
 }
 
 /**
@@ -18,6 +18,13 @@ static const size_t suite_biobj_instances[][3] = {
     { 10, 21, 22 }
 };
 
+/* The BBOB functions used to construct the bi-objective functions */
+static const size_t suite_biobj_num_bbob_functions = 10;
+static const size_t suite_biobj_bbob_functions[] = { 1, 2, 6, 8, 13, 14, 15, 17, 20, 21 };
+
+/* Template of the bi-objective suite problem IDs (instantiated with function, instance and dimension) */
+static const char *suite_biobj_problem_id_template = "bbob-biobj_f%02lu_i%02lu_d%02lu";
+
 /* Data for the biobjective suite */
 typedef struct {
 
@@ -62,59 +69,87 @@ static char *suite_biobj_get_instances_by_year(const int year) {
   }
 }
 
-static coco_problem_t *suite_biobj_get_problem(coco_suite_t *suite,
-                                               const size_t function_idx,
-                                               const size_t dimension_idx,
-                                               const size_t instance_idx) {
-
-  const size_t num_bbob_functions = 10;
-  const size_t bbob_functions[] = { 1, 2, 6, 8, 13, 14, 15, 17, 20, 21 };
+/**
+ * Computes the indices (in bbob_functions) of the two BBOB functions that make up the bi-objective function
+ * with the given function_idx.
+ */
+static void suite_biobj_get_function_indices(const coco_suite_t *suite,
+                                             const size_t function_idx,
+                                             const size_t num_bbob_functions,
+                                             size_t *function1_idx,
+                                             size_t *function2_idx) {
 
-  coco_problem_t *problem1, *problem2, *problem = NULL;
-  size_t function1_idx, function2_idx;
-  size_t instance1 = 0, instance2 = 0;
+  /* A "magic" formula to compute the BBOB function index from the bi-objective function index */
+  *function1_idx = num_bbob_functions -
+      (size_t) (-0.5 + sqrt(0.25 + 2.0 * (double) (suite->number_of_functions - function_idx - 1))) - 1;
+  *function2_idx = function_idx - (*function1_idx * num_bbob_functions) +
+      (*function1_idx * (*function1_idx + 1)) / 2;
+}
 
-  const size_t function = suite->functions[function_idx];
-  const size_t dimension = suite->dimensions[dimension_idx];
-  const size_t instance = suite->instances[instance_idx];
+/**
+ * Searches for the two BBOB instances that make up the given bi-objective instance, first in
+ * suite_biobj_instances and then in the new instances of the suite. Returns 1 if the instance was found and
+ * 0 otherwise (in which case instance1 and instance2 are not changed).
+ */
+static int suite_biobj_get_known_instances(const coco_suite_t *suite,
+                                           const size_t instance,
+                                           size_t *instance1,
+                                           size_t *instance2) {
 
   suite_biobj_t *data = (suite_biobj_t *) suite->data;
-  size_t i, j;
+  size_t i;
   const size_t num_existing_instances = sizeof(suite_biobj_instances) / sizeof(suite_biobj_instances[0]);
-  int instance_found = 0;
-
-  /* A "magic" formula to compute the BBOB function index from the bi-objective function index */
-  function1_idx = num_bbob_functions -
-      (size_t) (-0.5 + sqrt(0.25 + 2.0 * (double) (suite->number_of_functions - function_idx - 1))) - 1;
-  function2_idx = function_idx - (function1_idx * num_bbob_functions) +
-      (function1_idx * (function1_idx + 1)) / 2;
 
   /* First search for instance in suite_biobj_instances */
   for (i = 0; i < num_existing_instances; i++) {
     if (suite_biobj_instances[i][0] == instance) {
       /* The instance has been found in suite_biobj_instances */
-      instance1 = suite_biobj_instances[i][1];
-      instance2 = suite_biobj_instances[i][2];
-      instance_found = 1;
-      break;
+      *instance1 = suite_biobj_instances[i][1];
+      *instance2 = suite_biobj_instances[i][2];
+      return 1;
     }
   }
 
-  if ((!instance_found) && (data)) {
+  if (data) {
     /* Next, search for instance in new_instances */
     for (i = 0; i < data->max_new_instances; i++) {
       if (data->new_instances[i][0] == 0)
         break;
       if (data->new_instances[i][0] == instance) {
         /* The instance has been found in new_instances */
-        instance1 = data->new_instances[i][1];
-        instance2 = data->new_instances[i][2];
-        instance_found = 1;
-        break;
+        *instance1 = data->new_instances[i][1];
+        *instance2 = data->new_instances[i][2];
+        return 1;
       }
     }
   }
 
+  return 0;
+}
+
+static coco_problem_t *suite_biobj_get_problem(coco_suite_t *suite,
+                                               const size_t function_idx,
+                                               const size_t dimension_idx,
+                                               const size_t instance_idx) {
+
+  const size_t num_bbob_functions = suite_biobj_num_bbob_functions;
+  const size_t *bbob_functions = suite_biobj_bbob_functions;
+
+  coco_problem_t *problem1, *problem2, *problem = NULL;
+  size_t function1_idx, function2_idx;
+  size_t instance1 = 0, instance2 = 0;
+
+  const size_t function = suite->functions[function_idx];
+  const size_t dimension = suite->dimensions[dimension_idx];
+  const size_t instance = suite->instances[instance_idx];
+
+  suite_biobj_t *data = (suite_biobj_t *) suite->data;
+  size_t i, j;
+  int instance_found;
+
+  suite_biobj_get_function_indices(suite, function_idx, num_bbob_functions, &function1_idx, &function2_idx);
+  instance_found = suite_biobj_get_known_instances(suite, instance, &instance1, &instance2);
+
   if (!instance_found) {
     /* Finally, if the instance is not found, create a new one */
 
@@ -154,7 +189,7 @@ static coco_problem_t *suite_biobj_get_problem(coco_suite_t *suite,
 
   /* Use the standard stacked problem_id as problem_name and construct a new suite-specific problem_id */
   coco_problem_set_name(problem, problem->problem_id);
-  coco_problem_set_id(problem, "bbob-biobj_f%02d_i%02ld_d%02d", function, instance, dimension);
+  coco_problem_set_id(problem, suite_biobj_problem_id_template, function, instance, dimension);
 
   /* Construct problem type */
   coco_problem_set_type(problem, "%s_%s", problem1->problem_type, problem2->problem_type);
@@ -269,6 +304,46 @@ static size_t suite_biobj_get_new_instance(coco_suite_t *suite,
   return instance2;
 }
 
+/**
+ * Returns the ID of the bi-objective suite problem without constructing it.
+ */
+static char *suite_biobj_get_problem_id(coco_suite_t *suite,
+                                        const size_t function_idx,
+                                        const size_t dimension_idx,
+                                        const size_t instance_idx) {
+
+  return coco_strdupf(suite_biobj_problem_id_template, suite->functions[function_idx],
+      suite->instances[instance_idx], suite->dimensions[dimension_idx]);
+}
+
+/**
+ * Returns the name of the bi-objective suite problem without constructing it, that is, the IDs of the two
+ * stacked BBOB problems. If the BBOB instances of the problem are not (yet) known, NULL is returned.
+ */
+static char *suite_biobj_get_problem_name(coco_suite_t *suite,
+                                          const size_t function_idx,
+                                          const size_t dimension_idx,
+                                          const size_t instance_idx) {
+
+  size_t function1_idx, function2_idx;
+  size_t instance1 = 0, instance2 = 0;
+  char *id1, *id2, *result;
+
+  const size_t dimension = suite->dimensions[dimension_idx];
+
+  if (!suite_biobj_get_known_instances(suite, suite->instances[instance_idx], &instance1, &instance2))
+    return NULL;
+  suite_biobj_get_function_indices(suite, function_idx, suite_biobj_num_bbob_functions, &function1_idx,
+      &function2_idx);
+
+  id1 = suite_bbob_get_problem_id(suite_biobj_bbob_functions[function1_idx], dimension, instance1);
+  id2 = suite_bbob_get_problem_id(suite_biobj_bbob_functions[function2_idx], dimension, instance2);
+  result = coco_strdupf("%s__%s", id1, id2);
+  coco_free_memory(id1);
+  coco_free_memory(id2);
+  return result;
+}
+
 /**
  * Frees the memory of the given biobjective suite.
  */
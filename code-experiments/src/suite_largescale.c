@@ -8,12 +8,16 @@ static coco_suite_t *coco_suite_allocate(const char *suite_name,
                                          const size_t *dimensions,
                                          const char *default_instances);
 
+/* Templates of the large-scale suite problem IDs and names (instantiated with function, instance and dimension) */
+static const char *suite_largescale_problem_id_template = "bbob-largescale_f%03lu_i%02lu_d%04lu";
+static const char *suite_largescale_problem_name_template = "BBOB large-scale suite problem f%lu instance %lu in %luD";
+
 static coco_suite_t *suite_largescale_allocate(void) {
   
   coco_suite_t *suite;
   /*const size_t dimensions[] = { 8, 16, 32, 64, 128, 256,512,1024};*/
-  const size_t dimensions[] = { 40, 80, 160, 320, 640, 1280};
-  suite = coco_suite_allocate("bbob-largescale", 1, 6, dimensions, "instances:1-15");
+  const size_t dimensions[] = { 40, 80, 160, 320, 640, 1280, 2560, 5120 };
+  suite = coco_suite_allocate("bbob-largescale", 1, 8, dimensions, "instances:1-15");
   return suite;
 }
 
@@ -26,8 +30,8 @@ static coco_problem_t *get_largescale_problem(const size_t function,
                                         const size_t instance) {
   coco_problem_t *problem = NULL;
   
-  const char *problem_id_template = "bbob_f%03lu_i%02lu_d%02lu";
-  const char *problem_name_template = "BBOB suite problem f%lu instance %lu in %luD";
+  const char *problem_id_template = suite_largescale_problem_id_template;
+  const char *problem_name_template = suite_largescale_problem_name_template;
   
   const long rseed = (long) (function + 10000 * instance);
   /*const long rseed_3 = (long) (3 + 10000 * instance);*/
@@ -63,3 +67,19 @@ static coco_problem_t *suite_largescale_get_problem(coco_suite_t *suite,
   
   return problem;
 }
+
+/**
+ * Returns the ID of the large-scale suite problem without constructing it (matches the ID of
+ * get_largescale_problem).
+ */
+static char *suite_largescale_get_problem_id(const size_t function, const size_t dimension, const size_t instance) {
+  return coco_strdupf(suite_largescale_problem_id_template, function, instance, dimension);
+}
+
+/**
+ * Returns the name of the large-scale suite problem without constructing it (matches the name of
+ * get_largescale_problem).
+ */
+static char *suite_largescale_get_problem_name(const size_t function, const size_t dimension, const size_t instance) {
+  return coco_strdupf(suite_largescale_problem_name_template, function, instance, dimension);
+}
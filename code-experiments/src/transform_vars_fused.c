@@ -0,0 +1,179 @@
+/*
+ * Fuse adjacent linear variable transformations into one.
+ */
+#include <assert.h>
+
+#include "coco.h"
+#include "coco_problem.c"
+#include "transform_vars_shift.c"
+#include "transform_vars_scale.c"
+#include "transform_vars_affine.c"
+
+/* One step of the fused transformation: x |-> M x + v if M is not NULL, x |-> x - v if v is not NULL
+ * and x |-> factor * x otherwise. */
+typedef struct {
+  double *M, *v;
+  double factor;
+} transform_vars_fused_step_t;
+
+typedef struct {
+  transform_vars_fused_step_t *steps;
+  size_t number_of_steps;
+  double *x[2]; /* each step reads from one buffer and writes to the other one */
+} transform_vars_fused_data_t;
+
+static void transform_vars_fused_evaluate(coco_problem_t *self, const double *x, double *y) {
+  size_t i, j, k, l;
+  const size_t n = self->number_of_variables;
+  const double *in = x;
+  double *out;
+  transform_vars_fused_data_t *data;
+  coco_problem_t *inner_problem;
+
+  data = coco_transformed_get_data(self);
+  inner_problem = coco_transformed_get_inner_problem(self);
+
+  for (k = 0; k < data->number_of_steps; k = l) {
+    const transform_vars_fused_step_t *step = data->steps + k;
+    out = (in == data->x[0]) ? data->x[1] : data->x[0];
+    if (step->M != NULL) {
+      for (i = 0; i < n; ++i) {
+        const double *current_row = step->M + i * n;
+        double sum = step->v[i];
+        for (j = 0; j < n; ++j) {
+          sum += in[j] * current_row[j];
+        }
+        out[i] = sum;
+      }
+      l = k + 1;
+    } else {
+      /* apply all adjacent shifts and scalings in one pass, in their original order */
+      for (l = k; l < data->number_of_steps && data->steps[l].M == NULL; ++l)
+        ;
+      for (i = 0; i < n; ++i) {
+        double value = in[i];
+        for (step = data->steps + k; step < data->steps + l; ++step) {
+          if (step->v != NULL)
+            value = value - step->v[i];
+          else
+            value = step->factor * value;
+        }
+        out[i] = value;
+      }
+    }
+    in = out;
+  }
+  coco_evaluate_function(inner_problem, in, y);
+}
+
+static void transform_vars_fused_free(void *thing) {
+  transform_vars_fused_data_t *data = thing;
+  size_t k;
+  for (k = 0; k < data->number_of_steps; ++k) {
+    if (data->steps[k].M != NULL)
+      coco_free_memory(data->steps[k].M);
+    if (data->steps[k].v != NULL)
+      coco_free_memory(data->steps[k].v);
+  }
+  coco_free_memory(data->steps);
+  coco_free_memory(data->x[0]);
+  coco_free_memory(data->x[1]);
+}
+
+/**
+ * Returns whether ${problem} is a shift, scale or square affine transformation of the variables.
+ */
+static int transform_vars_fused_is_linear(coco_problem_t *problem) {
+  if (problem->free_problem != transformed_free_problem)
+    return 0;
+  if (problem->evaluate_function == transform_vars_shift_evaluate
+      || problem->evaluate_function == transform_vars_scale_evaluate)
+    return 1;
+  return problem->evaluate_function == transform_vars_affine_evaluate
+      && coco_transformed_get_inner_problem(problem)->number_of_variables == problem->number_of_variables;
+}
+
+/**
+ * Copies the linear transformation ${problem} into ${step}. The step computes the same floating point
+ * operations in the same order as the transformation itself, hence the transformations are not
+ * multiplied into each other and the fused transformation returns bit-identical values.
+ */
+static void transform_vars_fused_copy_step(transform_vars_fused_step_t *step, coco_problem_t *problem) {
+  const size_t n = problem->number_of_variables;
+
+  step->M = NULL;
+  step->v = NULL;
+  step->factor = 1.0;
+  if (problem->evaluate_function == transform_vars_shift_evaluate) {
+    transform_vars_shift_data_t *shift = coco_transformed_get_data(problem);
+    step->v = coco_duplicate_vector(shift->offset, n);
+  } else if (problem->evaluate_function == transform_vars_scale_evaluate) {
+    step->factor = ((transform_vars_scale_data_t *) coco_transformed_get_data(problem))->factor;
+  } else {
+    transform_vars_affine_data_t *affine = coco_transformed_get_data(problem);
+    step->M = coco_duplicate_vector(affine->M, n * n);
+    step->v = coco_duplicate_vector(affine->b, n);
+  }
+}
+
+/**
+ * Frees the user data of the transformed problem ${problem} and returns its inner problem.
+ */
+static coco_problem_t *transform_vars_fused_release_data(coco_problem_t *problem) {
+  coco_transformed_data_t *transformed = problem->data;
+  coco_problem_t *inner_problem = transformed->inner_problem;
+  if (transformed->data != NULL) {
+    if (transformed->free_data != NULL)
+      transformed->free_data(transformed->data);
+    coco_free_memory(transformed->data);
+    transformed->data = NULL;
+  }
+  return inner_problem;
+}
+
+/**
+ * Replaces each sequence of at least two adjacent shift, scale and affine variable transformations in
+ * the chain of transformations of ${problem} by a single transformation that applies their steps one
+ * after the other. Adjacent shifts and scalings are applied in one pass over x. This saves one function
+ * call and, except for affine transformations, one pass over x per fused transformation in each
+ * evaluation, while the function values remain bit-identical. The outermost
+ * transformation of a sequence is changed in place, hence ${problem} and the properties of all problems
+ * in the chain remain valid.
+ */
+static void transform_vars_fused_apply(coco_problem_t *problem) {
+  coco_problem_t *first, *last, *inner_problem;
+  transform_vars_fused_data_t *data;
+  coco_transformed_data_t *transformed;
+  size_t k;
+
+  while (problem->free_problem == transformed_free_problem) {
+    first = problem;
+    problem = coco_transformed_get_inner_problem(first);
+    if (!transform_vars_fused_is_linear(first) || !transform_vars_fused_is_linear(problem))
+      continue;
+
+    data = coco_allocate_memory(sizeof(*data));
+    data->number_of_steps = 0;
+    for (last = first; transform_vars_fused_is_linear(last); last = coco_transformed_get_inner_problem(last))
+      data->number_of_steps++;
+    data->steps = coco_allocate_memory(data->number_of_steps * sizeof(*data->steps));
+    data->x[0] = coco_allocate_vector(first->number_of_variables);
+    data->x[1] = coco_allocate_vector(first->number_of_variables);
+    for (k = 0, last = first; k < data->number_of_steps; ++k, last = coco_transformed_get_inner_problem(last))
+      transform_vars_fused_copy_step(data->steps + k, last);
+    /* last is now the problem below the sequence, first becomes the fused transformation */
+    inner_problem = transform_vars_fused_release_data(first);
+    while (inner_problem != last) {
+      coco_problem_t *next = transform_vars_fused_release_data(inner_problem);
+      inner_problem->free_problem = NULL; /* free the shell only, the transformed data is freed with it */
+      coco_problem_free(inner_problem);
+      inner_problem = next;
+    }
+    transformed = first->data;
+    transformed->inner_problem = last;
+    transformed->data = data;
+    transformed->free_data = transform_vars_fused_free;
+    first->evaluate_function = transform_vars_fused_evaluate;
+    problem = last;
+  }
+}
@@ -15,8 +15,14 @@ typedef struct {
   size_t *first_non_zero_map; /* maps a row to the index of its first non zero element */
 } ls_transform_vars_permblockdiag_t;
 
+/*
+ * Costs O(dimension * block size) per evaluation, the zeros of B are neither stored nor multiplied.
+ */
 static void ls_transform_vars_permblockdiag_evaluate(coco_problem_t *self, const double *x, double *y) {
-  size_t i, j, current_blocksize, first_non_zero_ind;
+  size_t i, j, current_blocksize;
+  const double *current_row;
+  const size_t *current_P1;
+  double sum;
   ls_transform_vars_permblockdiag_t *data;
   coco_problem_t *inner_problem;
   
@@ -25,15 +31,14 @@ static void ls_transform_vars_permblockdiag_evaluate(coco_problem_t *self, const
   
   for (i = 0; i < inner_problem->number_of_variables; ++i) {
     current_blocksize = data->block_size_map[data->P2[i]];/*the block_size is that of the permuted line*/
-    first_non_zero_ind = data->first_non_zero_map[data->P2[i]];
-    data->x[i] = 0;
+    current_row = data->B[data->P2[i]];/*all B lines start at 0*/
+    current_P1 = data->P1 + data->first_non_zero_map[data->P2[i]];
     /*compute data->x[i] = < B[P2[i]] , x[P1] >  */
-    for (j = first_non_zero_ind; j < first_non_zero_ind + current_blocksize; ++j) {/*blocksize[P2[i]]*/
-      data->x[i] += data->B[data->P2[i]][j - first_non_zero_ind] * x[data->P1[j]];/*all B lines start at 0*/
+    sum = 0;
+    for (j = 0; j < current_blocksize; ++j) {
+      sum += current_row[j] * x[current_P1[j]];
     }
-    if (data->x[i] > 100 || data->x[i] < -100 || 1) {
-    }
-    
+    data->x[i] = sum;
   }
   
   coco_evaluate_function(inner_problem, data->x, y);
@@ -41,12 +46,17 @@ static void ls_transform_vars_permblockdiag_evaluate(coco_problem_t *self, const
 
 static void ls_transform_vars_permblockdiag_free(void *thing) {
   ls_transform_vars_permblockdiag_t *data = thing;
-  coco_free_memory(data->B);
+  size_t i, number_of_variables = 0;
+  for (i = 0; i < data->nb_blocks; i++) {
+    number_of_variables += data->block_sizes[i];
+  }
+  ls_free_block_matrix(data->B, number_of_variables);
   coco_free_memory(data->P1);
   coco_free_memory(data->P2);
   coco_free_memory(data->block_sizes);
   coco_free_memory(data->x);
   coco_free_memory(data->block_size_map);
+  coco_free_memory(data->first_non_zero_map);
 }
 
 /*
@@ -31,10 +31,169 @@ static void test_coco_observer_evaluation_to_log(void **state) {
   (void)state; /* unused */
 }
 
+/**
+ * Tests the function coco_observer_next_evaluation_to_log.
+ */
+static void test_coco_observer_next_evaluation_to_log(void **state) {
+
+  size_t dimensions[6] = { 2, 3, 5, 10, 20, 40 };
+  size_t evals, next, i, dim;
+
+  for (i = 0; i < 6; i++) {
+    dim = dimensions[i];
+    next = coco_observer_next_evaluation_to_log(0, dim);
+    assert_true(next == 1);
+    for (evals = 1; evals < 1500; evals++) {
+      assert_true(coco_observer_evaluation_to_log(evals, dim) == (evals == next));
+      if (evals == next) {
+        next = coco_observer_next_evaluation_to_log(evals, dim);
+        assert_true(next > evals);
+      }
+    }
+  }
+
+  (void)state; /* unused */
+}
+
+/**
+ * Tests that the incrementally maintained hypervolume of the bi-objective logger equals the hypervolume of
+ * its archive and that batch evaluations are logged like single ones.
+ */
+static void test_logger_biobj_hypervolume(void **state) {
+
+  coco_suite_t *suite;
+  coco_observer_t *observer;
+  coco_random_state_t *random_generator;
+  coco_problem_t *problem[2];
+  logger_biobj_t *logger[2];
+  avl_node_t *node;
+  logger_biobj_avl_item_t *item;
+  double x[10 * 2], y[10 * 2], single_y[2];
+  double hypervolume, left_y0;
+  char *result_folder;
+  size_t i, j, k;
+
+  observer = coco_observer("bbob-biobj", "result_folder: test_logger_biobj log_nondominated: none");
+  result_folder = coco_strdup(coco_observer_get_result_folder(observer));
+  suite = coco_suite("bbob-biobj", NULL, "dimensions: 2 function_idx: 1");
+  random_generator = coco_random_new(42);
+  for (k = 0; k < 2; k++) {
+    problem[k] = coco_problem_add_observer(coco_suite_get_problem(suite, 0), observer);
+    logger[k] = (logger_biobj_t *) coco_transformed_get_data(problem[k]);
+  }
+
+  for (i = 0; i < 100; i++) {
+    for (j = 0; j < 10 * 2; j++)
+      x[j] = coco_random_uniform(random_generator) * 10 - 5;
+    coco_evaluate_function_batch(problem[0], x, 10, y);
+    for (j = 0; j < 10; j++) {
+      coco_evaluate_function(problem[1], x + 2 * j, single_y);
+      assert_true(y[2 * j] == single_y[0] && y[2 * j + 1] == single_y[1]);
+    }
+  }
+  assert_true(coco_problem_get_evaluations(problem[0]) == coco_problem_get_evaluations(problem[1]));
+  assert_true(logger[0]->indicators[0]->current_value == logger[1]->indicators[0]->current_value);
+
+  /* Recompute the hypervolume from scratch */
+  hypervolume = 0;
+  left_y0 = problem[0]->nadir_value[0];
+  for (node = logger[0]->archive_tree->head; node != NULL; node = node->next) {
+    item = (logger_biobj_avl_item_t *) node->item;
+    if (item->within_ROI) {
+      hypervolume += logger_biobj_hyp_contribution(problem[0], left_y0, item->y);
+      left_y0 = item->y[0];
+    }
+  }
+  assert_true(hypervolume > 0);
+  assert_true(fabs(hypervolume - logger[0]->indicators[0]->current_value) < 1e-12);
+
+  for (k = 0; k < 2; k++)
+    coco_problem_free(problem[k]);
+  coco_random_free(random_generator);
+  coco_suite_free(suite);
+  coco_observer_free(observer);
+  coco_remove_directory(result_folder);
+  coco_free_memory(result_folder);
+
+  (void)state; /* unused */
+}
+
+/**
+ * Tests that logger_biobj_find_dominated marks exactly the objective vectors without NaN that are weakly
+ * dominated by the archive, also if some of the vectors contain NaN.
+ */
+static void test_logger_biobj_find_dominated_with_nan(void **state) {
+
+  coco_suite_t *suite;
+  coco_observer_t *observer;
+  coco_random_state_t *random_generator;
+  coco_problem_t *problem, *unobserved_problem;
+  logger_biobj_t *logger;
+  avl_node_t *node;
+  logger_biobj_avl_item_t *item;
+  double x[50 * 2], y[50 * 2];
+  double zero = 0, nan; /* NAN might not be defined in C89 */
+  int is_dominated[50], is_weakly_dominated;
+  char *result_folder;
+  size_t i, j;
+
+  observer = coco_observer("bbob-biobj", "result_folder: test_logger_biobj_nan log_nondominated: none");
+  result_folder = coco_strdup(coco_observer_get_result_folder(observer));
+  suite = coco_suite("bbob-biobj", NULL, "dimensions: 2 function_idx: 1");
+  random_generator = coco_random_new(42);
+  nan = zero / zero;
+  assert_true(coco_is_nan(nan));
+  problem = coco_problem_add_observer(coco_suite_get_problem(suite, 0), observer);
+  unobserved_problem = coco_suite_get_problem(suite, 0);
+  logger = (logger_biobj_t *) coco_transformed_get_data(problem);
+
+  for (i = 0; i < 20; i++) {
+    /* Extend the archive */
+    for (j = 0; j < 50 * 2; j++)
+      x[j] = coco_random_uniform(random_generator) * 10 - 5;
+    coco_evaluate_function_batch(problem, x, 50, y);
+    /* Check new vectors, some of which contain NaN */
+    for (j = 0; j < 50 * 2; j++)
+      x[j] = coco_random_uniform(random_generator) * 10 - 5;
+    coco_evaluate_function_batch(unobserved_problem, x, 50, y);
+    for (j = 0; j < 50; j++) {
+      if (coco_random_uniform(random_generator) < 0.1)
+        y[2 * j] = nan;
+      if (coco_random_uniform(random_generator) < 0.1)
+        y[2 * j + 1] = nan;
+    }
+    logger_biobj_find_dominated(logger, y, 50, is_dominated);
+    for (j = 0; j < 50; j++) {
+      is_weakly_dominated = 0;
+      if (!coco_is_nan(y[2 * j]) && !coco_is_nan(y[2 * j + 1])) {
+        for (node = logger->archive_tree->head; node != NULL; node = node->next) {
+          item = (logger_biobj_avl_item_t *) node->item;
+          if (item->y[0] <= y[2 * j] && item->y[1] <= y[2 * j + 1])
+            is_weakly_dominated = 1;
+        }
+      }
+      assert_true(is_dominated[j] == is_weakly_dominated);
+    }
+  }
+
+  coco_problem_free(problem);
+  coco_problem_free(unobserved_problem);
+  coco_random_free(random_generator);
+  coco_suite_free(suite);
+  coco_observer_free(observer);
+  coco_remove_directory(result_folder);
+  coco_free_memory(result_folder);
+
+  (void)state; /* unused */
+}
+
 static int test_all_coco_observer(void) {
 
   const struct CMUnitTest tests[] = {
-      cmocka_unit_test(test_coco_observer_evaluation_to_log)
+      cmocka_unit_test(test_coco_observer_evaluation_to_log),
+      cmocka_unit_test(test_coco_observer_next_evaluation_to_log),
+      cmocka_unit_test(test_logger_biobj_hypervolume),
+      cmocka_unit_test(test_logger_biobj_find_dominated_with_nan)
   };
 
   return cmocka_run_group_tests(tests, NULL, NULL);
@@ -66,10 +66,169 @@ static void test_coco_suite_encode_problem_index(void **state) {
   (void)state; /* unused */
 }
 
+/**
+ * Tests that the problem meta data can be retrieved without constructing the problems and matches the one
+ * of the constructed problems.
+ */
+static void test_coco_suite_get_problem_meta_data(void **state) {
+
+  coco_suite_t *suite;
+  coco_problem_t *problem;
+  long index;
+  char *id, *name;
+
+  suite = coco_suite("bbob-biobj", "instances: 2-4", "dimensions: 5,20 function_idx: 3");
+  index = coco_suite_get_next_problem_index(suite, -1);
+  assert_true(index == 336);
+  problem = coco_suite_get_problem(suite, (size_t) index);
+  id = coco_suite_get_problem_id(suite, (size_t) index);
+  name = coco_suite_get_problem_name(suite, (size_t) index);
+  assert_true(strcmp(id, coco_problem_get_id(problem)) == 0);
+  assert_true(strcmp(name, coco_problem_get_name(problem)) == 0);
+  assert_true(coco_suite_get_problem_dimension(suite, (size_t) index) == 5);
+  assert_true(coco_suite_get_problem_number_of_objectives(suite, (size_t) index) == 2);
+  coco_free_memory(id);
+  coco_free_memory(name);
+  coco_problem_free(problem);
+
+  index = coco_suite_get_next_problem_index(suite, index);
+  assert_true(index == 337);
+  index = coco_suite_get_next_problem_index(suite, 338);
+  assert_true(index == 666);
+  index = coco_suite_get_next_problem_index(suite, 668);
+  assert_true(index == -1);
+  coco_suite_free(suite);
+
+  (void)state; /* unused */
+}
+
+/**
+ * Tests that fusing adjacent linear variable transformations does not change the function values.
+ */
+static void test_transform_vars_fused_apply(void **state) {
+
+  coco_problem_t *problem;
+  const double M[4] = { 1.0, 2.0, -3.0, 0.5 };
+  const double b[2] = { 0.25, -1.0 };
+  const double offset[2] = { 1.0, -2.0 };
+  double x[2] = { 0.5, 3.0 };
+  double y[2], z[2], f, g;
+
+  /* x |-> sphere(M (2 (x - offset) - offset) + b) + 10 */
+  problem = f_sphere_allocate(2);
+  problem = f_transform_vars_affine(problem, M, b, 2);
+  problem = f_transform_vars_shift(problem, offset, 0);
+  problem = f_transform_vars_scale(problem, 2.0);
+  problem = f_transform_vars_shift(problem, offset, 0);
+  problem = f_transform_obj_shift(problem, 10.0);
+  coco_evaluate_function(problem, x, &f);
+  transform_vars_fused_apply(problem);
+  assert_true(coco_transformed_get_inner_problem(problem)->evaluate_function == transform_vars_fused_evaluate);
+  coco_evaluate_function(problem, x, &g);
+
+  y[0] = 2 * (x[0] - offset[0]) - offset[0];
+  y[1] = 2 * (x[1] - offset[1]) - offset[1];
+  z[0] = M[0] * y[0] + M[1] * y[1] + b[0];
+  z[1] = M[2] * y[0] + M[3] * y[1] + b[1];
+  assert_true(fabs(f - (z[0] * z[0] + z[1] * z[1] + 10.0)) < 1e-12);
+  assert_true(f == g);
+  coco_problem_free(problem);
+
+  (void)state; /* unused */
+}
+
+/**
+ * Tests that fusing the variable transformations of f19 and f20 returns exactly the function values of
+ * the original chain of transformations.
+ */
+static void test_transform_vars_fused_apply_is_exact(void **state) {
+
+  coco_problem_t *problem, *fused_problem;
+  coco_random_state_t *random_generator;
+  const size_t dimensions[6] = { 2, 3, 5, 10, 20, 40 };
+  double x[40], f, g;
+  size_t function, dimension, instance, i, j, k;
+
+  random_generator = coco_random_new(42);
+  for (function = 19; function <= 20; ++function) {
+    for (i = 0; i < 6; ++i) {
+      for (instance = 1; instance <= 15; ++instance) {
+        const long rseed = (long) (function + 10000 * instance);
+        dimension = dimensions[i];
+        if (function == 19) {
+          problem = f_griewank_rosenbrock_bbob_problem_allocate(function, dimension, instance, rseed,
+              suite_bbob_problem_id_template, suite_bbob_problem_name_template);
+          fused_problem = f_griewank_rosenbrock_bbob_problem_allocate(function, dimension, instance, rseed,
+              suite_bbob_problem_id_template, suite_bbob_problem_name_template);
+        } else {
+          problem = f_schwefel_bbob_problem_allocate(function, dimension, instance, rseed,
+              suite_bbob_problem_id_template, suite_bbob_problem_name_template);
+          fused_problem = f_schwefel_bbob_problem_allocate(function, dimension, instance, rseed,
+              suite_bbob_problem_id_template, suite_bbob_problem_name_template);
+        }
+        transform_vars_fused_apply(fused_problem);
+        for (j = 0; j < 10; ++j) {
+          for (k = 0; k < dimension; ++k)
+            x[k] = coco_random_uniform(random_generator) * 10 - 5;
+          coco_evaluate_function(problem, x, &f);
+          coco_evaluate_function(fused_problem, x, &g);
+          assert_true(f == g);
+        }
+        coco_problem_free(problem);
+        coco_problem_free(fused_problem);
+      }
+    }
+  }
+  coco_random_free(random_generator);
+
+  (void)state; /* unused */
+}
+
+/**
+ * Tests that the cached rotation matrices and optimal solutions equal the generated ones.
+ */
+static void test_bbob2009_cache(void **state) {
+
+  coco_suite_t *suite;
+  double **rotation, **cached_rotation;
+  double xopt[5], cached_xopt[5];
+  size_t i, j;
+
+  rotation = bbob2009_allocate_matrix(5, 5);
+  cached_rotation = bbob2009_allocate_matrix(5, 5);
+  bbob2009_compute_rotation(rotation, 10007, 5);
+  bbob2009_compute_xopt(xopt, 10007, 5);
+  assert_true(bbob2009_cache_lookup(1, 10007, 5) == NULL);
+
+  suite = coco_suite("bbob", "", "dimensions: 5");
+  bbob2009_compute_rotation(cached_rotation, 10007, 5);
+  bbob2009_compute_xopt(cached_xopt, 10007, 5);
+  assert_true(bbob2009_cache_lookup(1, 10007, 5) != NULL);
+  assert_true(bbob2009_cache_lookup(0, 10007, 5) != NULL);
+  bbob2009_compute_rotation(cached_rotation, 10007, 5);
+  bbob2009_compute_xopt(cached_xopt, 10007, 5);
+  for (i = 0; i < 5; ++i) {
+    assert_true(xopt[i] == cached_xopt[i]);
+    for (j = 0; j < 5; ++j)
+      assert_true(rotation[i][j] == cached_rotation[i][j]);
+  }
+  coco_suite_free(suite);
+  assert_true(bbob2009_cache_lookup(1, 10007, 5) == NULL);
+
+  bbob2009_free_matrix(rotation, 5);
+  bbob2009_free_matrix(cached_rotation, 5);
+
+  (void)state; /* unused */
+}
+
 static int test_all_coco_suite(void) {
 
   const struct CMUnitTest tests[] = {
-      cmocka_unit_test(test_coco_suite_encode_problem_index)
+      cmocka_unit_test(test_coco_suite_encode_problem_index),
+      cmocka_unit_test(test_coco_suite_get_problem_meta_data),
+      cmocka_unit_test(test_transform_vars_fused_apply),
+      cmocka_unit_test(test_transform_vars_fused_apply_is_exact),
+      cmocka_unit_test(test_bbob2009_cache)
   };
 
   return cmocka_run_group_tests(tests, NULL, NULL);
@@ -229,6 +229,8 @@ isRLDistr = True
 ##
 isLogLoss = True # only affects rungeneric1
 isPickled = False # only affects rungeneric1
+jobs = 1 # number of processes reading the data files
+data_cache_folder = os.path.join(os.path.expanduser('~'), '.bbob_pproc-cache') # aligned data of the read data files, one file per index entry, None disables the cache
 ##    
 isScatter = True # only affects rungeneric2
 isScaleUp = True # only affects rungeneric2, only set here and not altered by any command line argument for now
@@ -240,7 +242,7 @@ longoptlist = ["help", "output-dir=", "noisy", "noise-free",
                "verbose", "settings=", "conv", 
                "expensive", "not-expensive", "runlength-based",
                "los-only", "crafting-effort=", "pickle",
-               "sca-only", "svg"]
+               "sca-only", "svg", "jobs=", "no-cache"]
 # thereby, "los-only", "crafting-effort=", and "pickle" affect only rungeneric1
 # and "sca-only" only affects rungeneric2
 
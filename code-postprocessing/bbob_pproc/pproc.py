@@ -23,13 +23,16 @@ import sys
 import os
 import ast
 import re
+import hashlib
+import tempfile
+import multiprocessing
 import pickle, gzip  # gzip is for future functionality: we probably never want to pickle without gzip anymore
 import warnings
 from pdb import set_trace
 import numpy, numpy as np
 import matplotlib.pyplot as plt
 from . import genericsettings, findfiles, toolsstats, toolsdivers
-from .readalign import split, alignData, HMultiReader, VMultiReader
+from .readalign import split, split_binary, alignData, HMultiReader, VMultiReader
 from .readalign import HArrayMultiReader, VArrayMultiReader, alignArrayData
 from .ppfig import consecutiveNumbers
 
@@ -37,6 +40,77 @@ do_assertion = genericsettings.force_assertions # expensive assertions
 targets_displayed_for_info = [10, 1., 1e-1, 1e-3, 1e-5, 1e-8]  # only to display info in DataSetList.info
 maximal_evaluations_only_to_last_target = False  # was true in release 13.03, leads naturally to better results
 
+_data_cache_version = 2  # increase when reading or aligning data files changes
+
+def _data_cache_file(dataFiles, isBiobjective):
+    """return the name of the file in ``genericsettings.data_cache_folder``
+    with the aligned data of `dataFiles` and the stamp of `dataFiles`, or
+    ``(None, None)`` if the cache is disabled or a data file is missing.
+
+    The name is a hash of the paths of the data files, hence each index
+    entry has a single cache file, which is overwritten when the data files
+    change. The stamp, the sizes and modification times of the data files,
+    is saved in the cache file, such that changed data files are not read
+    from the cache.
+
+    """
+    if not genericsettings.data_cache_folder:
+        return None, None
+    key = [_data_cache_version, isBiobjective]
+    stamp = []
+    for name in dataFiles:
+        try:
+            stat = os.stat(name)
+        except OSError:
+            return None, None
+        key.append(os.path.abspath(name))
+        stamp.append((stat.st_size, stat.st_mtime))
+    return (os.path.join(genericsettings.data_cache_folder,
+                         hashlib.sha1(repr(key)).hexdigest() + '.npz'),
+            numpy.array(stamp, dtype=float))
+
+def _load_cached_data(fileName, stamp):
+    """return a dictionary of the arrays in cache file `fileName` or None
+    if there is no such (readable) file or it was saved with another
+    `stamp`."""
+    if not os.path.exists(fileName):
+        return None
+    try:
+        f = numpy.load(fileName)
+        try:
+            if '_stamp' not in f.files or not numpy.array_equal(f['_stamp'], stamp):
+                return None  # the data files changed, the file is overwritten
+            return dict((key, f[key]) for key in f.files if key != '_stamp')
+        finally:
+            f.close()
+    except Exception:  # truncated or otherwise corrupt, the data are read again
+        warnings.warn('Could not read data cache file %s.' % fileName)
+        return None
+
+def _save_cached_data(fileName, stamp, arrays):
+    """save the dictionary `arrays` with `stamp` in cache file `fileName`,
+    replacing a previous version of the file.
+
+    The data are written into a temporary file which is then renamed,
+    hence processes reading the cache never see a partially written file.
+
+    """
+    folder = os.path.dirname(fileName)
+    tmpName = None
+    try:
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        fd, tmpName = tempfile.mkstemp(suffix='.tmp', dir=folder)
+        with os.fdopen(fd, 'wb') as f:
+            numpy.savez(f, _stamp=stamp, **arrays)
+        if os.name == 'nt' and os.path.exists(fileName):
+            os.remove(fileName)  # rename does not replace files on Windows
+        os.rename(tmpName, fileName)
+    except (IOError, OSError):
+        warnings.warn('Could not write data cache file %s.' % fileName)
+        if tmpName and os.path.exists(tmpName):
+            os.remove(tmpName)
+
 
 def _DataSet_complement_data(self, step=10**0.2, final_target=1e-8):
     """insert a line for each target value.
@@ -662,7 +736,8 @@ class DataSet():
     def isBiobjective(self):
         return hasattr(self, 'indicator')
     
-    def __init__(self, header, comment, data, indexfile, verbose=True):
+    def __init__(self, header, comment, data, indexfile, verbose=True,
+                 trial_data=None):
         """Instantiate a DataSet.
 
         The first three input argument corresponds to three consecutive
@@ -674,6 +749,11 @@ class DataSet():
         :keyword string indexfile: string for the file name from where
                                    the information come
         :keyword bool verbose: controls verbosity
+        :keyword tuple trial_data: two lists with one array per trial,
+                                   holding the lines of the .dat and
+                                   .tdat files, which are then not
+                                   read, e.g. from a
+                                   ``cocoex.MemoryObserver``
 
         """
         # Extract information from the header line.
@@ -754,31 +834,36 @@ class DataSet():
 
         # Treat successively the data in dat and tdat files:
         # put into variable dataFiles the files where to look for data
-        dataFiles = list(os.path.join(filepath, os.path.splitext(i)[0] + '.dat')
+        # binary data files of the "bbob" observer end with bdat and btdat
+        isBinary = any(i.endswith('.bdat') for i in self.dataFiles)
+        if isBinary:
+            dataExtensions, readData = ('.bdat', '.btdat'), split_binary
+        else:
+            dataExtensions, readData = ('.dat', '.tdat'), split
+        dataFiles = list(os.path.join(filepath, os.path.splitext(i)[0] + dataExtensions[0])
                          for i in self.dataFiles)
-        data = HMultiReader(split(dataFiles), self.isBiobjective())
-        if verbose:
-            print ("Processing %s: %d/%d trials found."
-                   % (dataFiles, len(data), len(self.instancenumbers)))
-        (adata, maxevals, finalfunvals) = alignData(data, self.isBiobjective())
-        self.evals = adata
-        try:
-            for i in range(len(maxevals)):
-                self.maxevals[i] = max(maxevals[i], self.maxevals[i])
-                self.finalfunvals[i] = min(finalfunvals[i], self.finalfunvals[i])
-        except AttributeError:
-            self.maxevals = maxevals
-            self.finalfunvals = finalfunvals
-
-        if not self.isBiobjective():        
-            dataFiles = list(os.path.join(filepath, os.path.splitext(i)[0] + '.tdat')
-                             for i in self.dataFiles)
-            data = VMultiReader(split(dataFiles), self.isBiobjective())
+        tdataFiles = list(os.path.join(filepath, os.path.splitext(i)[0] + dataExtensions[1])
+                          for i in self.dataFiles)
+        # the aligned data of unchanged data files are read from the cache
+        cacheFile = None
+        if not trial_data:
+            cacheFile, cacheStamp = _data_cache_file(
+                dataFiles if self.isBiobjective() else dataFiles + tdataFiles,
+                self.isBiobjective())
+        cachedData = _load_cached_data(cacheFile, cacheStamp) if cacheFile else None
+        if cachedData is not None:
+            for key, value in cachedData.items():
+                setattr(self, key, value)
+            if verbose:
+                print "Read aligned data of %s from %s." % (dataFiles, cacheFile)
+        else:
+            data = HMultiReader(trial_data[0] if trial_data else readData(dataFiles),
+                                self.isBiobjective())
             if verbose:
                 print ("Processing %s: %d/%d trials found."
                        % (dataFiles, len(data), len(self.instancenumbers)))
             (adata, maxevals, finalfunvals) = alignData(data, self.isBiobjective())
-            self.funvals = adata
+            self.evals = adata
             try:
                 for i in range(len(maxevals)):
                     self.maxevals[i] = max(maxevals[i], self.maxevals[i])
@@ -786,6 +871,28 @@ class DataSet():
             except AttributeError:
                 self.maxevals = maxevals
                 self.finalfunvals = finalfunvals
+
+            if not self.isBiobjective():
+                data = VMultiReader(trial_data[1] if trial_data else readData(tdataFiles),
+                                    self.isBiobjective())
+                if verbose:
+                    print ("Processing %s: %d/%d trials found."
+                           % (tdataFiles, len(data), len(self.instancenumbers)))
+                (adata, maxevals, finalfunvals) = alignData(data, self.isBiobjective())
+                self.funvals = adata
+                try:
+                    for i in range(len(maxevals)):
+                        self.maxevals[i] = max(maxevals[i], self.maxevals[i])
+                        self.finalfunvals[i] = min(finalfunvals[i], self.finalfunvals[i])
+                except AttributeError:
+                    self.maxevals = maxevals
+                    self.finalfunvals = finalfunvals
+
+            if cacheFile:
+                cachedData = dict((key, getattr(self, key)) for key in
+                                  ('evals', 'funvals', 'maxevals', 'finalfunvals')
+                                  if hasattr(self, key))
+                _save_cached_data(cacheFile, cacheStamp, cachedData)
         #TODO: take for maxevals the max for each trial, for finalfunvals the min...
 
         #extensions = {'.dat':(HMultiReader, 'evals'), '.tdat':(VMultiReader, 'funvals')}
@@ -1088,7 +1195,7 @@ class DataSet():
                         self.pickleFile += '.gz'
                     f = gzip.open(self.pickleFile, 'w')
                 else:        
-                    f = open(self.pickleFile, 'w') # TODO: what if file already exist?
+                    f = open(self.pickleFile, 'wb') # TODO: what if file already exist?
                 pickle.dump(self, f)
                 f.close()
                 if verbose:
@@ -1340,6 +1447,87 @@ class DataSet():
         return plt.gca()
 
 
+_merged_data_attributes = ('evals', 'funvals', 'maxevals', 'finalfunvals')  # aligned by DataSetList._mergeData
+
+def _data_set_key(ds):
+    """return the attributes which are equal for DataSet instances in
+    :py:class:`DataSetList` which are equal, except for `precision` and
+    the extra attributes."""
+    return (ds.__class__, ds.funcId, ds.dim, ds.algId, ds.comment)
+
+def _data_set_lists(d):
+    """replace the lists of DataSet values of dictionary `d` by
+    :py:class:`DataSetList` instances and return `d`.
+
+    The elements of each list are appended at once, such that equal
+    elements are looked up in the index of the new DataSetList.
+
+    """
+    for key in d.keys():
+        d[key] = DataSetList(d[key], check_data_type=False)
+    return d
+
+def _read_index_entries(indexFile, verbose=True):
+    """return a list with the arguments of :py:class:`DataSet` for each
+    entry of the index file `indexFile`."""
+
+    entries = []
+    try:
+        f = open(indexFile)
+        if verbose:
+            print 'Processing %s.' % indexFile
+
+        # Read all data sets within one index file.
+        nbLine = 1
+        data_file_names = []
+        header = ''
+        while True:
+            try:
+                if 'indicator' not in header:
+                    header = f.next()
+                    while not header.strip(): # remove blank lines
+                        header = f.next()
+                        nbLine += 1
+                    comment = f.next()
+                    if not comment.startswith('%'):
+                        warnings.warn('Entry in file %s at line %d is faulty: '
+                                      % (indexFile, nbLine) +
+                                      'it will be skipped.')
+                        nbLine += 2
+                        continue
+
+                data = f.next()  # this is the filename of the data file!?
+                data_file_names.append(data)
+                nbLine += 3
+                #TODO: check that something is not wrong with the 3 lines.
+                entries.append((header, comment, data, indexFile, verbose))
+            except StopIteration:
+                break
+        # Close index file
+        f.close()
+        if len(data_file_names) != len(set(data_file_names)):
+            warnings.warn("WARNING: a data file has been referenced" +
+                " several times in file %s:" % indexFile)
+            data_file_names = sorted(data_file_names)
+            for i in range(1, data_file_names):
+                if data_file_names[i-1] == data_file_names[i]:
+                    warnings.warn("    data file " + data_file_names[i])
+            warnings.warn("  This is likely to produce spurious results.")
+
+    except IOError:
+        print 'Could not open %s.' % indexFile
+    return entries
+
+def _init_loading_process(data_cache_folder):
+    """set the settings of the parent process which are used to create
+    DataSet instances in a process of `DataSetList._loadIndexFiles`."""
+    genericsettings.data_cache_folder = data_cache_folder
+
+def _load_index_entry(entry):
+    """return the DataSet of the index file entry `entry`, an element of
+    the list of `_read_index_entries`."""
+    return DataSet(*entry)
+
 class DataSetList(list):
     """List of instances of :py:class:`DataSet`.
 
@@ -1352,7 +1540,8 @@ class DataSetList(list):
     #Do not inherit from set because DataSet instances are mutable which means
     #they might change over time.
 
-    def __init__(self, args=[], verbose=False, check_data_type=True):
+    def __init__(self, args=[], verbose=False, check_data_type=True,
+                 workers=1):
         """Instantiate self from a list of folder- or filenames or 
         ``DataSet`` instances.
 
@@ -1360,6 +1549,15 @@ class DataSetList(list):
                             containing info files or pickled data files,
                             or a list of DataSets.
         :keyword bool verbose: controls verbosity.
+        :keyword int workers: number of processes which read the data
+                              files of the entries of the info files.
+                              The DataSet instances are merged in
+                              the order of reading them in a single
+                              process.
+
+        The aligned data read from the data files of an info file are
+        cached in ``genericsettings.data_cache_folder``, such that data
+        files which did not change since are not read again.
 
         Exceptions:
         Warning -- Unexpected user input.
@@ -1380,8 +1578,10 @@ class DataSetList(list):
             # TODO: loaded instances are not DataSets but
             # ``or hasattr(args[0], 'algId')`` fails in self.append
             # initialize a DataSetList from a sequence of DataSet
+            self._pendingMerges = {}
             for ds in args:
                 self.append(ds, check_data_type)
+            self._mergePending()
             return
 
         if hasattr(args[0], 'algId'):
@@ -1393,9 +1593,16 @@ class DataSetList(list):
                 fnames.extend(findfiles.main(name, verbose))
             else:
                 fnames.append(name)
-        for name in fnames: 
+        loadedDataSets = {}
+        if workers > 1:
+            loadedDataSets = self._loadIndexFiles(fnames, workers, verbose)
+        self._pendingMerges = {}
+        for k, name in enumerate(fnames): 
             if isinstance(name, DataSet):
                 self.append(name)
+            elif name.endswith('.info') and workers > 1:
+                for ds in loadedDataSets.get(k, []):
+                    self.append(ds)
             elif name.endswith('.info'):
                 self.processIndexFile(name, verbose)
             elif name.endswith('.pickle') or name.endswith('.pickle.gz'):
@@ -1404,7 +1611,7 @@ class DataSetList(list):
                     if name.endswith('.gz'):
                         f = gzip.open(name)
                     else:
-                        f = open(name,'r')
+                        f = open(name, 'rb')
                     try:
                         entry = pickle.load(f)
                     except pickle.UnpicklingError:
@@ -1429,7 +1636,8 @@ class DataSetList(list):
                               'containing .info file(s).')
                 warnings.warn(s)
                 print s
-            self.sort()
+        self._mergePending()
+        self.sort()
 
         data_consistent = True
         for ds in self:
@@ -1440,60 +1648,79 @@ class DataSetList(list):
     def processIndexFile(self, indexFile, verbose=True):
         """Reads in an index (.info?) file information on the different runs."""
 
+        for entry in _read_index_entries(indexFile, verbose):
+            self.append(DataSet(*entry))
+
+    def _loadIndexFiles(self, fnames, workers, verbose):
+        """Returns a dictionary of the lists of DataSet instances of the
+        index files in `fnames` by their position in `fnames`.
+
+        The DataSet instances are created in a pool of `workers` processes,
+        in the order of `processIndexFile`, and not yet appended to self.
+
+        """
+        positions, entries = [], []
+        for k, name in enumerate(fnames):
+            if isinstance(name, basestring) and name.endswith('.info'):
+                for entry in _read_index_entries(name, verbose):
+                    positions.append(k)
+                    entries.append(entry)
+        if not entries:
+            return {}
+        pool = multiprocessing.Pool(min(workers, len(entries)), _init_loading_process,
+                                    (genericsettings.data_cache_folder, ))
         try:
-            f = open(indexFile)
-            if verbose:
-                print 'Processing %s.' % indexFile
+            dataSets = pool.map(_load_index_entry, entries,
+                                chunksize=1 + len(entries) // (4 * workers))
+        finally:
+            pool.close()
+            pool.join()
+        res = {}
+        for k, ds in zip(positions, dataSets):
+            res.setdefault(k, []).append(ds)
+        return res
 
-            # Read all data sets within one index file.
-            nbLine = 1
-            data_file_names = []
-            header = ''
-            while True:
-                try:
-                    if 'indicator' not in header:
-                        header = f.next()
-                        while not header.strip(): # remove blank lines
-                            header = f.next()
-                            nbLine += 1
-                        comment = f.next()
-                        if not comment.startswith('%'):
-                            warnings.warn('Entry in file %s at line %d is faulty: '
-                                          % (indexFile, nbLine) +
-                                          'it will be skipped.')
-                            nbLine += 2
-                            continue
-
-                    data = f.next()  # this is the filename of the data file!?
-                    data_file_names.append(data)
-                    nbLine += 3
-                    #TODO: check that something is not wrong with the 3 lines.
-                    self.append(DataSet(header, comment, data, indexFile,
-                                        verbose))
-                except StopIteration:
-                    break
-            # Close index file
-            f.close()
-            if len(data_file_names) != len(set(data_file_names)):
-                warnings.warn("WARNING: a data file has been referenced" +
-                    " several times in file %s:" % indexFile)
-                data_file_names = sorted(data_file_names)
-                for i in range(1, data_file_names):
-                    if data_file_names[i-1] == data_file_names[i]:
-                        warnings.warn("    data file " + data_file_names[i])
-                warnings.warn("  This is likely to produce spurious results.")
-
-        except IOError:
-            print 'Could not open %s.' % indexFile
+    def _index(self):
+        """Returns a dictionary of the lists of elements of self by the
+        attributes compared in :py:meth:`DataSet.__eq__` except for
+        `precision` and the extra attributes.
+
+        The dictionary is kept up to date by `append` while self is
+        initialized or extended. It is rebuilt at the start of `extend`
+        and if the length of self was changed otherwise, because the
+        elements may have been renamed or replaced in the meantime.
+
+        """
+        if getattr(self, '_indexLength', None) != len(self):
+            self._indexByKey = {}
+            for i in self:
+                self._indexByKey.setdefault(_data_set_key(i), []).append(i)
+            self._indexLength = len(self)
+        return self._indexByKey
 
     def append(self, o, check_data_type=False):
-        """Redefines the append method to check for unicity."""
+        """Redefines the append method to check for unicity.
+
+        The data of `o` are merged into an equal element of self if
+        there is one. While self is initialized or extended, this
+        element is looked up in a dictionary by the attributes of `o` and
+        the data arrays of all merged DataSet are aligned only once, at
+        the end. Otherwise self is searched, as its elements may have
+        been renamed since the last call.
+
+        """
 
         if check_data_type and not isinstance(o, DataSet):
             warnings.warn('appending a non-DataSet to the DataSetList')
             raise Exception('Expect DataSet instance.')
+        key = _data_set_key(o)
+        if getattr(self, '_pendingMerges', None) is not None:
+            candidates = self._index().setdefault(key, [])
+        else:
+            candidates = [i for i in self if _data_set_key(i) == key]
+            self._indexLength = None # rebuilt when needed
         isFound = False
-        for i in self:
+        for i in candidates:
             if i == o:
                 isFound = True
                 if i.instancenumbers == o.instancenumbers and any([_i > 5 for _i in i.instancenumbers]):
@@ -1512,16 +1739,15 @@ class DataSetList(list):
                 if 1 < 3:
                     i.dataFiles.extend(o.dataFiles)
                     i.indexFiles.extend(o.indexFiles)
-                    i.funvals = alignArrayData(VArrayMultiReader([i.funvals, o.funvals]))
-                    i.finalfunvals = numpy.r_[i.finalfunvals, o.finalfunvals]
-                    i.evals = alignArrayData(HArrayMultiReader([i.evals, o.evals], self.isBiobjective()))
-                    i.maxevals = numpy.r_[i.maxevals, o.maxevals]
-                    i.computeERTfromEvals()
+                    if getattr(self, '_pendingMerges', None) is not None:
+                        self._pendingMerges.setdefault(id(i), (i, []))[1].append(o)
+                    else:
+                        self._mergeData(i, [o])
                     if getattr(i, 'pickleFile', False):
                         i.modsFromPickleVersion = True
 
                     for j in dir(i):
-                        if isinstance(getattr(i, j), list):
+                        if j not in _merged_data_attributes and isinstance(getattr(i, j), list):
                             getattr(i, j).extend(getattr(o, j))
 
                 else:
@@ -1533,16 +1759,49 @@ class DataSetList(list):
                 break
         if not isFound:
             list.append(self, o)
+            if self._indexLength is not None:
+                candidates.append(o)
+                self._indexLength += 1
+
+    def _mergeData(self, ds, others):
+        """Aligns the data arrays of `ds` with those of the DataSet
+        instances in list `others` at once."""
+        ds.funvals = alignArrayData(VArrayMultiReader(
+            [ds.funvals] + list(o.funvals for o in others)))
+        ds.finalfunvals = numpy.concatenate(
+            [ds.finalfunvals] + list(o.finalfunvals for o in others))
+        ds.evals = alignArrayData(HArrayMultiReader(
+            [ds.evals] + list(o.evals for o in others), ds.isBiobjective()))
+        ds.maxevals = numpy.concatenate(
+            [ds.maxevals] + list(o.maxevals for o in others))
+        ds.computeERTfromEvals()
+
+    def _mergePending(self):
+        """Aligns the data arrays of the DataSet instances merged by
+        `append` since ``self._pendingMerges`` was set."""
+        pendingMerges, self._pendingMerges = self._pendingMerges, None
+        for ds, others in pendingMerges.values():
+            self._mergeData(ds, others)
 
     def extend(self, o):
         """Extend with elements.
 
         This method is implemented to prevent problems since append was
-        superseded. This method could be the origin of efficiency issue.
+        superseded. The data of all elements of `o` which are merged are
+        aligned at the end.
 
         """
-        for i in o:
-            self.append(i)
+        if getattr(self, '_pendingMerges', None) is not None: # merged by the caller
+            for i in o:
+                self.append(i)
+            return
+        self._pendingMerges = {}
+        self._indexLength = None # elements may have been renamed
+        try:
+            for i in o:
+                self.append(i)
+        finally:
+            self._mergePending()
 
     def pickle(self, *args, **kwargs):
         """Loop over self to pickle each element."""
@@ -1558,8 +1817,8 @@ class DataSetList(list):
         """
         d = DictAlg()
         for i in self:
-            d.setdefault((i.algId, i.comment), DataSetList()).append(i)
-        return d
+            d.setdefault((i.algId, i.comment), []).append(i)
+        return _data_set_lists(d)
 
     def dictByDim(self):
         """Returns a dictionary of instances of this class by dimensions.
@@ -1570,8 +1829,8 @@ class DataSetList(list):
         """
         d = {}
         for i in self:
-            d.setdefault(i.dim, DataSetList()).append(i)
-        return d
+            d.setdefault(i.dim, []).append(i)
+        return _data_set_lists(d)
 
     def dictByFunc(self):
         """Returns a dictionary of instances of this class by functions.
@@ -1582,8 +1841,8 @@ class DataSetList(list):
         """
         d = {}
         for i in self:
-            d.setdefault(i.funcId, DataSetList()).append(i)
-        return d
+            d.setdefault(i.funcId, []).append(i)
+        return _data_set_lists(d)
 
     def dictByDimFunc(self):
         """Returns a dictionary of instances of this class 
@@ -1606,13 +1865,13 @@ class DataSetList(list):
         if not self.isBiobjective():
             for i in self:
                 if i.funcId in range(1, 56):
-                    sorted.setdefault('noiselessall', DataSetList()).append(i)
+                    sorted.setdefault('noiselessall', []).append(i)
                 elif i.funcId in range(101, 131):
-                    sorted.setdefault('nzall', DataSetList()).append(i)
+                    sorted.setdefault('nzall', []).append(i)
                 else:
                     warnings.warn('Unknown function id.')
 
-        return sorted
+        return _data_set_lists(sorted)
 
     def isBiobjective(self):
         return any(i.isBiobjective() for i in self)
@@ -1629,11 +1888,11 @@ class DataSetList(list):
         for i in self:
             key = getattr(i, 'folder', '')
             if key:
-                sorted.setdefault(key, DataSetList()).append(i)
+                sorted.setdefault(key, []).append(i)
             else:
                 warnings.warn('Unknown group name.')
 
-        return sorted
+        return _data_set_lists(sorted)
 
     def dictByFuncGroupSingleObjective(self):
         """Returns a dictionary of instances of this class by function groups
@@ -1647,25 +1906,25 @@ class DataSetList(list):
         sorted = {} 
         for i in self:
             if i.funcId in range(1, 6):
-                sorted.setdefault('separ', DataSetList()).append(i)
+                sorted.setdefault('separ', []).append(i)
             elif i.funcId in range(6, 10):
-                sorted.setdefault('lcond', DataSetList()).append(i)
+                sorted.setdefault('lcond', []).append(i)
             elif i.funcId in range(10, 15):
-                sorted.setdefault('hcond', DataSetList()).append(i)
+                sorted.setdefault('hcond', []).append(i)
             elif i.funcId in range(15, 20):
-                sorted.setdefault('multi', DataSetList()).append(i)
+                sorted.setdefault('multi', []).append(i)
             elif i.funcId in range(20, 25):
-                sorted.setdefault('mult2', DataSetList()).append(i)
+                sorted.setdefault('mult2', []).append(i)
             elif i.funcId in range(101, 107):
-                sorted.setdefault('nzmod', DataSetList()).append(i)
+                sorted.setdefault('nzmod', []).append(i)
             elif i.funcId in range(107, 122):
-                sorted.setdefault('nzsev', DataSetList()).append(i)
+                sorted.setdefault('nzsev', []).append(i)
             elif i.funcId in range(122, 131):
-                sorted.setdefault('nzsmm', DataSetList()).append(i)
+                sorted.setdefault('nzsmm', []).append(i)
             else:
                 warnings.warn('Unknown function id.')
 
-        return sorted
+        return _data_set_lists(sorted)
 
     def dictByFuncGroup(self):
         """Returns a dictionary of instances of this class by function groups.
@@ -1689,8 +1948,8 @@ class DataSetList(list):
 
         d = {}
         for i in self:
-            d.setdefault(getattr(i, param, None), DataSetList()).append(i)
-        return d
+            d.setdefault(getattr(i, param, None), []).append(i)
+        return _data_set_lists(d)
 
     def info(self, opt=None):
         """Display some information onscreen.
@@ -2143,7 +2402,7 @@ def set_unique_algId(ds_list, ds_list_reference, taken_ids=None):
                 i += 1
             ds.algId = algId + ' ' + str(i)
 
-def processInputArgs(args, verbose=True):
+def processInputArgs(args, verbose=True, workers=1):
     """Process command line arguments.
 
     Returns several instances of :py:class:`DataSetList`, and a list of 
@@ -2157,6 +2416,8 @@ def processInputArgs(args, verbose=True):
 
     :keyword list args: string arguments for folder names
     :keyword bool verbose: controlling verbosity
+    :keyword int workers: number of processes reading the data files of
+                          a folder, see :py:class:`DataSetList`
 
     :returns (all_datasets, pathnames, datasetlists_by_alg):
       all_datasets
@@ -2182,7 +2443,7 @@ def processInputArgs(args, verbose=True):
             filelist = findfiles.main(i, verbose)
             #Do here any sorting or filtering necessary.
             #filelist = list(i for i in filelist if i.count('ppdata_f005'))
-            tmpDsList = DataSetList(filelist, verbose)
+            tmpDsList = DataSetList(filelist, verbose, workers=workers)
             for ds in tmpDsList:
                 ds._data_folder = i
             #Nota: findfiles will find all info AND pickle files in folder i.
@@ -2285,7 +2546,9 @@ def dictAlgByDim2(dictAlg, remove_empty=False):
 
     for alg, dsList in dictAlg.iteritems():
         for i in dsList:
-            res.setdefault(i.dim, {}).setdefault(alg, DataSetList()).append(i)
+            res.setdefault(i.dim, {}).setdefault(alg, []).append(i)
+    for dim in res:
+        _data_set_lists(res[dim])
 
     if remove_empty:
         raise NotImplementedError
@@ -302,6 +302,108 @@ class HArrayMultiReader(ArrayMultiReader, HMultiReader):
 
 #FUNCTION DEFINITIONS
 
+def _finalLine(reader):
+    """Returns the current line of a finished single reader."""
+    line = reader.data[-1].copy()
+    line[reader.idxEvals] = numpy.nan
+    return line
+
+def _dataColumns(data):
+    """Returns the columns of the lines of `data` which are aligned."""
+    return slice(1, None) if isinstance(data, ArrayMultiReader) else [data.idxData]
+
+def _alignVertically(data):
+    """Aligns the data arrays of `data`, a `VMultiReader` which was not
+    read yet, like stepping through the readers in :py:meth:`alignData`.
+
+    The alignment values are known beforehand and each data array is
+    searched for all of them at once. Returns the aligned array and the
+    last lines of the data arrays, or None if the numbers of function
+    evaluations are not nondecreasing.
+
+    """
+    evals = list(i.data[:, data.idx] for i in data)
+    if any(numpy.isnan(e).any() or (e[1:] < e[:-1]).any() for e in evals):
+        return None
+    # the alignment values are the next lines of the readers, which start
+    # with the second line after the initial value
+    values = numpy.unique(numpy.concatenate(
+        [[min(e[0] for e in evals)]] + list(e[1:] if len(e) > 1 else e for e in evals)))
+    columns = _dataColumns(data)
+    res = [values]
+    for i, e in zip(data, evals):
+        nbLines = numpy.searchsorted(e, values, 'right') # lines read
+        lines = i.data[numpy.maximum(nbLines, 1) - 1][:, columns]
+        lines[nbLines == len(e)] = _finalLine(i)[columns]
+        res.append(lines)
+    return numpy.column_stack(res), list(i.data[-1] for i in data)
+
+def _alignHorizontally(data):
+    """Aligns the data arrays of `data`, an `HMultiReader` which was not
+    read yet, like stepping through the readers in :py:meth:`alignData`.
+
+    For each alignment value, the first lines reaching it are searched in
+    all data arrays at once. Returns the aligned array and the next lines
+    of the readers at the end, or None if the function values are not
+    nonincreasing.
+
+    """
+    fvalues = list(i.data[:, data.idx] for i in data)
+    if any(numpy.isnan(f).any() or (f[1:] > f[:-1]).any() for f in fvalues):
+        return None
+    nbLines = numpy.array(list(len(f) for f in fvalues))
+    paddedF = -numpy.inf * numpy.ones((len(fvalues), max(nbLines)))
+    for j, f in enumerate(fvalues):
+        paddedF[j, :len(f)] = f
+    minLastF = min(f[-1] for f in fvalues) # no line reaches smaller alignment values
+
+    firstF = list(f[0] for f in fvalues)
+    idxCurrentF = numpy.ceil(numpy.log10(max(firstF) if max(firstF) > 0 else 1e-19) * data.nbPtsF)
+    currentValue = numpy.power(10, idxCurrentF / data.nbPtsF)
+    if currentValue == 0 or minLastF > currentValue:
+        raise ValueError, 'Value %g is not reached.'
+    values = []
+    idxLines = [] # index of the first line reaching each alignment value
+    while currentValue != 0 and minLastF <= currentValue:
+        idxFirst = (paddedF > currentValue).sum(axis=1)
+        isReached = idxFirst < nbLines
+        maxF = paddedF[isReached, idxFirst[isReached]].max()
+        if maxF <= 0.:
+            idxCurrentF = -numpy.inf
+            currentValue = 0.
+        else:
+            idxCurrentF = min(idxCurrentF, numpy.ceil(numpy.log10(maxF) * data.nbPtsF))
+            currentValue = numpy.power(10, idxCurrentF / data.nbPtsF)
+        values.append(currentValue)
+        idxLines.append(idxFirst)
+        idxCurrentF -= 1
+        currentValue = numpy.power(10, idxCurrentF / data.nbPtsF)
+
+    idxLines = numpy.array(idxLines)
+    columns = _dataColumns(data)
+    res = [numpy.array(values)]
+    for j, i in enumerate(data):
+        lines = i.data[numpy.minimum(idxLines[:, j], nbLines[j] - 1)][:, columns]
+        lines[idxLines[:, j] == nbLines[j]] = _finalLine(i)[columns]
+        res.append(lines)
+    # the next lines of the readers at the end
+    if currentValue != 0: # all data arrays were read to the end
+        idxNext = nbLines - 1
+    else:
+        idxNext = numpy.minimum(idxLines[-1] + 1, nbLines - 1)
+    return numpy.column_stack(res), list(i.data[j] for i, j in zip(data, idxNext))
+
+def _alignAtOnce(data):
+    """Returns the result of `_alignVertically` or `_alignHorizontally`
+    for `data` or None if `data` has to be stepped through."""
+    if not len(data) or any(i.currentLine is not None for i in data):
+        return None
+    if isinstance(data, HMultiReader):
+        return _alignHorizontally(data)
+    elif isinstance(data, VMultiReader):
+        return _alignVertically(data)
+    return None
+
 def alignData(data, isBiobjective):
     """Aligns the data from a list of data arrays.
 
@@ -313,7 +415,13 @@ def alignData(data, isBiobjective):
     #TODO: is template dependent.
 
     idxF = idxFBi if isBiobjective else idxFSingle
-    
+
+    res = _alignAtOnce(data)
+    if res is not None:
+        aligned, lastLines = res
+        return (aligned, numpy.array(list(i[idxEvals] for i in lastLines)),
+                numpy.array(list(i[idxF] for i in lastLines)))
+
     res = []
     currentValue = data.getInitialValue()
     #set_trace()
@@ -340,6 +448,10 @@ def alignArrayData(data):
 
     #TODO: is template dependent.
 
+    res = _alignAtOnce(data)
+    if res is not None:
+        return res[0]
+
     res = []
     currentValue = data.getInitialValue()
     #set_trace()
@@ -355,47 +467,174 @@ def alignArrayData(data):
     # of the data.
 
 
+def _vstack_lines(content):
+    """Stack the lines of a data set, padding lines without decision
+    variables, with 5 values, with nan.
+
+    The observers write decision variables only on some lines with the
+    observer option ``log_x: sparse`` or ``log_x: final``. Other short
+    lines are removed by `_split_lines`.
+
+    """
+    width = max(len(line) for line in content)
+    if any(len(line) != width for line in content):
+        content = [line if len(line) != 5 else
+                   numpy.hstack((line, numpy.nan * numpy.ones(width - len(line))))
+                   for line in content]
+    return numpy.vstack(content)
+
+def _split_lines(lines, fil, dim):
+    """Convert the data lines `lines` of data file `fil` token by token,
+    the reference for the block parser of `split`."""
+
+    content = []
+    # remove end-of-line sign
+    # and split into single strings
+    rows = [line.strip(b'\n').split() for line in lines]
+    width = dim + 5 if dim else max(len(data) for data in rows)
+
+    # Save values in array content. Check for nan and inf.
+    for line, data in zip(lines, rows):
+        if not data or len(data) not in (5, width):
+            warnings.warn('Incomplete line %s in  ' % (line) +
+                          'data file %s: ' % (fil))
+            continue
+        for id in xrange(len(data)):
+            if data[id] in ('Inf', 'inf'):
+                data[id] = numpy.inf
+            elif data[id] in ('-Inf', '-inf'):
+                data[id] = -numpy.inf
+            elif data[id] in ('NaN', 'nan'):
+                data[id] = numpy.nan
+            else:
+                data[id] = float(data[id])
+
+        content.append(numpy.array(data))
+    return content
+
+def _split_block(text, starts, ends, counts, complete, fil, dim):
+    """Convert the data lines of the content `text` of data file `fil`,
+    from `starts` to `ends` (excluding the end-of-line sign) with
+    `counts` tokens, into an array, or return None if no line is left.
+    Lines which are not `complete` are skipped with a warning, unless
+    `complete` is None.
+
+    All values are converted in a single call of `numpy.fromstring`,
+    which rounds like `float`.
+
+    """
+    span = text[starts[0]:ends[-1]]
+    if complete is not None and not complete.all():
+        for i in numpy.flatnonzero(~complete):
+            warnings.warn('Incomplete line %s in  ' % (text[starts[i]:ends[i] + 1]) +
+                          'data file %s: ' % (fil))
+        starts, ends, counts = starts[complete], ends[complete], counts[complete]
+        span = b'\n'.join(text[i:j] for i, j in zip(starts, ends))
+    if not len(counts):
+        return None
+    values = numpy.zeros(0)
+    total = counts.sum()
+    if total:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            try:
+                values = numpy.fromstring(span, sep=' ')
+            except ValueError:
+                pass
+    if len(values) != total: # a token unknown to fromstring, read like float does
+        return _vstack_lines(_split_lines([text[i:j + 1] for i, j in zip(starts, ends)],
+                                          fil, dim))
+    width = counts.max()
+    if (counts == width).all():
+        return values.reshape(len(counts), width)
+    # pad lines without decision variables with nan, like _vstack_lines
+    res = numpy.nan * numpy.ones((len(counts), width))
+    res[numpy.arange(width) < counts[:, numpy.newaxis]] = values
+    return res
+
 def split(dataFiles, dim=None):
-    """Split a list of data files into arrays corresponding to data sets."""
+    """Split a list of data files into arrays corresponding to data sets.
+
+    Lines without decision variables, with 5 values, are accepted and
+    padded with nan to the width of the other lines of their data set.
+    Other lines with fewer values than ``dim + 5``, or than the longest
+    line of their data set if `dim` is None, are skipped with a warning.
+
+    Each file is read at once, its lines and their numbers of values are
+    located with array operations and each data set, the lines between
+    two comment lines starting with %, is converted with a single call of
+    `numpy.fromstring`. The arrays are identical to those of converting
+    each value with `float`.
+
+    """
 
     dataSets = []
     for fil in dataFiles:
-        with open(fil, 'r') as f:
-            # This doesnt work with windows.
-            # content = numpy.loadtxt(fil, comments='%')
-            lines = f.readlines()
-
-        content = []
-
-        # Save values in array content. Check for nan and inf.
-        for line in lines:
-            # skip if comment
-            if line.startswith('%'):
-                if content:
-                    dataSets.append(numpy.vstack(content))
-                    content = []
-                continue
-
-            # else remove end-of-line sign
-            # and split into single strings
-            data = line.strip('\n').split()
-            if dim and len(data) != dim + 5:
-                warnings.warn('Incomplete line %s in  ' % (line) +
-                              'data file %s: ' % (fil))
-                continue
-            for id in xrange(len(data)):
-                if data[id] in ('Inf', 'inf'):
-                    data[id] = numpy.inf
-                elif data[id] in ('-Inf', '-inf'):
-                    data[id] = -numpy.inf
-                elif data[id] in ('NaN', 'nan'):
-                    data[id] = numpy.nan
-                else:
-                    data[id] = float(data[id])
+        with open(fil, 'rb') as f:
+            text = f.read()
+        if not text:
+            continue
+
+        # first and last character (excluding the end-of-line sign) and
+        # number of values of each line
+        chars = numpy.frombuffer(text, dtype=numpy.uint8)
+        ends = numpy.flatnonzero(chars == ord('\n'))
+        if chars[-1] != ord('\n'):
+            ends = numpy.append(ends, len(chars))
+        starts = numpy.concatenate(([0], ends[:-1] + 1))
+        isSpace = (chars == ord(' ')) | ((chars >= ord('\t')) & (chars <= ord('\r'))) # as str.split
+        isTokenStart = ~isSpace
+        isTokenStart[1:] &= isSpace[:-1]
+        tokens = numpy.flatnonzero(isTokenStart)
+        counts = numpy.searchsorted(tokens, ends) - numpy.searchsorted(tokens, starts)
+
+        # the data sets are the blocks of lines between comments
+        isComment = chars[starts] == ord('%')
+        comments = numpy.concatenate(([-1], numpy.flatnonzero(isComment), [len(starts)]))
+
+        # lines with 5 values or with dim + 5 values, or without dim with
+        # as many values as the longest line of their data set, are complete
+        if dim:
+            width = dim + 5
+        else:
+            blocks = numpy.flatnonzero(isComment) # first line of each data set
+            if not isComment[0]:
+                blocks = numpy.concatenate(([0], blocks))
+            width = numpy.maximum.reduceat(numpy.where(isComment, 0, counts), blocks)
+            width = width[numpy.cumsum(isComment) - isComment[0]]
+        complete = (counts > 0) & ((counts == 5) | (counts == width))
+        complete = None if (complete | isComment).all() else complete
+
+        for first, last in zip(comments[:-1] + 1, comments[1:]):
+            if first < last:
+                data = _split_block(text, starts[first:last], ends[first:last], counts[first:last],
+                                    complete if complete is None else complete[first:last], fil, dim)
+                if data is not None:
+                    dataSets.append(data)
+
+    return dataSets
+
+def split_binary(dataFiles):
+    """Split a list of binary data files into arrays corresponding to
+    data sets, like `split` for text data files.
 
-            content.append(numpy.array(data))
-            #Check that it always have the same length?
-        if content:
-            dataSets.append(numpy.vstack(content))
+    Binary data files, with extension :file:`bdat` and :file:`btdat`,
+    are written by the "bbob" observer with option ``format: binary``.
+    Each line is five doubles in native byte order, the first five
+    columns of a text data file, and each run starts with a line with
+    0 evaluations.
+
+    """
+    dataSets = []
+    for fil in dataFiles:
+        content = numpy.fromfile(fil, dtype=float)
+        if len(content) % 5:
+            warnings.warn('Incomplete last line in data file %s' % fil)
+            content = content[:len(content) - len(content) % 5]
+        content = content.reshape(-1, 5)
+        starts = numpy.nonzero(content[:, idxEvals] == 0)[0]
+        for start, end in zip(starts, list(starts[1:]) + [len(content)]):
+            if end > start + 1:
+                dataSets.append(content[start + 1:end])
 
     return dataSets
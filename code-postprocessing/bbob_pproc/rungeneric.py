@@ -138,6 +138,18 @@ def main(argv=None):
 
             verbose mode, prints out operations.
 
+        --jobs=JOBS
+
+            reads the data files in JOBS processes.
+
+        --no-cache
+
+            reads all data files, instead of taking the aligned data of
+            unchanged data files from the cache folder
+            :file:`~/.bbob_pproc-cache`, and does not write to the cache.
+            The cache holds one file per entry of the read :file:`.info`
+            files and can be cleared by removing this folder.
+
         -o, --output-dir=OUTPUTDIR
 
             changes the default output directory (:file:`ppdata`) to
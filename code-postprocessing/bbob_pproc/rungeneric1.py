@@ -121,6 +121,14 @@ def main(argv=None):
             expensive setting off. 
         --svg
             generate also the svg figures which are used in html files 
+        --jobs=JOBS
+            reads the data files in JOBS processes. The data are the
+            same as with the default of 1.
+        --no-cache
+            reads all data files, instead of taking the aligned data of
+            unchanged data files from the cache folder
+            :file:`~/.bbob_pproc-cache`, which can be cleared by
+            removing it.
         --runlength-based
             runlength-based f-target values, such that the
             "level of difficulty" is similar for all functions. 
@@ -238,6 +246,10 @@ def main(argv=None):
                 genericsettings.isExpensive = False
             elif o == "--svg":
                 genericsettings.generate_svg_files = True
+            elif o == "--jobs":
+                genericsettings.jobs = int(a)
+            elif o == "--no-cache":
+                genericsettings.data_cache_folder = None
             elif o == "--sca-only":
                 warnings.warn("option --sca-only will have no effect with rungeneric1.py")
             else:
@@ -289,7 +301,8 @@ def main(argv=None):
                 txt = 'Input file or folder %s could not be found.' % i
                 print txt
                 raise Usage(txt)
-        dsList = DataSetList(filelist, genericsettings.verbose)
+        dsList = DataSetList(filelist, genericsettings.verbose,
+                             workers=genericsettings.jobs)
         
         if not dsList:
             raise Usage("Nothing to do: post-processing stopped.")
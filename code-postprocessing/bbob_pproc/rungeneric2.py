@@ -126,6 +126,14 @@ def main(argv=None):
             expensive setting off. 
         --svg
             generate also the svg figures which are used in html files 
+        --jobs=JOBS
+            reads the data files in JOBS processes. The data are the
+            same as with the default of 1.
+        --no-cache
+            reads all data files, instead of taking the aligned data of
+            unchanged data files from the cache folder
+            :file:`~/.bbob_pproc-cache`, which can be cleared by
+            removing it.
 
     Exceptions raised:
 
@@ -216,6 +224,10 @@ def main(argv=None):
                 genericsettings.isExpensive = False  
             elif o == "--svg":
                 genericsettings.generate_svg_files = True
+            elif o == "--jobs":
+                genericsettings.jobs = int(a)
+            elif o == "--no-cache":
+                genericsettings.data_cache_folder = None
             elif o == "--los-only":
                 warnings.warn("option --los-only will have no effect with rungeneric2.py")
             elif o == "--crafting-effort=":
@@ -246,7 +258,8 @@ def main(argv=None):
                "data in folder %s" % outputdir)
         print "  this might take several minutes."
 
-        dsList, sortedAlgs, dictAlg = processInputArgs(args, verbose=genericsettings.verbose)
+        dsList, sortedAlgs, dictAlg = processInputArgs(args, verbose=genericsettings.verbose,
+                                                       workers=genericsettings.jobs)
 
         if 1 < 3 and len(sortedAlgs) != 2:
             raise ValueError('rungeneric2.py needs exactly two algorithms to compare, found: ' 
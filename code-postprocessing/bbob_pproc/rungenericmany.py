@@ -121,6 +121,14 @@ def main(argv=None):
             expensive setting off. 
         --svg
             generate also the svg figures which are used in html files 
+        --jobs=JOBS
+            reads the data files in JOBS processes. The data are the
+            same as with the default of 1.
+        --no-cache
+            reads all data files, instead of taking the aligned data of
+            unchanged data files from the cache folder
+            :file:`~/.bbob_pproc-cache`, which can be cleared by
+            removing it.
         -
 
     Exceptions raised:
@@ -210,6 +218,10 @@ def main(argv=None):
                 genericsettings.isExpensive = False  
             elif o == "--svg":
                 genericsettings.generate_svg_files = True
+            elif o == "--jobs":
+                genericsettings.jobs = int(a)
+            elif o == "--no-cache":
+                genericsettings.data_cache_folder = None
             elif o == "--sca-only":
                 warnings.warn("option --sca-only will have no effect with rungenericmany.py")
             elif o == "--los-only":
@@ -273,7 +285,8 @@ def main(argv=None):
                     'bbob_proc_commands.tex truncated, consider removing the file before the text run'
                     )
 
-        dsList, sortedAlgs, dictAlg = processInputArgs(args, verbose=genericsettings.verbose)
+        dsList, sortedAlgs, dictAlg = processInputArgs(args, verbose=genericsettings.verbose,
+                                                       workers=genericsettings.jobs)
 
         if not dsList:
             sys.exit()
@@ -177,6 +177,16 @@ def leak_check():
                     './test_biobj', 'leak_check']
     run('code-experiments/test/integration-test', valgrind_cmd)
     
+def bench_python(args=()):
+    """ Builds and installs the Python module `cocoex` and runs the
+    evaluation throughput benchmark `cocoex.bench` with arguments `args`. """
+    build_python()
+    try:
+        run(os.path.join('code-experiments', 'build', 'python'),
+            ['python', '-m', 'cocoex.bench'] + list(args))
+    except subprocess.CalledProcessError:
+        sys.exit(-1)
+
 ################################################################################
 ## Python 2
 def install_postprocessing():
@@ -576,6 +586,9 @@ Available commands for developers:
 
   run-sandbox-python   - Run a Python script with installed COCO module
                          Takes a single argument (name of Python script file)
+
+  bench-python         - Build Python module and measure its evaluation
+                         throughput, arguments are passed to cocoex.bench
   
   test-c               - Build and run unit tests, integration tests 
                          and an example experiment test in C 
@@ -627,6 +640,7 @@ def main(args):
     elif cmd == 'test-python3': test_python3()
     elif cmd == 'test-postprocessing': test_postprocessing()
     elif cmd == 'leak-check': leak_check()
+    elif cmd == 'bench-python': bench_python(args[1:])
     else: help()
 
 if __name__ == '__main__':